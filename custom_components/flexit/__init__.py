@@ -1,19 +1,30 @@
 """The flexit component."""
 
+from typing import Any, Dict
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import FlexitApiClient
 from .const import (
     CONF_INTERVAL,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
     CONF_PLANT,
+    CONF_PLANTS,
     DEFAULT_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
     DOMAIN as FLEXIT_DOMAIN,
+    LOGGER,
     PLATFORMS,
 )
 from .coordinator import FlexitDataUpdateCoordinator
+from .store import FlexitStore
+from .throttle import async_get_throttle
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -29,32 +40,123 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             },
         )
 
+    plant_ids = entry.data[CONF_PLANTS]
+
     api = FlexitApiClient(
         session=async_get_clientsession(hass),
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
-        plant_id=entry.data[CONF_PLANT],
+        plant_id=plant_ids[0],
+        throttle=async_get_throttle(hass),
+    )
+    store = FlexitStore(hass, entry.entry_id)
+    await store.async_load()
+
+    api.token_manager.restore(store.token)
+    api.token_manager.on_refresh = store.async_save_token
+
+    restored = all(
+        plant_id in store.device_info and plant_id in store.sensor_data
+        for plant_id in plant_ids
     )
+
     coordinator = FlexitDataUpdateCoordinator(
         hass,
         name=entry.data[CONF_NAME],
         api=api,
-        device_info=await api.device_info(),
+        plant_ids=plant_ids,
+        device_info=(
+            store.device_info if restored else await api.device_info_many(plant_ids)
+        ),
         update_interval=entry.options.get(CONF_INTERVAL, DEFAULT_INTERVAL),
+        store=store,
+        min_update_interval=entry.options.get(
+            CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL
+        ),
+        max_update_interval=entry.options.get(
+            CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL
+        ),
     )
 
-    await coordinator.async_config_entry_first_refresh()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
+        store.async_save_device_info(coordinator.device_info)
+    else:
+        # Come up from the last known state and revalidate in the background
+        coordinator.data = {
+            plant_id: store.sensor_data[plant_id] for plant_id in plant_ids
+        }
 
     hass.data[FLEXIT_DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_revalidate(), f"{FLEXIT_DOMAIN} revalidate"
+        )
+
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate entry of a single plant to an entry of the account."""
+
+    if entry.version == 1 and CONF_PLANT in entry.data:
+        plant_id = entry.data[CONF_PLANT]
+        others = [
+            other
+            for other in hass.config_entries.async_entries(FLEXIT_DOMAIN)
+            if other.entry_id != entry.entry_id
+        ]
+        if any(plant_id in other.data.get(CONF_PLANTS, ()) for other in others):
+            LOGGER.error(
+                "Plant %s of %s is also managed by another entry, remove one of them",
+                plant_id,
+                entry.title,
+            )
+            return False
+
+        @callback
+        def migrate_unique_id(entity_entry: er.RegistryEntry) -> Dict[str, Any]:
+            """Prefix unique id of entity with its plant."""
+            return {"new_unique_id": f"{plant_id}_{entity_entry.unique_id}"}
+
+        await er.async_migrate_entries(hass, entry.entry_id, migrate_unique_id)
+
+        device_registry = dr.async_get(hass)
+        if device := device_registry.async_get_device(
+            identifiers={(FLEXIT_DOMAIN, entry.data[CONF_NAME])}
+        ):
+            device_registry.async_update_device(
+                device.id, new_identifiers={(FLEXIT_DOMAIN, plant_id)}
+            )
+
+        # Other entries of the account keep their plant as unique id
+        unique_id = entry.data[CONF_USERNAME].lower()
+        if any(other.unique_id == unique_id for other in others):
+            unique_id = entry.unique_id
+
+        data = {key: value for key, value in entry.data.items() if key != CONF_PLANT}
+        hass.config_entries.async_update_entry(
+            entry,
+            data={**data, CONF_PLANTS: [plant_id]},
+            unique_id=unique_id,
+            version=2,
+        )
+    elif entry.version == 1:
+        hass.config_entries.async_update_entry(entry, version=2)
+
+    LOGGER.debug("Migrated %s to version %s", entry.title, entry.version)
     return True
 
 
 async def async_unload_entry(hass, entry):
     """Unload entry."""
 
+    await hass.data[FLEXIT_DOMAIN][entry.entry_id].writes.async_flush()
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
@@ -63,7 +165,11 @@ async def async_unload_entry(hass, entry):
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove stored data when entry is removed."""
+    await FlexitStore(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    await hass.config_entries.async_reload(entry.entry_id)
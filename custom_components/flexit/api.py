@@ -1,8 +1,8 @@
 """Asynchronous Python client for Flexit."""
 
-from datetime import date, timedelta
-import json
-from typing import Any, Dict, List
+import copy
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
 
 import socket
 import asyncio
@@ -11,34 +11,46 @@ import aiohttp
 import async_timeout
 from aiohttp.client import ClientSession
 
+from .auth import FlexitTokenManager
+from .codec import JsonCodec, default_codec
 from .const import (
     ACKNOWLEDGE_FILTER_ALARM_CODE_PATH,
     API_HEADERS,
+    API_URL,
     AWAY_AIR_TEMPERATURE_PATH,
     AWAY_DELAY_PATH,
     BOOST_DURATION_PATH,
     CALENDAR_TEMPORARY_OVERRIDE_PATH,
-    DATAPOINTS_PATH,
+    DATAPOINTS_ENDPOINT,
     DEVICE_INFO_PATH_LIST,
     FILTER_OPERATING_TIME_PATH,
+    FILTER_ENDPOINT,
     FIREPLACE_DURATION_PATH,
     HEATER_PATH,
-    FILTER_PATH,
     HOME_AIR_TEMPERATURE_PATH,
     LOGGER,
-    MODE_AWAY,
-    MODE_AWAY_DELAYED,
-    MODE_AWAY_PUT_PATH,
-    MODE_FIREPLACE,
-    MODE_FIREPLACE_PUT_PATH,
-    MODE_FORCED_VENTILATION,
-    MODE_HIGH,
-    MODE_HIGH_TEMP_PUT_PATH,
-    MODE_HOME,
+    MAX_CONCURRENT_WRITES,
+    MODE_DATAPOINTS,
     MODE_HOME_HIGH_CAL_PUT_PATH,
-    PLANTS_PATH,
+    PLANTS_ENDPOINT,
     SENSOR_DATA_PATH_LIST,
-    TOKEN_PATH,
+    TOGGLE_PUT_PATHS,
+    TOKEN_ENDPOINT,
+)
+from .history import RequestHistory
+from .metrics import (
+    AUTH_REFRESHES,
+    AUTH_REJECTIONS,
+    BYTES_RECEIVED,
+    BYTES_SENT,
+    DECODE_TIME,
+    DURATION_BUCKETS,
+    REQUEST_ERRORS,
+    REQUEST_LATENCY,
+    REQUESTS,
+    RETRIES,
+    MetricsRegistry,
+    endpoint,
 )
 from .models import (
     FlexitDeviceInfo,
@@ -47,13 +59,80 @@ from .models import (
     FlexitSensorsResponse,
     FlexitSensorsResponseStatus,
     FlexitToken,
+    SensorDecoder,
+    VALUES,
+    compile_sensor_decoder,
 )
+from .plan import FetchPlan
+from .retry import CircuitBreaker, RetryPolicy
+from .throttle import RequestThrottle, parse_retry_after
 
 
 class ApiClientException(Exception):
     """Api Client Exception."""
 
 
+class ApiAuthenticationException(ApiClientException):
+    """Api Authentication Exception."""
+
+
+class ApiTransientException(ApiClientException):
+    """Api Exception that may succeed when retried."""
+
+    def __init__(self, message: str, sent: bool = True) -> None:
+        """Initialize."""
+        super().__init__(message)
+        self.sent = sent
+
+
+class ApiRateLimitedException(ApiTransientException):
+    """Api Exception raised when the API asks us to slow down."""
+
+    def __init__(
+        self,
+        message: str,
+        retry_after: float or None = None,
+        sent: bool = True,
+        responded: bool = True,
+    ) -> None:
+        """Initialize."""
+        super().__init__(message, sent=sent)
+        self.retry_after = retry_after
+        self.responded = responded
+
+
+class ApiCircuitOpenException(ApiClientException):
+    """Api Exception raised while requests are paused after repeated failures."""
+
+
+class RequestCoalescer:
+    """Share one pending response between identical concurrent requests."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    async def async_run(
+        self, key: str, request: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Run request, or join an identical request already in flight."""
+
+        future = self._inflight.get(key)
+        if future is None:
+            self.misses += 1
+            future = asyncio.ensure_future(request())
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.hits += 1
+
+        # Shield so one cancelled caller does not cancel the shared request
+        return await asyncio.shield(future)
+
+
 class FlexitApiClient:
     """Main class for handling connections with a Flexit unit."""
 
@@ -63,22 +142,42 @@ class FlexitApiClient:
         username: str,
         password: str,
         plant_id: str or None = None,
+        retry_policy: RetryPolicy or None = None,
+        throttle: RequestThrottle or None = None,
+        codec: JsonCodec or None = None,
+        api_url: str = API_URL,
     ) -> None:
         """Initialize connection with the Flexit."""
         self._session = session
+        self._api_url = api_url
         self._username = username
         self._password = password
         self._plant_id = plant_id
 
-        self.token: str or None = None
-        self.token_refreshdate: date = date.today()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = CircuitBreaker()
+        self.throttle = throttle or RequestThrottle()
+        self.codec = codec or default_codec()
+        self.metrics = MetricsRegistry()
+        self.history = RequestHistory()
+        self._fetch_plans: Dict[
+            Tuple[Tuple[str, ...], Tuple[str, ...]], List[FetchPlan]
+        ] = {}
+        self._sensor_decoders: Dict[str, SensorDecoder] = {}
+
+        self.token_manager = FlexitTokenManager(self._fetch_token)
+        self.coalescer = RequestCoalescer()
+        self._write_semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
+
+    @property
+    def token(self) -> str or None:
+        """Return current access token."""
+        return self.token_manager.access_token
 
     async def get(self, url: str) -> Any:
-        """Get request."""
-        return await self.api_wrapper(
-            method="GET",
-            url=url,
-            headers=self.headers_with_token(),
+        """Get request, shared with identical requests already in flight."""
+        return await self.coalescer.async_run(
+            url, lambda: self.authorized_request(method="GET", url=url)
         )
 
     async def put(self, path: str, body: Any) -> Any:
@@ -87,100 +186,413 @@ class FlexitApiClient:
         null = None
         data_body = null if body is None else str(body)
 
-        return await self.api_wrapper(
+        return await self.authorized_request(
             method="PUT",
             url=self.escaped_datapoints_url(self.path(path)),
-            data=json.dumps({"Value": data_body}),
-            headers=self.headers_with_token(),
+            data=self.codec.dumps({"Value": data_body}),
+            idempotent=path not in TOGGLE_PUT_PATHS,
         )
 
+    async def authorized_request(
+        self,
+        method: str,
+        url: str,
+        data: Any = None,
+        idempotent: bool = True,
+    ) -> dict[str, Any] or None:
+        """Make request with token, re-authenticating once if it is rejected."""
+
+        token = await self.token_manager.async_get_token()
+        try:
+            return await self.api_wrapper(
+                method=method,
+                url=url,
+                data=data,
+                headers=self.headers_with_token(),
+                idempotent=idempotent,
+            )
+        except ApiAuthenticationException:
+            LOGGER.debug("Token rejected, re-authenticating")
+            self.metrics.increment(AUTH_REJECTIONS)
+            self.token_manager.invalidate(token)
+            await self.token_manager.async_get_token()
+            return await self.api_wrapper(
+                method=method,
+                url=url,
+                data=data,
+                headers=self.headers_with_token(),
+                idempotent=idempotent,
+            )
+
     async def api_wrapper(
         self,
         method: str,
         url: str,
         data: dict[str, Any] = None,
         headers: dict = None,
+        idempotent: bool = True,
     ) -> dict[str, Any] or None:
-        """Wrap request."""
-
-        # LOGGER.debug(
-        #     "%s-request to url=%s. data=%s. headers=%s", method, url, data, headers
-        # )
+        """Wrap request, retrying transient errors according to retry policy."""
 
+        attempt = 0
+        trial = False
+        try:
+            while True:
+                if attempt == 0:
+                    allowed = self.circuit_breaker.allow_request()
+                    trial = self.circuit_breaker.state == CircuitBreaker.HALF_OPEN
+                else:
+                    allowed = self.circuit_breaker.allow_retry(trial)
+                if not allowed:
+                    raise ApiCircuitOpenException(
+                        f"Skipping request to {url}, API unavailable. "
+                        f"Retrying in {self.circuit_breaker.retry_in:.0f} seconds"
+                    )
+
+                try:
+                    result = await self._request(method, url, data, headers)
+                except ApiAuthenticationException as exception:
+                    self.history.record_error(method, url, exception)
+                    # A rejected token still shows the API is up
+                    self.circuit_breaker.record_success()
+                    raise
+                except ApiTransientException as exception:
+                    self.history.record_error(method, url, exception)
+                    attempt += 1
+                    rate_limited = isinstance(exception, ApiRateLimitedException)
+                    delay = self.retry_policy.delay(attempt - 1)
+                    if rate_limited:
+                        delay = max(delay, exception.retry_after or 0)
+
+                    # Writes that are not idempotent are only retried if never sent
+                    if (
+                        attempt >= self.retry_policy.attempts
+                        or not (idempotent or not exception.sent)
+                        or delay > self.retry_policy.max_delay
+                    ):
+                        # Being throttled does not mean the API is down
+                        if not rate_limited:
+                            self.circuit_breaker.record_failure()
+                        elif exception.responded:
+                            self.circuit_breaker.record_success()
+                        raise
+                    LOGGER.debug(
+                        "%s-request to %s failed (%s), retrying in %.1f seconds",
+                        method,
+                        url,
+                        exception,
+                        delay,
+                    )
+                    self.metrics.increment(RETRIES)
+                    await asyncio.sleep(delay)
+                except ApiClientException as exception:
+                    self.history.record_error(method, url, exception)
+                    raise
+                else:
+                    self.circuit_breaker.record_success()
+                    return result
+        finally:
+            # A trial ended without an answer, as by being cancelled, is let
+            # through again later
+            if trial:
+                self.circuit_breaker.record_aborted()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        data: dict[str, Any] = None,
+        headers: dict = None,
+    ) -> dict[str, Any] or None:
+        """Make a single request."""
+
+        if self.throttle.paused_for > self.retry_policy.max_delay:
+            raise ApiRateLimitedException(
+                f"Skipping request to {url}, rate limited by API",
+                retry_after=self.throttle.paused_for,
+                sent=False,
+                responded=False,
+            )
+        await self.throttle.async_acquire()
+
+        LOGGER.debug("%s-request to url=%s", method, url)
+
+        name = endpoint(method, url)
+        self.metrics.increment(f"{REQUESTS}.{name}")
+        started = time.perf_counter()
+        received = False
         try:
-            async with async_timeout.timeout(20):
-                response = await self._session.request(
+            async with async_timeout.timeout(self.retry_policy.timeout):
+                # The response is released on every way out of the block
+                async with self._session.request(
                     method=method,
                     url=url,
                     headers=headers,
                     data=data,
-                )
-                return await response.json()
+                ) as response:
+                    if response.status == 401:
+                        raise ApiAuthenticationException(
+                            f"Authentication rejected by {url}"
+                        )
+                    if response.status in (429, 503):
+                        retry_after = parse_retry_after(
+                            response.headers.get("Retry-After")
+                        )
+                        # A 503 without Retry-After is an outage, not rate limiting
+                        if response.status == 429 or retry_after is not None:
+                            self.throttle.pause(
+                                self.retry_policy.base_delay
+                                if retry_after is None
+                                else retry_after
+                            )
+                            raise ApiRateLimitedException(
+                                f"Rate limited ({response.status}) by {url}",
+                                retry_after=retry_after,
+                                sent=response.status != 429,
+                            )
+                    if response.status >= 500:
+                        raise ApiTransientException(
+                            f"Server error {response.status} from {url}"
+                        )
+                    self.throttle.record_success()
+                    body = await response.read()
+                    received = True
         except asyncio.TimeoutError as exception:
-            raise ApiClientException(
+            raise ApiTransientException(
                 f"Timeout error fetching information from {url}"
             ) from exception
-        except (KeyError, TypeError) as exception:
-            raise ApiClientException(
-                f"Error parsing information from {url} - {exception}"
+        except (aiohttp.ClientConnectorError, socket.gaierror) as exception:
+            raise ApiTransientException(
+                f"Error connecting to {url} - {exception}", sent=False
             ) from exception
-        except (aiohttp.ClientError, socket.gaierror) as exception:
+        except aiohttp.ClientConnectionError as exception:
+            raise ApiTransientException(
+                f"Error fetching information from {url} - {exception}"
+            ) from exception
+        except aiohttp.ClientError as exception:
             raise ApiClientException(
                 f"Error fetching information from {url} - {exception}"
             ) from exception
+        except ApiClientException:
+            raise
         except Exception as exception:  # pylint: disable=broad-except
             raise ApiClientException(exception) from exception
+        finally:
+            latency = time.perf_counter() - started
+            self.metrics.observe(f"{REQUEST_LATENCY}.{name}", latency)
+            if not received:
+                self.metrics.increment(f"{REQUEST_ERRORS}.{name}")
+
+        result = self._decode(url, data, body)
+        self.history.record_response(
+            method, url, response.status, latency, len(body), result
+        )
+        return result
 
-    async def auth(self) -> bool:
-        """Set token."""
-        if self.token_refreshdate == date.today():
-            self.token = FlexitToken.from_dict(
-                await self.api_wrapper(
-                    method="POST",
-                    url=TOKEN_PATH,
-                    headers=API_HEADERS,
-                    data=f"grant_type=password&username={self._username}&password={self._password}",
-                )
-            ).access_token
-            self.token_refreshdate = date.today() + timedelta(days=1)
+    def _decode(self, url: str, data: Any, body: bytes) -> Any:
+        """Decode response body, recording payload sizes and decode time."""
+
+        started = time.perf_counter()
+        try:
+            result = self.codec.loads(body) if body else None
+        except ValueError as exception:
+            raise ApiClientException(
+                f"Error parsing information from {url} - {exception}"
+            ) from exception
 
+        self.metrics.observe(
+            DECODE_TIME, time.perf_counter() - started, DURATION_BUCKETS
+        )
+        self.metrics.increment(BYTES_SENT, len(data) if data else 0)
+        self.metrics.increment(BYTES_RECEIVED, len(body))
+        return result
+
+    async def auth(self) -> bool:
+        """Make sure a valid token is set."""
+        await self.token_manager.async_get_token()
         return True
 
+    async def _fetch_token(self) -> FlexitToken:
+        """Fetch new token."""
+
+        self.metrics.increment(AUTH_REFRESHES)
+        return FlexitToken.from_dict(
+            await self.api_wrapper(
+                method="POST",
+                url=f"{self._api_url}{TOKEN_ENDPOINT}",
+                headers=API_HEADERS,
+                data=f"grant_type=password&username={self._username}&password={self._password}",
+            )
+        )
+
     async def find_plants(self) -> List[FlexitPlantItem]:
         """Find plants."""
-        await self.auth()
-        return FlexitPlants.from_dict(await self.get(PLANTS_PATH)).items
+        return FlexitPlants.from_dict(
+            await self.get(f"{self._api_url}{PLANTS_ENDPOINT}")
+        ).items
 
     async def sensor_data(self) -> FlexitSensorsResponse:
         """Fetch data."""
         assert self._plant_id is not None
-        await self.auth()
         return FlexitSensorsResponse.from_dict(
             self._plant_id,
-            await self.get(
-                self.escaped_filter_url(
-                    self.create_url_from_paths(SENSOR_DATA_PATH_LIST)
-                )
-            ),
+            await self.get(self.fetch_plan(SENSOR_DATA_PATH_LIST).url),
+            self.sensor_decoder(self._plant_id),
         )
 
     async def device_info(self) -> FlexitDeviceInfo:
         """Fetch device info."""
         assert self._plant_id is not None
-        await self.auth()
         return FlexitDeviceInfo.from_dict(
             self._plant_id,
-            await self.get(
-                self.escaped_filter_url(
-                    self.create_url_from_paths(DEVICE_INFO_PATH_LIST)
-                )
+            await self.get(self.fetch_plan(DEVICE_INFO_PATH_LIST).url),
+        )
+
+    async def sensor_data_many(
+        self, plant_ids: List[str]
+    ) -> Dict[str, FlexitSensorsResponse]:
+        """Fetch data for plants, combined in as few requests as possible."""
+        return self.decode_sensor_data(
+            plant_ids, await self.values(plant_ids, SENSOR_DATA_PATH_LIST)
+        )
+
+    async def device_info_many(
+        self, plant_ids: List[str]
+    ) -> Dict[str, FlexitDeviceInfo]:
+        """Fetch device info for plants, combined in as few requests as possible."""
+        return self._decode_many(
+            FlexitDeviceInfo.from_dict,
+            plant_ids,
+            await self.values(plant_ids, DEVICE_INFO_PATH_LIST),
+        )
+
+    async def values(self, plant_ids: List[str], paths: List[str]) -> Dict[str, Any]:
+        """Fetch paths for plants and merge the responses into one."""
+
+        responses = await asyncio.gather(
+            *(self.get(plan.url) for plan in self.fetch_plans(plant_ids, paths))
+        )
+        return {
+            VALUES: {
+                key: value
+                for response in responses
+                for key, value in response[VALUES].items()
+            }
+        }
+
+    def decode_sensor_data(
+        self, plant_ids: List[str], data: Dict[str, Any]
+    ) -> Dict[str, FlexitSensorsResponse]:
+        """Decode sensor data of plants from values fetched earlier."""
+        return self._decode_many(
+            lambda plant_id, data: FlexitSensorsResponse.from_dict(
+                plant_id, data, self.sensor_decoder(plant_id)
             ),
+            plant_ids,
+            data,
         )
 
+    def sensor_decoder(self, plant_id: str) -> SensorDecoder:
+        """Return sensor decoder of plant, compiled the first time used."""
+
+        if (decoder := self._sensor_decoders.get(plant_id)) is None:
+            decoder = self._sensor_decoders[plant_id] = compile_sensor_decoder(
+                plant_id
+            )
+        return decoder
+
+    @staticmethod
+    def _decode_many(
+        from_dict: Callable[[str, Dict[str, Any]], Any],
+        plant_ids: List[str],
+        data: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Decode combined response per plant, skipping plants missing from it."""
+
+        decoded: Dict[str, Any] = {}
+        for plant_id in plant_ids:
+            try:
+                decoded[plant_id] = from_dict(plant_id, data)
+            except (KeyError, TypeError, ValueError) as exception:
+                LOGGER.warning("Missing data for plant %s: %s", plant_id, exception)
+        return decoded
+
+    def for_plant(self, plant_id: str) -> "FlexitApiClient":
+        """Return client for plant, sharing token, throttle and state with this one."""
+
+        client = copy.copy(self)
+        client._plant_id = plant_id
+        return client
+
     async def update(self, path: str, value: Any) -> bool:
         """Update path with value."""
         return await self.is_success(await self.put(path, value), self.path(path))
 
+    async def update_many(
+        self,
+        values: Dict[str, Any],
+        order: Sequence[Tuple[str, str]] = (),
+    ) -> Dict[str, bool]:
+        """Update paths with values, concurrently where order allows.
+
+        order holds (before, after) pairs of paths. A write is only sent once
+        every write it depends on has succeeded.
+        """
+
+        results: Dict[str, bool] = {}
+        for stage in self.write_stages(list(values), order):
+            stage = [
+                path
+                for path in stage
+                if all(results[before] for before, after in order if after == path)
+            ]
+            results.update(
+                zip(
+                    stage,
+                    await asyncio.gather(
+                        *(self._bounded_update(path, values[path]) for path in stage)
+                    ),
+                )
+            )
+
+        return {path: results.get(path, False) for path in values}
+
+    async def _bounded_update(self, path: str, value: Any) -> bool:
+        """Update path, limited by the write semaphore."""
+
+        async with self._write_semaphore:
+            try:
+                return await self.update(path, value)
+            except ApiClientException as exception:
+                LOGGER.error("Failed to update %s: %s", path, exception)
+                return False
+
+    @staticmethod
+    def write_stages(
+        paths: List[str], order: Sequence[Tuple[str, str]]
+    ) -> List[List[str]]:
+        """Group paths into stages that can be written concurrently."""
+
+        if unknown := {path for pair in order for path in pair if path not in paths}:
+            raise ValueError(f"Write order names paths not written: {unknown}")
+
+        remaining = list(paths)
+        stages: List[List[str]] = []
+        while remaining:
+            stage = [
+                path
+                for path in remaining
+                if not any(
+                    after == path and before in remaining for before, after in order
+                )
+            ]
+            if not stage:
+                raise ValueError(f"Circular write order between {remaining}")
+            stages.append(stage)
+            remaining = [path for path in remaining if path not in stage]
+
+        return stages
+
     async def set_home_temp(self, temp) -> bool:
         """Set home temp."""
         return await self.update(HOME_AIR_TEMPERATURE_PATH, temp)
@@ -192,19 +604,14 @@ class FlexitApiClient:
     async def set_mode(self, mode: str) -> bool:
         """Set ventilation mode."""
 
-        if mode == MODE_AWAY:
-            return await self.update(MODE_AWAY_PUT_PATH, 0)
-        if mode == MODE_AWAY_DELAYED:
-            return await self.update(MODE_AWAY_PUT_PATH, 1)
-        if mode == MODE_HOME:
-            return await self.update(MODE_HOME_HIGH_CAL_PUT_PATH, 3)
-        if mode == MODE_HIGH:
-            return await self.update(MODE_HOME_HIGH_CAL_PUT_PATH, 4)
-        if mode == MODE_FORCED_VENTILATION:
-            return await self.update(MODE_HIGH_TEMP_PUT_PATH, 2)
-        if mode == MODE_FIREPLACE:
-            return await self.update(MODE_FIREPLACE_PUT_PATH, 2)
-        return
+        if (datapoint := self.mode_datapoint(mode)) is None:
+            return
+        return await self.update(*datapoint)
+
+    @staticmethod
+    def mode_datapoint(mode: str) -> Optional[Tuple[str, Any]]:
+        """Return path and value to write for mode."""
+        return MODE_DATAPOINTS.get(mode)
 
     async def set_fireplace_duration(self, duration) -> bool:
         """Set fireplace duration."""
@@ -233,11 +640,15 @@ class FlexitApiClient:
 
     async def reset_dirty_filter(self, value) -> bool:
         """Reset dirty filter."""
-        # Reset filter operating time
-        reset_operating_time_success = await self.update(FILTER_OPERATING_TIME_PATH, 0)
-        # Acknowledge alarm
-        ack_alarm_success = await self.acknowledge_alarm(ACKNOWLEDGE_FILTER_ALARM_CODE_PATH)
-        return reset_operating_time_success and ack_alarm_success
+        # Reset filter operating time before acknowledging the alarm
+        results = await self.update_many(
+            {
+                FILTER_OPERATING_TIME_PATH: 0,
+                ACKNOWLEDGE_FILTER_ALARM_CODE_PATH: 2,
+            },
+            order=[(FILTER_OPERATING_TIME_PATH, ACKNOWLEDGE_FILTER_ALARM_CODE_PATH)],
+        )
+        return all(results.values())
 
     async def acknowledge_alarm(self, path: str) -> bool:
         """Acknowledge alarm at path."""
@@ -254,6 +665,22 @@ class FlexitApiClient:
         assert self._plant_id is not None
         return f"{self._plant_id}{path}"
 
+    def fetch_plan(self, paths: List[str]) -> FetchPlan:
+        """Return fetch plan for paths of this plant."""
+
+        assert self._plant_id is not None
+        return self.fetch_plans([self._plant_id], paths)[0]
+
+    def fetch_plans(self, plant_ids: List[str], paths: List[str]) -> List[FetchPlan]:
+        """Return fetch plans for plants and paths, compiled the first time used."""
+
+        key = (tuple(plant_ids), tuple(paths))
+        if (plans := self._fetch_plans.get(key)) is None:
+            plans = self._fetch_plans[key] = FetchPlan.compile_many(
+                plant_ids, paths, f"{self._api_url}{FILTER_ENDPOINT}"
+            )
+        return plans
+
     def create_url_from_paths(self, paths: List[str]) -> str:
         """Create path from PATH_LIST."""
         url = "["
@@ -263,11 +690,11 @@ class FlexitApiClient:
 
     def escaped_filter_url(self, path: str) -> str:
         """Util for adding FILTER_PATH."""
-        return f"{FILTER_PATH}{urllib.parse.quote(path)}"
+        return f"{self._api_url}{FILTER_ENDPOINT}{urllib.parse.quote(path)}"
 
     def escaped_datapoints_url(self, path: str) -> str:
         """Util for adding DATAPOINTS_PATH."""
-        return f"{DATAPOINTS_PATH}/{urllib.parse.quote(path)}"
+        return f"{self._api_url}{DATAPOINTS_ENDPOINT}/{urllib.parse.quote(path)}"
 
     def headers_with_token(self) -> Dict[str, str]:
         """Get headers with token added."""
@@ -0,0 +1,92 @@
+"""Token handling for the Flexit client."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .const import LOGGER
+from .models import FlexitToken
+
+# Refresh this many seconds before the token actually expires
+TOKEN_REFRESH_MARGIN = 300
+
+ACCESS_TOKEN = "access_token"
+EXPIRES_AT = "expires_at"
+
+
+class FlexitTokenManager:
+    """Keep an access token valid, refreshing it at most once at a time."""
+
+    def __init__(
+        self,
+        fetch_token: Callable[[], Awaitable[FlexitToken]],
+        refresh_margin: float = TOKEN_REFRESH_MARGIN,
+        on_refresh: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        """Initialize."""
+
+        self._fetch_token = fetch_token
+        self._refresh_margin = refresh_margin
+        self._lock = asyncio.Lock()
+
+        self.on_refresh = on_refresh
+        self.access_token: Optional[str] = None
+        self.expires_at: float = 0.0
+        self.refresh_count: int = 0
+
+    @property
+    def valid(self) -> bool:
+        """Return true if the token can be used without refreshing."""
+        return (
+            self.access_token is not None
+            and time.time() < self.expires_at - self._refresh_margin
+        )
+
+    async def async_get_token(self) -> str:
+        """Return a valid token, refreshing it if needed."""
+
+        if self.valid:
+            return self.access_token
+
+        async with self._lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not self.valid:
+                await self._async_refresh()
+
+        return self.access_token
+
+    def invalidate(self, access_token: Optional[str]) -> None:
+        """Invalidate token if it is still the one in use."""
+
+        if access_token == self.access_token:
+            self.expires_at = 0.0
+
+    def restore(self, data: Optional[Dict[str, Any]]) -> None:
+        """Restore a persisted token."""
+
+        if not data:
+            return
+
+        self.access_token = data[ACCESS_TOKEN]
+        self.expires_at = float(data[EXPIRES_AT])
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return token in a persistable form."""
+        return {ACCESS_TOKEN: self.access_token, EXPIRES_AT: self.expires_at}
+
+    async def _async_refresh(self) -> None:
+        """Fetch a new token."""
+
+        requested_at = time.time()
+        token = await self._fetch_token()
+
+        self.access_token = token.access_token
+        self.expires_at = requested_at + token.expires_in
+        self.refresh_count += 1
+
+        LOGGER.debug("Refreshed token, expires in %s seconds", token.expires_in)
+
+        if self.on_refresh is not None:
+            self.on_refresh(self.as_dict())
@@ -9,10 +9,9 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     ATTR_ALARM_CODE_A,
@@ -26,6 +25,7 @@ from .const import (
     DOMAIN as FLEXIT_DOMAIN,
 )
 from .coordinator import FlexitDataUpdateCoordinator
+from .entity import FlexitEntity
 from .models import Entity
 
 ALARM_BINARY_SENSORS: Tuple[BinarySensorEntityDescription, ...] = (
@@ -52,49 +52,38 @@ async def async_setup_entry(
     """Set up the Flexit sensor."""
     coordinator: FlexitDataUpdateCoordinator = hass.data[FLEXIT_DOMAIN][entry.entry_id]
     async_add_entities(
-        FlexitFilterBinarySensor(coordinator, description)
+        FlexitFilterBinarySensor(coordinator, description, plant_id)
+        for plant_id in coordinator.plant_ids
         for description in FILTER_BINARY_SENSORS
     )
     async_add_entities(
-        FlexitAlarmBinarySensor(coordinator, description)
+        FlexitAlarmBinarySensor(coordinator, description, plant_id)
+        for plant_id in coordinator.plant_ids
         for description in ALARM_BINARY_SENSORS
     )
 
 
-class FlexitBinarySensor(CoordinatorEntity, BinarySensorEntity):
+class FlexitBinarySensor(FlexitEntity, BinarySensorEntity):
     """Representation of a Flexit binary sensor."""
 
-    coordinator: FlexitDataUpdateCoordinator
     sensor_data: Any
 
     def __init__(
         self,
         coordinator: FlexitDataUpdateCoordinator,
         description: BinarySensorEntityDescription,
+        plant_id: str,
     ) -> None:
         """Initialize a Flexit binary sensor."""
 
-        super().__init__(coordinator)
-
-        self.entity_description = description
-        self.coordinator = coordinator
-        self._attr_unique_id = f"{description.key}"
-        self._attr_device_info = coordinator._attr_device_info
-        self.update_from_data()
+        super().__init__(coordinator, description, plant_id)
 
     def update_from_data(self) -> None:
         """Update attributes from data."""
-        self.sensor_data = self.coordinator.data.__getattribute__(
+        self.sensor_data = self.data.__getattribute__(
             self.entity_description.key
         )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
-
-        self.update_from_data()
-        super()._handle_coordinator_update()
-
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
@@ -104,6 +93,14 @@ class FlexitBinarySensor(CoordinatorEntity, BinarySensorEntity):
 class FlexitFilterBinarySensor(FlexitBinarySensor):
     """Binary sensor for filter."""
 
+    data_fields = frozenset(
+        (
+            Entity.DIRTY_FILTER.value,
+            "filter_operating_time",
+            "filter_time_for_exchange",
+        )
+    )
+
     @property
     def icon(self):
         """Return the icon to use in the frontend."""
@@ -113,8 +110,8 @@ class FlexitFilterBinarySensor(FlexitBinarySensor):
     def extra_state_attributes(self):
         """Return the state attributes."""
 
-        operating_time = self.coordinator.data.filter_operating_time
-        exchange_time = self.coordinator.data.filter_time_for_exchange
+        operating_time = self.data.filter_operating_time
+        exchange_time = self.data.filter_time_for_exchange
         operating_time_days = math.floor(operating_time / 24)
         exchange_time_days = math.floor(exchange_time / 24)
 
@@ -131,6 +128,8 @@ class FlexitFilterBinarySensor(FlexitBinarySensor):
 class FlexitAlarmBinarySensor(FlexitBinarySensor):
     """Binary sensor for alarm."""
 
+    data_fields = frozenset((Entity.ALARM_CODE_A.value, Entity.ALARM_CODE_B.value))
+
     @property
     def is_on(self) -> bool:
         """Return true if the binary sensor is on."""
@@ -160,10 +159,10 @@ class FlexitAlarmBinarySensor(FlexitBinarySensor):
         """Update attributes based on new data."""
 
         self.sensor_data = {
-            "alarm_code_a": self.coordinator.data.__getattribute__(
+            "alarm_code_a": self.data.__getattribute__(
                 Entity.ALARM_CODE_A.value
             ),
-            "alarm_code_b": self.coordinator.data.__getattribute__(
+            "alarm_code_b": self.data.__getattribute__(
                 Entity.ALARM_CODE_B.value
             ),
         }
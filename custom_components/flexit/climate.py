@@ -16,13 +16,13 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    AWAY_AIR_TEMPERATURE_PATH,
     DOMAIN as FLEXIT_DOMAIN,
+    HOME_AIR_TEMPERATURE_PATH,
     LOGGER,
     MODE_AWAY,
-    MODE_AWAY_DELAYED,
     MODE_CAL_AWAY,
     MODE_CAL_BOOST,
     MODE_CAL_HOME,
@@ -39,7 +39,9 @@ from .const import (
     PRESETS,
 )
 from .coordinator import FlexitDataUpdateCoordinator
+from .entity import FlexitEntity
 from .models import Entity, FlexitSensorsResponse
+from .presets import PRESET_MODES, plan_transition
 
 CLIMATES: Tuple[ClimateEntityDescription, ...] = (
     ClimateEntityDescription(
@@ -58,46 +60,52 @@ async def async_setup_entry(
     """Set up the Flexit sensor."""
     coordinator: FlexitDataUpdateCoordinator = hass.data[FLEXIT_DOMAIN][entry.entry_id]
     async_add_entities(
-        FlexitClimate(coordinator, description) for description in CLIMATES
+        FlexitClimate(coordinator, description, plant_id)
+        for plant_id in coordinator.plant_ids
+        for description in CLIMATES
     )
 
 
-class FlexitClimate(CoordinatorEntity, ClimateEntity):
+class FlexitClimate(FlexitEntity, ClimateEntity):
     """Representation of a Flexit ventilation unit."""
 
-    coordinator: FlexitDataUpdateCoordinator
+    data_fields = frozenset(
+        (
+            Entity.ROOM_TEMPERATURE.value,
+            Entity.HOME_TEMPERATURE.value,
+            Entity.AWAY_TEMPERATURE.value,
+            Entity.VENTILATION_MODE.value,
+            Entity.ELECTRIC_HEATER.value,
+        )
+    )
 
     def __init__(
         self,
         coordinator: FlexitDataUpdateCoordinator,
         description: ClimateEntityDescription,
+        plant_id: str,
     ) -> None:
         """Initialize a Flexit sensor."""
 
-        super().__init__(coordinator)
+        super().__init__(coordinator, description, plant_id)
 
-        self.entity_description = description
-        self.coordinator = coordinator
-
-        self._attr_unique_id = f"{description.key}"
         self._attr_assumed_state = True
         self._attr_temperature_unit = UnitOfTemperature.CELSIUS
         self._attr_hvac_modes = [HVACMode.HEAT, HVACMode.FAN_ONLY]
         self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
         self._attr_preset_modes = PRESETS
-        self._attr_device_info = coordinator._attr_device_info
 
     @property
     def current_temperature(self) -> float:
         """Return the current_hvac_mode temperature."""
 
-        return self.coordinator.data.room_temperature
+        return self.data.room_temperature
 
     @property
     def target_temperature(self) -> float:
         """Return the temperature we try to reach."""
 
-        data: FlexitSensorsResponse = self.coordinator.data
+        data: FlexitSensorsResponse = self.data
 
         return (
             data.away_air_temperature
@@ -108,8 +116,6 @@ class FlexitClimate(CoordinatorEntity, ClimateEntity):
     async def async_set_temperature(self, **kwargs) -> None:
         """Set new target temperature."""
 
-        coordinator: FlexitDataUpdateCoordinator = self.coordinator
-
         temperature: Optional[Any] = kwargs.get(ATTR_TEMPERATURE)
         if temperature is None:
             return
@@ -118,15 +124,14 @@ class FlexitClimate(CoordinatorEntity, ClimateEntity):
         if float_temp == self.target_temperature:
             return
 
-        if (
-            coordinator.data.ventilation_mode == MODE_AWAY
-            and await coordinator.api.set_away_temp(str(float_temp))
-        ):
-            coordinator.data.away_air_temperature = float_temp
-
-        elif await coordinator.api.set_home_temp(str(float_temp)):
-            coordinator.data.home_air_temperature = float_temp
-
+        if self.data.ventilation_mode == MODE_AWAY:
+            self.async_write_field(
+                "away_air_temperature", AWAY_AIR_TEMPERATURE_PATH, float_temp
+            )
+        else:
+            self.async_write_field(
+                "home_air_temperature", HOME_AIR_TEMPERATURE_PATH, float_temp
+            )
         self.async_write_ha_state()
 
     @property
@@ -135,23 +140,21 @@ class FlexitClimate(CoordinatorEntity, ClimateEntity):
 
         return (
             HVACMode.HEAT
-            if self.coordinator.data.electric_heater
+            if self.data.electric_heater
             else HVACMode.FAN_ONLY
         )
 
     async def async_set_hvac_mode(self, hvac_mode: str) -> None:
         """Set new target hvac mode."""
 
-        coordinator: FlexitDataUpdateCoordinator = self.coordinator
-
         if hvac_mode == self.hvac_mode:
             return
-        if hvac_mode == HVACMode.HEAT and await coordinator.api.set_heater_state(True):
-            coordinator.data.electric_heater = True
-        elif hvac_mode == HVACMode.FAN_ONLY and await coordinator.api.set_heater_state(
+        if hvac_mode == HVACMode.HEAT and await self.api.set_heater_state(True):
+            self.async_show_written(electric_heater=True)
+        elif hvac_mode == HVACMode.FAN_ONLY and await self.api.set_heater_state(
             False
         ):
-            coordinator.data.electric_heater = False
+            self.async_show_written(electric_heater=False)
 
         self.async_write_ha_state()
 
@@ -161,7 +164,7 @@ class FlexitClimate(CoordinatorEntity, ClimateEntity):
 
         return (
             HVACAction.HEATING
-            if self.coordinator.data.electric_heater
+            if self.data.electric_heater
             else HVACAction.IDLE
         )
 
@@ -169,7 +172,7 @@ class FlexitClimate(CoordinatorEntity, ClimateEntity):
     def preset_mode(self) -> str:
         """Return the current_hvac_mode preset mode."""
 
-        current_mode = self.coordinator.data.ventilation_mode
+        current_mode = self.data.ventilation_mode
         return {
             MODE_CAL_HOME: PRESET_CALENDAR_HOME,
             MODE_CAL_AWAY: PRESET_CALENDAR_AWAY,
@@ -185,35 +188,15 @@ class FlexitClimate(CoordinatorEntity, ClimateEntity):
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode async."""
 
-        coordinator: FlexitDataUpdateCoordinator = self.coordinator
-        api = coordinator.api
-
-        away_delay = coordinator.data.away_delay
-        current_mode = coordinator.data.ventilation_mode
-
-        if current_mode == preset_mode:
+        target_mode = PRESET_MODES.get(preset_mode)
+        if target_mode is None:
             return
 
-        # Toggle modes that requires toggle
-        if current_mode == MODE_FIREPLACE:
-            await api.set_mode(MODE_FIREPLACE)
-        if current_mode == MODE_FORCED_VENTILATION:
-            await api.set_mode(MODE_FORCED_VENTILATION)
-        if current_mode == MODE_AWAY:
-            await api.set_mode(MODE_AWAY_DELAYED)
-
-        if preset_mode == PRESET_HOME and await api.set_mode(MODE_HOME):
-            coordinator.data.ventilation_mode = MODE_HOME
-        elif preset_mode == PRESET_AWAY and await api.set_mode(MODE_AWAY):
-            coordinator.data.ventilation_mode = MODE_AWAY
-        elif preset_mode == PRESET_BOOST and await api.set_mode(MODE_HIGH):
-            coordinator.data.ventilation_mode = MODE_HIGH
-        elif preset_mode == PRESET_BOOST_TEMP and await api.set_mode(
-            MODE_FORCED_VENTILATION
-        ):
-            coordinator.data.ventilation_mode = MODE_FORCED_VENTILATION
-        elif preset_mode == PRESET_FIREPLACE and await api.set_mode(MODE_FIREPLACE):
-            coordinator.data.ventilation_mode = MODE_FIREPLACE
-        else:
+        transition = plan_transition(
+            self.data.ventilation_mode, self.data.calendar_active, target_mode
+        )
+        if not transition.writes or not await transition.async_apply(self.api):
             return
+
+        self.async_show_written(ventilation_mode=target_mode)
         self.async_write_ha_state()
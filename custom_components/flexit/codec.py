@@ -0,0 +1,35 @@
+"""JSON encoding and decoding for the Flexit client."""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Union
+
+import attr
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
+class JsonCodec:
+    """Class representing a pair of JSON loads and dumps functions."""
+
+    name: str
+    loads: Callable[[Union[bytes, str]], Any]
+    dumps: Callable[[Any], Union[bytes, str]]
+
+
+STDLIB_CODEC = JsonCodec(name="json", loads=json.loads, dumps=json.dumps)
+ORJSON_CODEC = (
+    JsonCodec(name="orjson", loads=orjson.loads, dumps=orjson.dumps)
+    if orjson is not None
+    else None
+)
+
+
+def default_codec() -> JsonCodec:
+    """Return orjson codec if installed, stdlib codec otherwise."""
+    return ORJSON_CODEC or STDLIB_CODEC
@@ -3,7 +3,6 @@
 from typing import Any, Dict, List
 
 import voluptuous as vol
-from voluptuous.schema_builder import Schema
 
 from homeassistant.config_entries import ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
@@ -12,8 +11,19 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .api import FlexitApiClient
-from .const import CONF_INTERVAL, CONF_PLANT, DEFAULT_INTERVAL, DOMAIN as FLEXIT_DOMAIN
+from .const import (
+    CONF_INTERVAL,
+    CONF_MAX_INTERVAL,
+    CONF_MIN_INTERVAL,
+    CONF_PLANTS,
+    DEFAULT_INTERVAL,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN as FLEXIT_DOMAIN,
+    MIN_ALLOWED_INTERVAL,
+)
 from .models import FlexitPlantItem
+from .throttle import async_get_throttle
 
 CONFIG_SCHEMA = vol.Schema(
     {
@@ -27,7 +37,7 @@ CONFIG_SCHEMA = vol.Schema(
 class FlexitFlowHandler(ConfigFlow, domain=FLEXIT_DOMAIN):
     """Handle a Flexit config flow."""
 
-    VERSION = 1
+    VERSION = 2
 
     def __init__(self) -> None:
         """Initialize the config flow."""
@@ -44,15 +54,9 @@ class FlexitFlowHandler(ConfigFlow, domain=FLEXIT_DOMAIN):
             step_id="user",
             data_schema=CONFIG_SCHEMA,
             errors=errors,
-            last_step=False,
+            last_step=True,
         )
 
-    def get_plant_schema(self, plants: List[FlexitPlantItem]) -> Schema:
-        """Get plant schema."""
-
-        plant_ids = (plant.id for plant in plants)
-        return vol.Schema({vol.Required(CONF_PLANT): vol.In(sorted(plant_ids))})
-
     async def async_step_user(
         self,
         user_input: Dict[str, Any] or None = None,
@@ -70,6 +74,7 @@ class FlexitFlowHandler(ConfigFlow, domain=FLEXIT_DOMAIN):
             async_get_clientsession(self.hass),
             user_input[CONF_USERNAME],
             user_input[CONF_PASSWORD],
+            throttle=async_get_throttle(self.hass),
         )
 
         try:
@@ -79,36 +84,26 @@ class FlexitFlowHandler(ConfigFlow, domain=FLEXIT_DOMAIN):
 
         if self.plants is None or len(self.plants) == 0:
             return self.async_abort(reason="no_devices_found")
-        elif self.plants is not None and len(self.plants) == 1:
-            return self.async_create_entry(
-                title=self.title,
-                data={**{CONF_PLANT: self.plants[0].id}, **self.user_input},
-            )
-
-        return await self.async_step_plant(user_input=user_input)
-
-    async def async_step_plant(
-        self,
-        user_input: Dict[str, Any] or None = None,
-    ) -> FlowResult:
-        """Flow to handle choosing plant."""
-
-        if user_input is None or user_input.get(CONF_PLANT) is None:
-            return self.async_show_form(
-                step_id="plant",
-                data_schema=self.get_plant_schema(self.plants),
-                errors={},
-                last_step=True,
-            )
 
-        plant_id = user_input.get(CONF_PLANT)
-
-        await self.async_set_unique_id(plant_id)
+        # One entry manages every plant of the account
+        await self.async_set_unique_id(user_input[CONF_USERNAME].lower())
         self._abort_if_unique_id_configured()
 
+        # Entries of a single plant, made before, may still manage some of them
+        configured = {
+            plant_id
+            for entry in self._async_current_entries()
+            for plant_id in entry.data.get(CONF_PLANTS, ())
+        }
+        if any(plant.id in configured for plant in self.plants):
+            return self.async_abort(reason="already_configured")
+
         return self.async_create_entry(
             title=self.title,
-            data={**user_input, **self.user_input},
+            data={
+                **self.user_input,
+                CONF_PLANTS: sorted(plant.id for plant in self.plants),
+            },
         )
 
     @staticmethod
@@ -133,9 +128,24 @@ class FlexitOptionsFlowHandler(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="Options", data=user_input)
 
+        options = self.config_entry.options
+
         return self.async_show_form(
             step_id="init",
             data_schema=vol.Schema(
-                {vol.Required(CONF_INTERVAL, default=DEFAULT_INTERVAL): int}
+                {
+                    vol.Required(
+                        CONF_INTERVAL,
+                        default=options.get(CONF_INTERVAL, DEFAULT_INTERVAL),
+                    ): vol.All(int, vol.Range(min=MIN_ALLOWED_INTERVAL)),
+                    vol.Required(
+                        CONF_MIN_INTERVAL,
+                        default=options.get(CONF_MIN_INTERVAL, DEFAULT_MIN_INTERVAL),
+                    ): vol.All(int, vol.Range(min=MIN_ALLOWED_INTERVAL)),
+                    vol.Required(
+                        CONF_MAX_INTERVAL,
+                        default=options.get(CONF_MAX_INTERVAL, DEFAULT_MAX_INTERVAL),
+                    ): vol.All(int, vol.Range(min=MIN_ALLOWED_INTERVAL)),
+                }
             ),
         )
@@ -1,7 +1,7 @@
 """Constants for the flexit integration."""
 
 from logging import Logger, getLogger
-from typing import List
+from typing import Any, Dict, List, Tuple
 
 from homeassistant.const import Platform
 from homeassistant.components.climate.const import (
@@ -15,16 +15,30 @@ LOGGER: Logger = getLogger(__package__)
 DOMAIN = "flexit"
 
 CONF_PLANT = "plant"
+CONF_PLANTS = "plants"
 CONF_INTERVAL = "update_interval"
+CONF_MIN_INTERVAL = "min_update_interval"
+CONF_MAX_INTERVAL = "max_update_interval"
 
+# Poll intervals, in minutes
 DEFAULT_INTERVAL = 30
+DEFAULT_MIN_INTERVAL = 5
+DEFAULT_MAX_INTERVAL = 120
+# Shortest interval allowed in the options
+MIN_ALLOWED_INTERVAL = 2
 
 # API
 API_URL: str = "https://api.climatixic.com"
-TOKEN_PATH: str = f"{API_URL}/Token"
-PLANTS_PATH: str = f"{API_URL}/Plants"
-DATAPOINTS_PATH: str = f"{API_URL}/DataPoints"
-FILTER_PATH: str = f"{DATAPOINTS_PATH}/Values?filterId="
+TOKEN_ENDPOINT: str = "/Token"
+PLANTS_ENDPOINT: str = "/Plants"
+DATAPOINTS_ENDPOINT: str = "/DataPoints"
+FILTER_ENDPOINT: str = f"{DATAPOINTS_ENDPOINT}/Values?filterId="
+TOKEN_PATH: str = f"{API_URL}{TOKEN_ENDPOINT}"
+PLANTS_PATH: str = f"{API_URL}{PLANTS_ENDPOINT}"
+DATAPOINTS_PATH: str = f"{API_URL}{DATAPOINTS_ENDPOINT}"
+FILTER_PATH: str = f"{API_URL}{FILTER_ENDPOINT}"
+# Datapoints of several plants are combined in one filter up to this url length
+MAX_FILTER_URL_LENGTH = 8192
 API_HEADERS = {
     "Accept": "application/json",
     "Accept-Encoding": "gzip, deflate, br",
@@ -34,6 +48,18 @@ API_HEADERS = {
     "Ocp-Apim-Subscription-Key": "c3fc1f14ce8747588212eda5ae3b439e",
 }
 
+# Requests per second shared by all clients using the subscription key.
+# The API allows 50 calls/min, so a full burst and a minute of requests at
+# the rate stay below it
+API_CALLS_PER_MINUTE = 50
+REQUEST_RATE = 0.7
+REQUEST_BURST = 5
+
+# The API also allows 500 calls/week. Polls are not sped up once fewer than
+# the reserve are left of the calls of the last week
+API_CALLS_PER_WEEK = 500
+REQUEST_BUDGET_RESERVE = 100
+
 PLATFORMS: List[str] = [
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
@@ -86,6 +112,31 @@ MODE_HOME_HIGH_CAL_PUT_PATH = ";1!01300002A000055"
 MODE_HIGH_TEMP_PUT_PATH = ";1!013000165000055"  # TOGGLES
 MODE_FIREPLACE_PUT_PATH = ";1!013000168000055"  # TOGGLES
 
+# Datapoint and value written to enter (or for toggles, leave) a mode
+MODE_DATAPOINTS: Dict[str, Tuple[str, Any]] = {
+    MODE_AWAY: (MODE_AWAY_PUT_PATH, 0),
+    MODE_AWAY_DELAYED: (MODE_AWAY_PUT_PATH, 1),
+    MODE_HOME: (MODE_HOME_HIGH_CAL_PUT_PATH, 3),
+    MODE_HIGH: (MODE_HOME_HIGH_CAL_PUT_PATH, 4),
+    MODE_FORCED_VENTILATION: (MODE_HIGH_TEMP_PUT_PATH, 2),
+    MODE_FIREPLACE: (MODE_FIREPLACE_PUT_PATH, 2),
+}
+
+MAX_CONCURRENT_WRITES = 4
+# Seconds a datapoint must keep its value before it is written
+WRITE_DEBOUNCE = 1.5
+# Seconds between reads of written datapoints, doubling up to the max delay,
+# until they report the value written or the timeout passes
+VERIFY_DELAY = 2.0
+VERIFY_MAX_DELAY = 15.0
+VERIFY_TIMEOUT = 60.0
+
+# Writes that flip state, so repeating one is not safe
+TOGGLE_PUT_PATHS: List[str] = [
+    MODE_HIGH_TEMP_PUT_PATH,
+    MODE_FIREPLACE_PUT_PATH,
+]
+
 FIREPLACE_DURATION_PATH = ";1!03000010E000055"  # PUT AND GET
 BOOST_DURATION_PATH = ";1!030000125000055"  # PUT AND GET
 AWAY_DELAY_PATH = ";1!03000013E000055"  # PUT AND GET
@@ -133,30 +184,49 @@ FIRMWARE_REVISION_PATH = ";0!0083FFFFF00002C"
 BACNET_MAC_PATH = ";0!108000000001313"
 DEVICE_FEATURES_PATH = ";0!0083FFFFF0013F4"
 
-SENSOR_DATA_PATH_LIST: List[str] = [
+# Datapoints are fetched in tiers that change at different rates.
+# Fast changing telemetry and the mode, fetched on every poll
+TELEMETRY_PATH_LIST: List[str] = [
     MODE_HOME_HIGH_CAL_PUT_PATH,
     OUTSIDE_AIR_TEMPERATURE_PATH,
     SUPPLY_AIR_TEMPERATURE_PATH,
     EXTRACT_AIR_TEMPERATURE_PATH,
     EXHAUST_AIR_TEMPERATURE_PATH,
-    HOME_AIR_TEMPERATURE_PATH,
-    AWAY_AIR_TEMPERATURE_PATH,
     ROOM_TEMPERATURE_PATH,
-    FILTER_OPERATING_TIME_PATH,
-    FILTER_TIME_FOR_EXCHANGE_PATH,
-    HEATER_PATH,
     HEAT_EXCHANGER_SPEED_PATH,
     SUPPLY_FAN_SPEED_PATH,
     SUPPLY_FAN_CONTROL_SIGNAL_PATH,
     EXTRACT_FAN_SPEED_PATH,
     EXTRACT_FAN_CONTROL_SIGNAL_PATH,
     ADDITIONAL_HEATER_PATH,
+    CALENDAR_TEMPORARY_OVERRIDE_PATH,
+]
+
+# State that changes slowly or only when written
+STATE_PATH_LIST: List[str] = [
+    HOME_AIR_TEMPERATURE_PATH,
+    AWAY_AIR_TEMPERATURE_PATH,
+    HEATER_PATH,
+    FILTER_OPERATING_TIME_PATH,
     ALARM_CODE_A_PATH,
     ALARM_CODE_B_PATH,
+]
+
+# Configuration that only changes when written
+CONFIGURATION_PATH_LIST: List[str] = [
+    FILTER_TIME_FOR_EXCHANGE_PATH,
     FIREPLACE_DURATION_PATH,
     BOOST_DURATION_PATH,
     AWAY_DELAY_PATH,
-    CALENDAR_TEMPORARY_OVERRIDE_PATH,
+]
+
+STATE_MAX_AGE = 15  # minutes
+CONFIGURATION_MAX_AGE = 6  # hours
+
+SENSOR_DATA_PATH_LIST: List[str] = [
+    *TELEMETRY_PATH_LIST,
+    *STATE_PATH_LIST,
+    *CONFIGURATION_PATH_LIST,
 ]
 
 DEVICE_INFO_PATH_LIST: List[str] = [
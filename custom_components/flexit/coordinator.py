@@ -1,59 +1,453 @@
 """Flexit data coordinator."""
 
-from datetime import timedelta
+import asyncio
+from collections import deque
+from datetime import datetime, timedelta
+import time
+from typing import Any, Deque, Dict, FrozenSet, List, Optional, Tuple
 
+import attr
 from aiohttp.client_exceptions import ClientConnectorError
 from voluptuous.error import Error
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .api import FlexitApiClient
-from .const import DOMAIN as FLEXIT_DOMAIN, LOGGER
-from .models import FlexitDeviceInfo, FlexitSensorsResponse
+from .api import ApiClientException, FlexitApiClient
+from .const import (
+    CONF_PLANTS,
+    DEFAULT_MAX_INTERVAL,
+    DEFAULT_MIN_INTERVAL,
+    DOMAIN as FLEXIT_DOMAIN,
+    LOGGER,
+    VERIFY_DELAY,
+    VERIFY_MAX_DELAY,
+    VERIFY_TIMEOUT,
+)
+from .metrics import (
+    DISPATCH_TIME,
+    DURATION_BUCKETS,
+    POLL_FAILURES,
+    POLL_LATENCY,
+    POLLS,
+    UNVERIFIED_WRITES,
+    VERIFIED_WRITES,
+    VERIFY_LATENCY,
+)
+from .models import (
+    VALUES,
+    FlexitDeviceInfo,
+    FlexitSensorsResponse,
+    field_paths,
+    path_fields,
+)
+from .polling import AdaptivePollInterval
+from .schedule import CalendarSchedule
+from .store import FlexitStore
+from .tiers import TieredValues
+from .timers import ModeTimers
+from .writes import WriteCoalescer
+
+# Success rate is computed over this many polls
+POLL_WINDOW = 20
 
 
 class FlexitDataUpdateCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching from Flexit data API."""
+    """Class to manage fetching from Flexit data API for every plant of an entry."""
 
-    data: FlexitSensorsResponse
+    data: Dict[str, FlexitSensorsResponse]
 
     def __init__(
         self,
         hass: HomeAssistant,
         name: str,
         api: FlexitApiClient,
-        device_info: FlexitDeviceInfo,
+        plant_ids: List[str],
+        device_info: Dict[str, FlexitDeviceInfo],
         update_interval: int,
+        store: FlexitStore,
+        min_update_interval: int = DEFAULT_MIN_INTERVAL,
+        max_update_interval: int = DEFAULT_MAX_INTERVAL,
     ) -> None:
         """Initialize."""
 
         self.api = api
         self.name = name
+        self.plant_ids = plant_ids
+        self.store = store
         self.device_info = device_info
 
-        self._attr_device_info = DeviceInfo(
-            name=self.name,
-            manufacturer="Flexit",
-            model=self.device_info.modelName,
-            sw_version=self.device_info.fw,
-            identifiers={(FLEXIT_DOMAIN, self.name)},
+        self._plant_apis: Dict[str, FlexitApiClient] = {
+            plant_id: api.for_plant(plant_id) for plant_id in plant_ids
+        }
+
+        # Fields of each plant that changed in the last poll
+        self.changed_fields: Dict[str, FrozenSet[str]] = {}
+        self.state_writes: int = 0
+        self.suppressed_writes: int = 0
+
+        self.metrics = api.metrics
+        self.last_success_time: Optional[datetime] = None
+        self._poll_results: Deque[bool] = deque(maxlen=POLL_WINDOW)
+
+        self.tiers = TieredValues()
+        self.writes = WriteCoalescer(hass, self._async_write)
+        # Reads verifying writes, by plant and fields written
+        self._verifications: Dict[Tuple[str, FrozenSet[str]], asyncio.Task] = {}
+        self.timers = ModeTimers(hass, api, self._async_reconcile_timer)
+        self.calendar = CalendarSchedule(store.calendar)
+        self._cancel_calendar_poll: Optional[CALLBACK_TYPE] = None
+        self.poll_interval = AdaptivePollInterval(
+            base=timedelta(minutes=update_interval),
+            minimum=timedelta(minutes=min_update_interval),
+            maximum=timedelta(minutes=max_update_interval),
+            budget=api.throttle.budget,
         )
 
         super().__init__(
             hass,
             LOGGER,
             name=FLEXIT_DOMAIN,
-            update_interval=timedelta(minutes=update_interval),
+            update_interval=self.poll_interval.base,
         )
 
-    async def _async_update_data(self) -> FlexitSensorsResponse:
+    async def _async_update_data(self) -> Dict[str, FlexitSensorsResponse]:
         """Update data via library."""
 
+        self.changed_fields = {}
+        tiers = self.tiers.due()
+        started = time.perf_counter()
         try:
-            return await self.api.sensor_data()
-        except (Error, ClientConnectorError) as error:
+            values = await self.api.values(self.plant_ids, self.tiers.paths(tiers))
+        except (ApiClientException, Error, ClientConnectorError) as error:
             LOGGER.error("Update error %s", error)
+            self._record_poll(False, started)
             raise UpdateFailed(error) from error
+
+        self.tiers.update(tiers, values[VALUES])
+        data = self.api.decode_sensor_data(self.plant_ids, {VALUES: self.tiers.values})
+
+        if not data:
+            self._record_poll(False, started)
+            raise UpdateFailed(f"No data for plants {self.plant_ids}")
+
+        # Keep showing values that are about to be written
+        for plant_id, plant_data in data.items():
+            if changes := self.writes.pending_changes(plant_id):
+                data[plant_id] = attr.evolve(plant_data, **changes)
+
+        self._record_poll(True, started)
+        self.changed_fields = self._changed_fields(self.data, data)
+        self.store.async_save_sensor_data(data)
+        self.timers.async_update(data)
+        self._async_observe_calendar(data)
+        self.update_interval = self.poll_interval.next_interval(
+            self.data,
+            data,
+            {plant_id for plant_id in data if self.timers.counting_down(plant_id)},
+        )
+        return data
+
+    def _record_poll(self, success: bool, started: float) -> None:
+        """Record outcome and latency of a poll."""
+
+        self.metrics.increment(POLLS)
+        self.metrics.observe(POLL_LATENCY, time.perf_counter() - started)
+        self._poll_results.append(success)
+        if success:
+            self.last_success_time = dt_util.utcnow()
+        else:
+            self.metrics.increment(POLL_FAILURES)
+
+    @property
+    def poll_success_rate(self) -> Optional[float]:
+        """Return percentage of recent polls that succeeded."""
+
+        if not self._poll_results:
+            return None
+        return round(100 * sum(self._poll_results) / len(self._poll_results), 1)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, recording the time spent dispatching."""
+
+        started = time.perf_counter()
+        super().async_update_listeners()
+        self.metrics.observe(
+            DISPATCH_TIME, time.perf_counter() - started, DURATION_BUCKETS
+        )
+
+    @staticmethod
+    def _changed_fields(
+        previous: Optional[Dict[str, FlexitSensorsResponse]],
+        data: Dict[str, FlexitSensorsResponse],
+    ) -> Dict[str, FrozenSet[str]]:
+        """Return fields of each plant that differ from the previous poll."""
+
+        fields = [field.name for field in attr.fields(FlexitSensorsResponse)]
+        changed: Dict[str, FrozenSet[str]] = {}
+        for plant_id, plant_data in data.items():
+            plant_previous = (previous or {}).get(plant_id)
+            changed[plant_id] = frozenset(
+                field
+                for field in fields
+                if plant_previous is None
+                or getattr(plant_data, field) != getattr(plant_previous, field)
+            )
+        return changed
+
+    @callback
+    def async_note_write(self) -> None:
+        """Poll at the minimum interval after a value was written."""
+
+        self.poll_interval.note_write()
+        if self.update_interval > self.poll_interval.fastest:
+            self.update_interval = self.poll_interval.fastest
+            self._schedule_refresh()
+
+    async def _async_write(
+        self, plant_id: str, path: str, field: str, value: Any
+    ) -> None:
+        """Write a value settled in the write coalescer."""
+
+        try:
+            success = await self.plant_api(plant_id).update(path, value)
+        except ApiClientException as error:
+            LOGGER.error("Failed to write %s to %s: %s", value, path, error)
+            success = False
+
+        if success:
+            self.async_verify(plant_id, {field: value})
+        else:
+            # Replace the value shown with the one the unit has
+            await self.async_request_refresh()
+
+    @callback
+    def async_verify(self, plant_id: str, expected: Dict[str, Any]) -> None:
+        """Re-read the datapoints of fields written until they report expected."""
+
+        self.async_note_write()
+
+        # A newer write of the same fields supersedes the verification
+        key = (plant_id, frozenset(expected))
+        if (previous := self._verifications.get(key)) is not None:
+            previous.cancel()
+
+        self._verifications[key] = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_verify(plant_id, expected),
+            f"{FLEXIT_DOMAIN} verify {plant_id} {', '.join(expected)}",
+        )
+
+    async def _async_verify(self, plant_id: str, expected: Dict[str, Any]) -> None:
+        """Read datapoints with backoff until they converge or time runs out."""
+
+        paths = field_paths(expected)
+        started = time.monotonic()
+        delay = VERIFY_DELAY
+        while True:
+            await asyncio.sleep(delay)
+            if (data := await self._async_read(plant_id, paths)) is not None:
+                plant_data, values = data
+                if all(
+                    getattr(plant_data, field) == value
+                    for field, value in expected.items()
+                ):
+                    self.metrics.increment(VERIFIED_WRITES)
+                    self.metrics.observe(VERIFY_LATENCY, time.monotonic() - started)
+                    self._async_merge(plant_id, plant_data, values, paths)
+                    return
+
+            if time.monotonic() - started + delay > VERIFY_TIMEOUT:
+                break
+            delay = min(2 * delay, VERIFY_MAX_DELAY)
+
+        LOGGER.debug("%s of %s not verified, refreshing", list(expected), plant_id)
+        self.metrics.increment(UNVERIFIED_WRITES)
+        self.tiers.invalidate()
+        await self.async_request_refresh()
+
+    async def _async_read(
+        self, plant_id: str, paths: List[str]
+    ) -> Optional[Tuple[FlexitSensorsResponse, Dict[str, Any]]]:
+        """Read paths of plant and return its data with them merged in."""
+
+        try:
+            values = (await self.api.values([plant_id], paths))[VALUES]
+        except ApiClientException as error:
+            LOGGER.debug("Could not read back %s: %s", plant_id, error)
+            return None
+
+        decoded = self.api.decode_sensor_data(
+            [plant_id], {VALUES: {**self.tiers.values, **values}}
+        )
+        if plant_id not in decoded:
+            return None
+        return decoded[plant_id], values
+
+    @callback
+    def _async_merge(
+        self,
+        plant_id: str,
+        plant_data: FlexitSensorsResponse,
+        values: Dict[str, Any],
+        paths: List[str],
+    ) -> None:
+        """Merge datapoints read back into the data and update listeners.
+
+        Only fields of the paths read are replaced, so values shown for other
+        writes stay until those are verified or polled.
+        """
+
+        self.tiers.values.update(values)
+        if (current := self.data.get(plant_id)) is not None:
+            plant_data = attr.evolve(
+                current,
+                **{field: getattr(plant_data, field) for field in path_fields(paths)},
+            )
+        if changes := self.writes.pending_changes(plant_id):
+            plant_data = attr.evolve(plant_data, **changes)
+
+        previous = {plant_id: self.data[plant_id]} if plant_id in self.data else None
+        self.changed_fields = self._changed_fields(previous, {plant_id: plant_data})
+        self.data = {**self.data, plant_id: plant_data}
+        self.timers.async_update({plant_id: plant_data})
+        self._async_observe_calendar({plant_id: plant_data})
+        self.async_update_listeners()
+
+    async def _async_reconcile_timer(self, plant_id: str) -> None:
+        """Read back the mode of plant once its timed mode should have ended."""
+
+        paths = field_paths(("ventilation_mode",))
+        if (data := await self._async_read(plant_id, paths)) is not None:
+            self._async_merge(plant_id, *data, paths)
+
+    @callback
+    def _async_observe_calendar(self, data: Dict[str, FlexitSensorsResponse]) -> None:
+        """Learn calendar switches from data and poll just after the next one."""
+
+        now = dt_util.utcnow()
+        if any(
+            [
+                self.calendar.observe(plant_id, plant_data, now)
+                for plant_id, plant_data in data.items()
+            ]
+        ):
+            self.store.async_save_calendar(self.calendar.transitions)
+
+        if self._cancel_calendar_poll is not None:
+            self._cancel_calendar_poll()
+            self._cancel_calendar_poll = None
+        if (poll_at := self.calendar.next_poll(now)) is not None:
+            self._cancel_calendar_poll = async_track_point_in_utc_time(
+                self.hass, self._async_calendar_poll, poll_at
+            )
+
+    @callback
+    def _async_calendar_poll(self, now: datetime) -> None:
+        """Poll for a calendar switch expected now."""
+
+        self._cancel_calendar_poll = None
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.async_request_refresh(),
+            f"{FLEXIT_DOMAIN} calendar poll",
+        )
+
+    async def async_shutdown(self) -> None:
+        """Stop polls, timers and calendar polls."""
+
+        await super().async_shutdown()
+        self.timers.async_cancel()
+        if self._cancel_calendar_poll is not None:
+            self._cancel_calendar_poll()
+            self._cancel_calendar_poll = None
+
+    def plant_api(self, plant_id: str) -> FlexitApiClient:
+        """Return client for plant."""
+        return self._plant_apis[plant_id]
+
+    def plant_name(self, plant_id: str) -> str:
+        """Return device name of plant."""
+        return self.name if len(self.plant_ids) == 1 else f"{self.name} {plant_id}"
+
+    def plant_unique_id(self, plant_id: str, key: str) -> str:
+        """Return unique id of an entity of plant."""
+        return f"{plant_id}_{key}"
+
+    def plant_device_info(self, plant_id: str) -> DeviceInfo:
+        """Return device info of plant."""
+
+        device_info = self.device_info.get(plant_id)
+
+        return DeviceInfo(
+            name=self.plant_name(plant_id),
+            manufacturer="Flexit",
+            model=device_info.modelName if device_info else None,
+            sw_version=device_info.fw if device_info else None,
+            identifiers={(FLEXIT_DOMAIN, plant_id)},
+        )
+
+    async def async_revalidate(self) -> None:
+        """Refresh data and device info restored from the store."""
+
+        await self.async_refresh()
+        await self._async_discover_plants()
+
+        try:
+            device_info = await self.api.device_info_many(self.plant_ids)
+        except ApiClientException as error:
+            LOGGER.debug("Could not refresh device info: %s", error)
+            return
+
+        self.store.async_save_device_info({**self.device_info, **device_info})
+
+        device_registry = dr.async_get(self.hass)
+        for plant_id, plant_device_info in device_info.items():
+            if plant_device_info == self.device_info.get(plant_id):
+                continue
+
+            self.device_info[plant_id] = plant_device_info
+            if device := device_registry.async_get_device(
+                identifiers={(FLEXIT_DOMAIN, plant_id)}
+            ):
+                device_registry.async_update_device(
+                    device.id,
+                    model=plant_device_info.modelName,
+                    sw_version=plant_device_info.fw,
+                )
+
+    async def _async_discover_plants(self) -> None:
+        """Reload entry if plants were added to or removed from the account."""
+
+        # Plants of the account may still be managed by entries made before
+        configured = {
+            plant_id
+            for entry in self.hass.config_entries.async_entries(FLEXIT_DOMAIN)
+            if entry.entry_id != self.config_entry.entry_id
+            for plant_id in entry.data.get(CONF_PLANTS, ())
+        }
+        try:
+            plant_ids = sorted(
+                plant.id
+                for plant in await self.api.find_plants()
+                if plant.id not in configured
+            )
+        except ApiClientException as error:
+            LOGGER.debug("Could not refresh plants: %s", error)
+            return
+
+        if not plant_ids or plant_ids == sorted(self.plant_ids):
+            return
+
+        LOGGER.info("Plants changed from %s to %s", self.plant_ids, plant_ids)
+        # Entry is reloaded by its update listener
+        self.hass.config_entries.async_update_entry(
+            self.config_entry,
+            data={**self.config_entry.data, CONF_PLANTS: plant_ids},
+        )
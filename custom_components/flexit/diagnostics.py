@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
+from typing import Any, Dict, Set
+
+import attr
+
+from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
 from custom_components.flexit.api import FlexitApiClient
 
 from custom_components.flexit.coordinator import FlexitDataUpdateCoordinator
-from custom_components.flexit.models import FlexitSensorsResponse
 
-from .const import DOMAIN
+from .const import BACNET_MAC_PATH, DOMAIN, SERIAL_NUMBER_PATH
+
+TO_REDACT = {
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    "access_token",
+    "userName",
+    "serialInfo",
+}
 
 
 async def async_get_config_entry_diagnostics(
@@ -18,9 +32,100 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
 
     coordinator: FlexitDataUpdateCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    data: FlexitSensorsResponse = coordinator.data
+    api: FlexitApiClient = coordinator.api
+
+    return async_redact_data(
+        {
+            "entry": {
+                "data": dict(config_entry.data),
+                "options": dict(config_entry.options),
+            },
+            "device_info": {
+                plant_id: attr.asdict(device_info)
+                for plant_id, device_info in coordinator.device_info.items()
+            },
+            "data": {
+                plant_id: attr.asdict(plant_data)
+                for plant_id, plant_data in (coordinator.data or {}).items()
+            },
+            "polling": {
+                "update_interval": str(coordinator.update_interval),
+                "last_update_success": coordinator.last_update_success,
+                "last_success_time": coordinator.last_success_time,
+                "poll_success_rate": coordinator.poll_success_rate,
+                "state_writes": coordinator.state_writes,
+                "suppressed_state_writes": coordinator.suppressed_writes,
+            },
+            "writes": {
+                "sent": coordinator.writes.sent_count,
+                "coalesced": coordinator.writes.coalesced_count,
+                "skipped": coordinator.writes.skipped_count,
+            },
+            "timers": {
+                "reads": coordinator.timers.read_count,
+                "reconciles": coordinator.timers.reconcile_count,
+            },
+            "calendar": {
+                plant_id: [attr.asdict(transition) for transition in transitions]
+                for plant_id, transitions in coordinator.calendar.transitions.items()
+            },
+            "fetch_plan": _fetch_plan(coordinator),
+            "token": _token(api),
+            "circuit_breaker": api.circuit_breaker.state,
+            "throttle": {
+                "rate": api.throttle.rate,
+                "paused_for": api.throttle.paused_for,
+                "throttled_count": api.throttle.throttled_count,
+            },
+            "codec": api.codec.name,
+            "metrics": coordinator.metrics.as_dict(),
+            "requests": api.history.as_dict(),
+        },
+        TO_REDACT | _redacted_datapoints(coordinator),
+    )
+
+
+def _fetch_plan(coordinator: FlexitDataUpdateCoordinator) -> Dict[str, Any]:
+    """Return datapoint tiers and the requests of the next poll."""
+
+    due = coordinator.tiers.due()
+    return {
+        "tiers": [
+            {
+                "name": tier.name,
+                "max_age": str(tier.max_age),
+                "due": tier in due,
+                "paths": list(tier.paths),
+            }
+            for tier in coordinator.tiers.tiers
+        ],
+        "requests": [
+            {"plant_ids": list(plan.plant_ids), "url_length": len(plan.url)}
+            for plan in coordinator.api.fetch_plans(
+                coordinator.plant_ids, coordinator.tiers.paths(due)
+            )
+        ],
+    }
+
+
+def _token(api: FlexitApiClient) -> Dict[str, Any]:
+    """Return state of the access token without the token itself."""
+
+    expires_at = api.token_manager.expires_at
+    return {
+        "valid": api.token_manager.valid,
+        "expires_at": datetime.fromtimestamp(expires_at, timezone.utc).isoformat()
+        if expires_at
+        else None,
+        "refresh_count": api.token_manager.refresh_count,
+    }
+
+
+def _redacted_datapoints(coordinator: FlexitDataUpdateCoordinator) -> Set[str]:
+    """Return keys of datapoints identifying the units in raw payloads."""
 
     return {
-        "data": str(data),
-        # "device": str(coordinator.device_info), # TODO redact
+        f"{plant_id}{path}"
+        for plant_id in coordinator.plant_ids
+        for path in (SERIAL_NUMBER_PATH, BACNET_MAC_PATH)
     }
@@ -0,0 +1,105 @@
+"""Base entity for Flexit."""
+
+from typing import Any, FrozenSet, Optional
+
+import attr
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .api import FlexitApiClient
+from .coordinator import FlexitDataUpdateCoordinator
+from .models import FlexitSensorsResponse
+
+
+class FlexitEntity(CoordinatorEntity):
+    """Define a Flexit entity belonging to one plant."""
+
+    coordinator: FlexitDataUpdateCoordinator
+
+    # Fields of the plant data read by the entity, defaults to the description key
+    data_fields: Optional[FrozenSet[str]] = None
+    # Write state after every poll, for entities not derived from plant data
+    always_update: bool = False
+
+    def __init__(
+        self,
+        coordinator: FlexitDataUpdateCoordinator,
+        description: EntityDescription,
+        plant_id: str,
+    ) -> None:
+        """Initialize."""
+
+        super().__init__(coordinator)
+        self.coordinator = coordinator
+        self.entity_description = description
+        self.plant_id = plant_id
+        if self.data_fields is None:
+            self.data_fields = frozenset((description.key,))
+
+        self._last_available: Optional[bool] = None
+
+        self._attr_unique_id = coordinator.plant_unique_id(plant_id, description.key)
+        self._attr_device_info = coordinator.plant_device_info(plant_id)
+
+        if self.plant_id in coordinator.data:
+            self.update_from_data()
+
+    @property
+    def api(self) -> FlexitApiClient:
+        """Return client for the plant of this entity."""
+        return self.coordinator.plant_api(self.plant_id)
+
+    @property
+    def data(self) -> FlexitSensorsResponse:
+        """Return latest data for the plant of this entity."""
+        return self.coordinator.data[self.plant_id]
+
+    def update_data(self, **changes: Any) -> None:
+        """Replace data of the plant with values written to it."""
+        self.coordinator.data[self.plant_id] = attr.evolve(self.data, **changes)
+
+    @callback
+    def async_show_written(self, **changes: Any) -> None:
+        """Show values written at once and verify the unit reports them."""
+
+        self.update_data(**changes)
+        self.coordinator.async_verify(self.plant_id, changes)
+
+    @callback
+    def async_write_field(self, field: str, path: str, value: Any) -> None:
+        """Show value of field at once and write it to path once it settles."""
+
+        self.coordinator.writes.async_write(
+            self.plant_id, path, field, value, getattr(self.data, field)
+        )
+        self.update_data(**{field: value})
+
+    @property
+    def available(self) -> bool:
+        """Return if data for the plant is available."""
+        return super().available and self.plant_id in self.coordinator.data
+
+    def update_from_data(self) -> None:
+        """Update attributes based on new data."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle data update, skipping the state write if nothing read changed."""
+
+        available = self.available
+        changed = self.coordinator.changed_fields.get(self.plant_id, frozenset())
+        if (
+            not self.always_update
+            and available == self._last_available
+            and not self.data_fields & changed
+        ):
+            self.coordinator.suppressed_writes += 1
+            return
+
+        self._last_available = available
+        self.coordinator.state_writes += 1
+        if self.plant_id in self.coordinator.data:
+            self.update_from_data()
+        super()._handle_coordinator_update()
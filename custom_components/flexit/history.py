@@ -0,0 +1,62 @@
+"""Recent responses and errors of the Flexit client, kept for diagnostics."""
+
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List
+
+RESPONSE_HISTORY = 10
+ERROR_HISTORY = 20
+
+
+class RequestHistory:
+    """Ring buffers of the last responses and errors."""
+
+    def __init__(
+        self, responses: int = RESPONSE_HISTORY, errors: int = ERROR_HISTORY
+    ) -> None:
+        """Initialize."""
+
+        self.responses: Deque[Dict[str, Any]] = deque(maxlen=responses)
+        self.errors: Deque[Dict[str, Any]] = deque(maxlen=errors)
+
+    def record_response(
+        self,
+        method: str,
+        url: str,
+        status: int,
+        latency: float,
+        size: int,
+        payload: Any,
+    ) -> None:
+        """Record a decoded response."""
+
+        self.responses.append(
+            {
+                "time": datetime.now(timezone.utc).isoformat(),
+                "method": method,
+                "url": url,
+                "status": status,
+                "latency": round(latency, 4),
+                "bytes": size,
+                "payload": payload,
+            }
+        )
+
+    def record_error(self, method: str, url: str, error: Exception) -> None:
+        """Record a failed request."""
+
+        self.errors.append(
+            {
+                "time": datetime.now(timezone.utc).isoformat(),
+                "method": method,
+                "url": url,
+                "error": type(error).__name__,
+                "message": str(error),
+            }
+        )
+
+    def as_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return recorded responses and errors, oldest first."""
+        return {"responses": list(self.responses), "errors": list(self.errors)}
@@ -0,0 +1,132 @@
+"""Metrics of the Flexit client and coordinator."""
+
+from __future__ import annotations
+
+import bisect
+from typing import Any, Dict, List, Tuple
+import urllib.parse
+
+from .const import DATAPOINTS_ENDPOINT, FILTER_ENDPOINT, PLANTS_ENDPOINT, TOKEN_ENDPOINT
+
+ENDPOINT_TOKEN = "token"
+ENDPOINT_PLANTS = "plants"
+ENDPOINT_VALUES = "values"
+ENDPOINT_DATAPOINTS_PUT = "datapoints_put"
+ENDPOINT_OTHER = "other"
+
+# Counters
+REQUESTS = "requests"
+REQUEST_ERRORS = "request_errors"
+RETRIES = "retries"
+AUTH_REFRESHES = "auth_refreshes"
+AUTH_REJECTIONS = "auth_rejections"
+BYTES_SENT = "bytes_sent"
+BYTES_RECEIVED = "bytes_received"
+POLLS = "polls"
+POLL_FAILURES = "poll_failures"
+VERIFIED_WRITES = "verified_writes"
+UNVERIFIED_WRITES = "unverified_writes"
+
+# Histograms
+REQUEST_LATENCY = "request_latency"
+DECODE_TIME = "decode_time"
+DISPATCH_TIME = "dispatch_time"
+POLL_LATENCY = "poll_latency"
+VERIFY_LATENCY = "verify_latency"
+
+# Upper bounds in seconds
+LATENCY_BUCKETS: Tuple[float, ...] = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+DURATION_BUCKETS: Tuple[float, ...] = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05)
+
+
+def endpoint(method: str, url: str) -> str:
+    """Return endpoint a request is sent to, whichever host serves the API."""
+
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    if path.startswith(TOKEN_ENDPOINT):
+        return ENDPOINT_TOKEN
+    if path.startswith(PLANTS_ENDPOINT):
+        return ENDPOINT_PLANTS
+    if path.startswith(FILTER_ENDPOINT):
+        return ENDPOINT_VALUES
+    if method == "PUT" and path.startswith(DATAPOINTS_ENDPOINT):
+        return ENDPOINT_DATAPOINTS_PUT
+    return ENDPOINT_OTHER
+
+
+class Histogram:
+    """Count observations in buckets of upper bounds."""
+
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        """Initialize."""
+
+        self.buckets = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.last: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Add an observation."""
+
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.last = value
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return histogram as a dict."""
+
+        buckets = {
+            f"le_{bound}": count for bound, count in zip(self.buckets, self.counts)
+        }
+        return {
+            "count": self.count,
+            "total": self.total,
+            "last": self.last,
+            "buckets": {**buckets, "inf": self.counts[-1]},
+        }
+
+
+class MetricsRegistry:
+    """Counters and histograms shared by the clients and coordinator of an entry."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Increment counter."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(
+        self, name: str, value: float, buckets: Tuple[float, ...] = LATENCY_BUCKETS
+    ) -> None:
+        """Add observation to histogram, creating it with buckets if new."""
+
+        if (histogram := self.histograms.get(name)) is None:
+            histogram = self.histograms[name] = Histogram(buckets)
+        histogram.observe(value)
+
+    def counter(self, name: str) -> int:
+        """Return value of counter."""
+        return self.counters.get(name, 0)
+
+    def last(self, name: str) -> float or None:
+        """Return last observation of histogram."""
+
+        histogram = self.histograms.get(name)
+        return histogram.last if histogram else None
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return snapshot of every metric."""
+
+        return {
+            "counters": dict(self.counters),
+            "histograms": {
+                name: histogram.as_dict() for name, histogram in self.histograms.items()
+            },
+        }
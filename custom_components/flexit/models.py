@@ -1,7 +1,8 @@
 """Asynchronous Python client for Flexit."""
 
 from enum import Enum
-from typing import Any, Dict, List
+import logging
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import attr
 
@@ -111,69 +112,147 @@ class UtilClass:
 
     def int_device(self, path: str) -> int:
         """Get int from path."""
-        return int(self.str_device(path))
+        return int(float(self.str_device(path)))
+
+
+# Converters take the value object of a datapoint
+Converter = Callable[[Dict[str, Any]], Any]
+# Datapoint paths, or response keys of a plant, and the fields decoded from them
+SensorDecoder = Tuple[Tuple[str, Tuple[Tuple[str, Converter], ...]], ...]
+
+# Null*Off*Away*Home*High*Cocker hood*Fire place*Forced ventilation
+VENTILATION_MODES: Dict[int, str] = {
+    0: MODE_NULL,
+    1: MODE_OFF,
+    2: MODE_AWAY,
+    3: MODE_HOME,
+    4: MODE_HIGH,
+    5: MODE_COOKER_HOOD,
+    6: MODE_FIREPLACE,
+    7: MODE_FORCED_VENTILATION,
+}
+CALENDAR_VENTILATION_MODES: Dict[int, str] = {
+    2: MODE_CAL_AWAY,
+    3: MODE_CAL_HOME,
+    4: MODE_CAL_BOOST,
+}
+CALENDAR_PRIORITY = 15
+
+
+def _float(value: Dict[str, Any]) -> float:
+    """Get float rounded to two decimals."""
+    return round(float(value[VALUE]), 2)
+
+
+def _int(value: Dict[str, Any]) -> int:
+    """Get int, also when sent as a decimal string."""
+    return int(float(value[VALUE]))
+
+
+def _bool(value: Dict[str, Any]) -> bool:
+    """Get bool."""
+    return bool(value[VALUE])
+
+
+def _is_heating(value: Dict[str, Any]) -> bool:
+    """Get electric heater status."""
+    return _int(value) == 1
+
+
+def _calendar_active(value: Dict[str, Any]) -> bool:
+    """Get state of calendar from the priority of the mode."""
+    return value[PRESENT_PRIORITY] == CALENDAR_PRIORITY
+
+
+def _ventilation_mode(value: Dict[str, Any]) -> str:
+    """Get ventilation mode."""
+
+    ventilation_int = _int(value)
+    calendar_active = _calendar_active(value)
+    modes = CALENDAR_VENTILATION_MODES if calendar_active else VENTILATION_MODES
+
+    return modes.get(
+        ventilation_int,
+        f"Unknown mode: {str(ventilation_int)} Calendar: {str(calendar_active)}",
+    )
+
+
+# Datapoint path and the fields decoded from it
+SENSOR_DECODERS: SensorDecoder = (
+    (HOME_AIR_TEMPERATURE_PATH, (("home_air_temperature", _float),)),
+    (AWAY_AIR_TEMPERATURE_PATH, (("away_air_temperature", _float),)),
+    (OUTSIDE_AIR_TEMPERATURE_PATH, (("outside_air_temperature", _float),)),
+    (SUPPLY_AIR_TEMPERATURE_PATH, (("supply_air_temperature", _float),)),
+    (EXHAUST_AIR_TEMPERATURE_PATH, (("exhaust_air_temperature", _float),)),
+    (EXTRACT_AIR_TEMPERATURE_PATH, (("extract_air_temperature", _float),)),
+    (ROOM_TEMPERATURE_PATH, (("room_temperature", _float),)),
+    (HEATER_PATH, (("electric_heater", _is_heating),)),
+    (
+        MODE_HOME_HIGH_CAL_PUT_PATH,
+        (
+            ("ventilation_mode", _ventilation_mode),
+            ("calendar_active", _calendar_active),
+        ),
+    ),
+    (FILTER_OPERATING_TIME_PATH, (("filter_operating_time", _int),)),
+    (FILTER_TIME_FOR_EXCHANGE_PATH, (("filter_time_for_exchange", _int),)),
+    (HEAT_EXCHANGER_SPEED_PATH, (("heat_exchanger_speed", _int),)),
+    (SUPPLY_FAN_SPEED_PATH, (("supply_fan_speed", _int),)),
+    (SUPPLY_FAN_CONTROL_SIGNAL_PATH, (("supply_fan_control_signal", _int),)),
+    (EXTRACT_FAN_SPEED_PATH, (("extract_fan_speed", _int),)),
+    (EXTRACT_FAN_CONTROL_SIGNAL_PATH, (("extract_fan_control_signal", _int),)),
+    (ADDITIONAL_HEATER_PATH, (("additional_heater", _int),)),
+    (ALARM_CODE_A_PATH, (("alarm_code_a", _int),)),
+    (ALARM_CODE_B_PATH, (("alarm_code_b", _int),)),
+    (FIREPLACE_DURATION_PATH, (("fireplace_duration", _int),)),
+    (BOOST_DURATION_PATH, (("boost_duration", _int),)),
+    (AWAY_DELAY_PATH, (("away_delay", _int),)),
+    (CALENDAR_TEMPORARY_OVERRIDE_PATH, (("calendar_temporary_override", _bool),)),
+)
 
-    def _str_sensor(self, path: str) -> str:
-        """Get string from path."""
-        return self.data[VALUES][f"{self.plant}{path}"][VALUE][VALUE]
 
-    def present_priority(self, path: str) -> str:
-        """Get present priority."""
-        return self.data[VALUES][f"{self.plant}{path}"][VALUE][PRESENT_PRIORITY]
+# Fields derived from other fields rather than decoded from a datapoint
+DERIVED_FIELDS: Dict[str, Tuple[str, ...]] = {
+    "dirty_filter": ("filter_operating_time", "filter_time_for_exchange"),
+}
 
-    def calendar_active(self, path: str) -> str:
-        """Get state of calendar."""
-        return {15: True}.get(self.present_priority(path), False)
 
-    def int_sensor(self, path: str) -> int:
-        """Get int from path."""
-        return int(self._str_sensor(path))
-
-    def bool_sensor(self, path: str) -> int:
-        """Get bool from path."""
-        return bool(self._str_sensor(path))
-
-    def float_sensor(self, path: str) -> float:
-        """Get float from path."""
-        return round(float(self._str_sensor(path)), 2)
-
-    def dirty_filter(self, operating_time: int, change_interval: int) -> bool:
-        """Get filter status based on hours operated."""
-        return True if operating_time >= change_interval else False
-
-    def is_heating(self, heater_int: int) -> bool:
-        """Get electric heater status from integer."""
-        return True if heater_int == 1 else False
-
-    def ventilation_mode(self, ventilation_int: int, calendar_active: bool) -> str:
-        """Get ventilation mode from integer."""
-
-        if calendar_active:
-            mode = {
-                2: MODE_CAL_AWAY,
-                3: MODE_CAL_HOME,
-                4: MODE_CAL_BOOST,
-            }
-        else:
-            # Null*Off*Away*Home*High*Cocker hood*Fire place*Forced ventilation
-            mode = {
-                0: MODE_NULL,
-                1: MODE_OFF,
-                2: MODE_AWAY,
-                3: MODE_HOME,
-                4: MODE_HIGH,
-                5: MODE_COOKER_HOOD,
-                6: MODE_FIREPLACE,
-                7: MODE_FORCED_VENTILATION,
-            }
-
-        return mode.get(
-            ventilation_int,
-            f"Unknown mode: {str(ventilation_int)} Calendar: {str(calendar_active)}",
-        )
+def field_paths(fields: Iterable[str]) -> List[str]:
+    """Return paths of the datapoints fields are decoded from."""
+
+    wanted = set(fields)
+    for field in list(wanted):
+        wanted.update(DERIVED_FIELDS.get(field, ()))
+    return [
+        path
+        for path, converters in SENSOR_DECODERS
+        if any(field in wanted for field, _ in converters)
+    ]
+
+
+def path_fields(paths: Iterable[str]) -> List[str]:
+    """Return fields decoded from the datapoints of paths, or derived from them."""
+
+    read = set(paths)
+    fields = [
+        field
+        for path, converters in SENSOR_DECODERS
+        if path in read
+        for field, _ in converters
+    ]
+    return fields + [
+        field
+        for field, sources in DERIVED_FIELDS.items()
+        if any(source in fields for source in sources)
+    ]
+
 
+def compile_sensor_decoder(plant: str) -> SensorDecoder:
+    """Return decoder table with the response keys of plant."""
+    return tuple((f"{plant}{path}", fields) for path, fields in SENSOR_DECODERS)
 
-@attr.s(auto_attribs=True)
+
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class FlexitToken:
     """Class represeting Token."""
 
@@ -193,14 +272,14 @@ class FlexitToken:
         return FlexitToken(
             access_token=data["access_token"],
             token_type=data["token_type"],
-            expires_in=data["expires_in"],
+            expires_in=int(data["expires_in"]),
             user_name=data["userName"],
             issued=data[".issued"],
             expires=data[".expires"],
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class FlexitSensorsResponse:
     """Class representing FlexitInfo."""
 
@@ -214,8 +293,8 @@ class FlexitSensorsResponse:
     ventilation_mode: str
     electric_heater: bool
     dirty_filter: bool
-    filter_operating_time: str
-    filter_time_for_exchange: str
+    filter_operating_time: int
+    filter_time_for_exchange: int
     alarm_code_a: int
     alarm_code_b: int
 
@@ -234,51 +313,31 @@ class FlexitSensorsResponse:
     calendar_temporary_override: bool
 
     @staticmethod
-    def from_dict(plant: str, data: Dict[str, Any]) -> "FlexitSensorsResponse":
-        """Transform response to FlexitSensorsResponse."""
-
-        LOGGER.debug("FlexitSensorsResponse. plant=%s. data=%s", plant, data)
-
-        util = UtilClass(data=data, plant=plant)
-
-        return FlexitSensorsResponse(
-            home_air_temperature=util.float_sensor(HOME_AIR_TEMPERATURE_PATH),
-            away_air_temperature=util.float_sensor(AWAY_AIR_TEMPERATURE_PATH),
-            outside_air_temperature=util.float_sensor(OUTSIDE_AIR_TEMPERATURE_PATH),
-            supply_air_temperature=util.float_sensor(SUPPLY_AIR_TEMPERATURE_PATH),
-            exhaust_air_temperature=util.float_sensor(EXHAUST_AIR_TEMPERATURE_PATH),
-            extract_air_temperature=util.float_sensor(EXTRACT_AIR_TEMPERATURE_PATH),
-            room_temperature=util.float_sensor(ROOM_TEMPERATURE_PATH),
-            electric_heater=util.is_heating(util.int_sensor(HEATER_PATH)),
-            ventilation_mode=util.ventilation_mode(
-                util.int_sensor(MODE_HOME_HIGH_CAL_PUT_PATH),
-                util.calendar_active(MODE_HOME_HIGH_CAL_PUT_PATH),
-            ),
-            filter_operating_time=util.int_sensor(FILTER_OPERATING_TIME_PATH),
-            filter_time_for_exchange=util.int_sensor(FILTER_TIME_FOR_EXCHANGE_PATH),
-            dirty_filter=util.dirty_filter(
-                util.int_sensor(FILTER_OPERATING_TIME_PATH),
-                util.int_sensor(FILTER_TIME_FOR_EXCHANGE_PATH),
-            ),
-            heat_exchanger_speed=util.int_sensor(HEAT_EXCHANGER_SPEED_PATH),
-            supply_fan_speed=util.int_sensor(SUPPLY_FAN_SPEED_PATH),
-            supply_fan_control_signal=util.int_sensor(SUPPLY_FAN_CONTROL_SIGNAL_PATH),
-            extract_fan_speed=util.int_sensor(EXTRACT_FAN_SPEED_PATH),
-            extract_fan_control_signal=util.int_sensor(EXTRACT_FAN_CONTROL_SIGNAL_PATH),
-            additional_heater=util.int_sensor(ADDITIONAL_HEATER_PATH),
-            alarm_code_a=util.int_sensor(ALARM_CODE_A_PATH),
-            alarm_code_b=util.int_sensor(ALARM_CODE_B_PATH),
-            fireplace_duration=util.int_sensor(FIREPLACE_DURATION_PATH),
-            boost_duration=util.int_sensor(BOOST_DURATION_PATH),
-            away_delay=util.int_sensor(AWAY_DELAY_PATH),
-            calendar_temporary_override=util.bool_sensor(
-                CALENDAR_TEMPORARY_OVERRIDE_PATH
-            ),
-            calendar_active=util.calendar_active(MODE_HOME_HIGH_CAL_PUT_PATH),
+    def from_dict(
+        plant: str, data: Dict[str, Any], decoder: Optional[SensorDecoder] = None
+    ) -> "FlexitSensorsResponse":
+        """Transform response to FlexitSensorsResponse in one pass over values.
+
+        decoder is the table compiled for plant, compiled here if not given.
+        """
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("FlexitSensorsResponse. plant=%s. data=%s", plant, data)
+
+        values = data[VALUES]
+        fields: Dict[str, Any] = {}
+        for key, converters in decoder or compile_sensor_decoder(plant):
+            value = values[key][VALUE]
+            for field, convert in converters:
+                fields[field] = convert(value)
+
+        fields["dirty_filter"] = (
+            fields["filter_operating_time"] >= fields["filter_time_for_exchange"]
         )
+        return FlexitSensorsResponse(**fields)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class FlexitDeviceInfo:
     """Class representing FlexitDeviceInfo."""
 
@@ -315,7 +374,7 @@ class FlexitDeviceInfo:
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class FlexitPlantItem:
     """Class representing FlexitPlantItem."""
 
@@ -330,7 +389,7 @@ class FlexitPlantItem:
         return FlexitPlantItem(id=data["id"])
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class FlexitPlants:
     """Class representing FlexitPlants."""
 
@@ -353,7 +412,7 @@ class FlexitPlants:
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class FlexitSensorsResponseStatus:
     """Class represetning FlexitSensorsResponseStatus."""
 
@@ -16,13 +16,18 @@ from homeassistant.components.number.const import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfTime
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN as FLEXIT_DOMAIN
+from .const import (
+    AWAY_DELAY_PATH,
+    BOOST_DURATION_PATH,
+    DOMAIN as FLEXIT_DOMAIN,
+    FIREPLACE_DURATION_PATH,
+)
 from .coordinator import FlexitDataUpdateCoordinator
+from .entity import FlexitEntity
 from .models import Entity
 
 
@@ -75,47 +80,48 @@ async def async_setup_entry(
 
     coordinator: FlexitDataUpdateCoordinator = hass.data[FLEXIT_DOMAIN][entry.entry_id]
 
-    for description in NUMBERS:
-        if description.key == Entity.AWAY_DELAY.value:
-            async_add_entities([FlexitAwayDelayNumber(coordinator, description)])
-        if description.key == Entity.BOOST_DURATION.value:
-            async_add_entities([FlexitBoostDurationNumber(coordinator, description)])
-        if description.key == Entity.FIREPLACE_DURATION.value:
-            async_add_entities(
-                [FlexitFireplaceDurationNumber(coordinator, description)]
-            )
-
-
-class FlexitNumber(CoordinatorEntity, NumberEntity):
+    for plant_id in coordinator.plant_ids:
+        for description in NUMBERS:
+            if description.key == Entity.AWAY_DELAY.value:
+                async_add_entities(
+                    [FlexitAwayDelayNumber(coordinator, description, plant_id)]
+                )
+            if description.key == Entity.BOOST_DURATION.value:
+                async_add_entities(
+                    [FlexitBoostDurationNumber(coordinator, description, plant_id)]
+                )
+            if description.key == Entity.FIREPLACE_DURATION.value:
+                async_add_entities(
+                    [FlexitFireplaceDurationNumber(coordinator, description, plant_id)]
+                )
+
+
+class FlexitNumber(FlexitEntity, NumberEntity):
     """Define a Flexit entity."""
 
     sensor_data: Any
-    coordinator: FlexitDataUpdateCoordinator
     entity_description: FlexitNumberEntityDescription
+    # Datapoint the value is written to
+    write_path: str
 
     def __init__(
         self,
         coordinator: FlexitDataUpdateCoordinator,
         description: FlexitNumberEntityDescription,
+        plant_id: str,
     ) -> None:
         """Initialize."""
 
-        super().__init__(coordinator)
-        self.coordinator = coordinator
-        self.entity_description = description
-        self._attr_unique_id = f"{description.key}"
-        self._attr_device_info = coordinator._attr_device_info
+        super().__init__(coordinator, description, plant_id)
 
         self._attr_native_step = 1
         self._attr_mode: Literal["auto", "slider", "box"] = NumberMode.AUTO
         self._attr_native_min_value = description.native_min_value or DEFAULT_MIN_VALUE
         self._attr_native_max_value = description.native_max_value or DEFAULT_MAX_VALUE
 
-        self.update_from_data()
-
     def update_from_data(self) -> None:
         """Update attributes based on new data."""
-        self.sensor_data = self.coordinator.data.__getattribute__(
+        self.sensor_data = self.data.__getattribute__(
             self.entity_description.key
         )
 
@@ -123,39 +129,27 @@ class FlexitNumber(CoordinatorEntity, NumberEntity):
     def native_value(self) -> float:
         return self.sensor_data
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
+    async def async_set_native_value(self, value: float) -> None:
+        """Show the value at once and write it once it settles."""
 
+        self.async_write_field(self.entity_description.key, self.write_path, int(value))
         self.update_from_data()
-        super()._handle_coordinator_update()
+        self.async_write_ha_state()
 
 
 class FlexitFireplaceDurationNumber(FlexitNumber):
     """Define a Flexit entity."""
 
-    async def async_set_native_value(self, value: float) -> None:
-        """Update the current value."""
-        if await self.coordinator.api.set_fireplace_duration(int(value)):
-            self.sensor_data = value
-        await self.coordinator.async_request_refresh()
+    write_path = FIREPLACE_DURATION_PATH
 
 
 class FlexitBoostDurationNumber(FlexitNumber):
     """Define a Flexit entity."""
 
-    async def async_set_native_value(self, value: float) -> None:
-        """Update the current value."""
-        if await self.coordinator.api.set_boost_duration(int(value)):
-            self.sensor_data = value
-        await self.coordinator.async_request_refresh()
+    write_path = BOOST_DURATION_PATH
 
 
 class FlexitAwayDelayNumber(FlexitNumber):
     """Define a Flexit entity."""
 
-    async def async_set_native_value(self, value: float) -> None:
-        """Update the current value."""
-        if await self.coordinator.api.set_away_delay(int(value)):
-            self.sensor_data = value
-        await self.coordinator.async_request_refresh()
+    write_path = AWAY_DELAY_PATH
@@ -0,0 +1,57 @@
+"""Compiled datapoint fetches for Flexit."""
+
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+import urllib.parse
+
+import attr
+
+from .const import FILTER_PATH, MAX_FILTER_URL_LENGTH
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class FetchPlan:
+    """Class representing a compiled fetch of datapoints for one or more plants."""
+
+    plant_ids: Tuple[str, ...]
+    paths: Tuple[str, ...]
+    keys: Tuple[str, ...]
+    url: str
+
+    @staticmethod
+    def compile(
+        plant_ids: Sequence[str], paths: Sequence[str], filter_url: str = FILTER_PATH
+    ) -> "FetchPlan":
+        """Build the filter url and response keys for paths once."""
+
+        keys = tuple(f"{plant_id}{path}" for plant_id in plant_ids for path in paths)
+        datapoints = ",".join(f'{{"DataPoints":"{key}"}}' for key in keys)
+
+        return FetchPlan(
+            plant_ids=tuple(plant_ids),
+            paths=tuple(paths),
+            keys=keys,
+            url=f"{filter_url}{urllib.parse.quote(f'[{datapoints}]')}",
+        )
+
+    @staticmethod
+    def compile_many(
+        plant_ids: Sequence[str], paths: Sequence[str], filter_url: str = FILTER_PATH
+    ) -> List["FetchPlan"]:
+        """Fetch paths for every plant in as few requests as the url length allows."""
+
+        plans: List[FetchPlan] = []
+        chunk: List[str] = []
+        for plant_id in plant_ids:
+            if chunk:
+                plan = FetchPlan.compile([*chunk, plant_id], paths, filter_url)
+                if len(plan.url) <= MAX_FILTER_URL_LENGTH:
+                    chunk.append(plant_id)
+                    continue
+                plans.append(FetchPlan.compile(chunk, paths, filter_url))
+            chunk = [plant_id]
+
+        if chunk:
+            plans.append(FetchPlan.compile(chunk, paths, filter_url))
+        return plans
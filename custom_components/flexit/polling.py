@@ -0,0 +1,145 @@
+"""Adaptive poll interval for Flexit."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+from typing import Any, Collection, Dict, Optional, Tuple
+
+from .const import MODE_FIREPLACE, MODE_FORCED_VENTILATION
+from .models import FlexitSensorsResponse
+from .throttle import RequestBudget
+
+# Poll at the minimum interval this long after a write
+WRITE_WINDOW = timedelta(minutes=5)
+
+# Modes that end by themselves after a duration
+TIMED_MODES = (MODE_FIREPLACE, MODE_FORCED_VENTILATION)
+
+# Fields describing what the unit is doing, as opposed to telemetry
+STATE_FIELDS = (
+    "ventilation_mode",
+    "electric_heater",
+    "calendar_active",
+    "calendar_temporary_override",
+    "home_air_temperature",
+    "away_air_temperature",
+    "alarm_code_a",
+    "alarm_code_b",
+    "dirty_filter",
+)
+
+# Temperatures closer than this are considered unchanged
+TEMPERATURE_RESOLUTION = 0.5
+TEMPERATURE_FIELDS = (
+    "room_temperature",
+    "outside_air_temperature",
+    "supply_air_temperature",
+    "extract_air_temperature",
+    "exhaust_air_temperature",
+)
+
+
+class AdaptivePollInterval:
+    """Choose the next poll interval from what the units are doing.
+
+    Polls at the minimum interval after writes, during timed modes not counted
+    down locally and when state changes. Backs off exponentially towards the
+    maximum interval while successive snapshots are unchanged, and uses the
+    base interval otherwise. Polls no faster than the base interval while the
+    weekly request budget runs low.
+    """
+
+    def __init__(
+        self,
+        base: timedelta,
+        minimum: timedelta,
+        maximum: timedelta,
+        budget: Optional[RequestBudget] = None,
+    ) -> None:
+        """Initialize."""
+
+        self.minimum = min(minimum, base)
+        self.maximum = max(maximum, base)
+        self.base = base
+        self.current = base
+        self.budget = budget
+
+        self._last_write: Optional[float] = None
+
+    @property
+    def fastest(self) -> timedelta:
+        """Return the shortest interval the request budget allows."""
+
+        if self.budget is not None and self.budget.low:
+            return self.base
+        return self.minimum
+
+    def note_write(self) -> None:
+        """Record that a value was written to a unit."""
+        self._last_write = time.monotonic()
+
+    @property
+    def recently_written(self) -> bool:
+        """Return true if a value was written within the write window."""
+        return (
+            self._last_write is not None
+            and time.monotonic() - self._last_write < WRITE_WINDOW.total_seconds()
+        )
+
+    def next_interval(
+        self,
+        previous: Optional[Dict[str, FlexitSensorsResponse]],
+        data: Dict[str, FlexitSensorsResponse],
+        counted_down: Collection[str] = (),
+    ) -> timedelta:
+        """Return interval until the poll after data was received.
+
+        counted_down holds plants whose timed mode ends at a known time, when
+        it is read back, so they need no fast polls meanwhile.
+        """
+
+        if (
+            self.recently_written
+            or any(
+                plant.ventilation_mode in TIMED_MODES and plant_id not in counted_down
+                for plant_id, plant in data.items()
+            )
+            or (previous is not None and self._state(previous) != self._state(data))
+        ):
+            interval = self.fastest
+        elif self._fingerprint(previous) == self._fingerprint(data):
+            interval = max(self.current, self.base) * 2
+        else:
+            interval = self.base
+
+        self.current = max(self.fastest, min(self.maximum, interval))
+        return self.current
+
+    @staticmethod
+    def _state(data: Optional[Dict[str, FlexitSensorsResponse]]) -> Any:
+        """Return the state fields of every plant."""
+
+        if data is None:
+            return None
+        return {
+            plant_id: tuple(getattr(plant, field) for field in STATE_FIELDS)
+            for plant_id, plant in data.items()
+        }
+
+    @staticmethod
+    def _fingerprint(
+        data: Optional[Dict[str, FlexitSensorsResponse]]
+    ) -> Optional[Dict[str, Tuple[Any, ...]]]:
+        """Return state and coarse temperatures of every plant."""
+
+        if data is None:
+            return None
+        return {
+            plant_id: tuple(getattr(plant, field) for field in STATE_FIELDS)
+            + tuple(
+                round(getattr(plant, field) / TEMPERATURE_RESOLUTION)
+                for field in TEMPERATURE_FIELDS
+            )
+            for plant_id, plant in data.items()
+        }
@@ -0,0 +1,122 @@
+"""Planned transitions between ventilation modes for Flexit."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+import attr
+
+from homeassistant.components.climate.const import (
+    PRESET_AWAY,
+    PRESET_BOOST,
+    PRESET_HOME,
+)
+
+from .api import FlexitApiClient
+from .const import (
+    LOGGER,
+    MODE_AWAY,
+    MODE_AWAY_DELAYED,
+    MODE_DATAPOINTS,
+    MODE_FIREPLACE,
+    MODE_FORCED_VENTILATION,
+    MODE_HIGH,
+    MODE_HOME,
+    MODE_HOME_HIGH_CAL_PUT_PATH,
+    PRESET_BOOST_TEMP,
+    PRESET_FIREPLACE,
+)
+
+# Mode entered by each preset that can be set
+PRESET_MODES: Dict[str, str] = {
+    PRESET_HOME: MODE_HOME,
+    PRESET_AWAY: MODE_AWAY,
+    PRESET_BOOST: MODE_HIGH,
+    PRESET_BOOST_TEMP: MODE_FORCED_VENTILATION,
+    PRESET_FIREPLACE: MODE_FIREPLACE,
+}
+
+# Modes run for a duration, entered and left by writing the same toggle
+TIMED_MODES = (MODE_FIREPLACE, MODE_FORCED_VENTILATION)
+# Modes written as the base mode the unit returns to
+BASE_MODES = (MODE_HOME, MODE_HIGH)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class PresetTransition:
+    """Class representing the writes that move a unit from one mode to another.
+
+    order holds (before, after) pairs of paths, the rest is written at once.
+    rollback holds the write undoing each write that can be undone.
+    """
+
+    writes: Tuple[Tuple[str, Any], ...] = ()
+    order: Tuple[Tuple[str, str], ...] = ()
+    rollback: Tuple[Tuple[str, Any], ...] = ()
+
+    async def async_apply(self, api: FlexitApiClient) -> bool:
+        """Write the transition, undoing the writes done if one fails."""
+
+        results = await api.update_many(dict(self.writes), self.order)
+        if all(results.values()):
+            return True
+
+        undo = {path: value for path, value in self.rollback if results[path]}
+        LOGGER.error(
+            "Failed to write %s, rolling back %s",
+            [path for path, success in results.items() if not success],
+            list(undo),
+        )
+        if undo:
+            await api.update_many(
+                undo,
+                [
+                    (after, before)
+                    for before, after in self.order
+                    if before in undo and after in undo
+                ],
+            )
+        return False
+
+
+def plan_transition(
+    current_mode: str, calendar_active: bool, target_mode: str
+) -> PresetTransition:
+    """Return the fewest writes, in the fewest rounds, from current to target mode.
+
+    A running timed mode or away is left before the target is entered, and
+    the write leaving a timed mode goes before one entering the other.
+    """
+
+    if current_mode == target_mode:
+        return PresetTransition()
+
+    writes = []
+    order = []
+    rollback = []
+
+    leave_path: Optional[str] = None
+    if current_mode in TIMED_MODES:
+        leave_path, value = MODE_DATAPOINTS[current_mode]
+        writes.append((leave_path, value))
+        # Toggling again starts the mode over, which is as close as it gets
+        rollback.append((leave_path, value))
+    elif current_mode == MODE_AWAY:
+        writes.append(MODE_DATAPOINTS[MODE_AWAY_DELAYED])
+        rollback.append(MODE_DATAPOINTS[MODE_AWAY])
+
+    enter_path, value = MODE_DATAPOINTS[target_mode]
+    writes.append((enter_path, value))
+    if target_mode in TIMED_MODES:
+        rollback.append((enter_path, value))
+        if leave_path is not None:
+            order.append((leave_path, enter_path))
+    elif target_mode == MODE_AWAY:
+        rollback.append(MODE_DATAPOINTS[MODE_AWAY_DELAYED])
+    elif calendar_active:
+        # Writing null hands the mode back to the calendar
+        rollback.append((MODE_HOME_HIGH_CAL_PUT_PATH, None))
+    elif current_mode in BASE_MODES:
+        rollback.append(MODE_DATAPOINTS[current_mode])
+
+    return PresetTransition(tuple(writes), tuple(order), tuple(rollback))
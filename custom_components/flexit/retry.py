@@ -0,0 +1,106 @@
+"""Retry policy and circuit breaker for the Flexit client."""
+
+from __future__ import annotations
+
+import random
+import time
+from typing import Optional
+
+import attr
+
+from .const import LOGGER
+
+
+@attr.s(auto_attribs=True)
+class RetryPolicy:
+    """Class representing how requests are retried."""
+
+    attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    timeout: float = 20.0
+    jitter: bool = True
+
+    def delay(self, attempt: int) -> float:
+        """Return seconds to wait before retrying after attempt (0-based)."""
+
+        delay = min(self.max_delay, self.base_delay * 2**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    """Fail fast while the API keeps failing."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 60) -> None:
+        """Initialize."""
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.state: str = self.CLOSED
+        self.failures: int = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def retry_in(self) -> float:
+        """Return seconds until a trial request is let through."""
+
+        if self.state != self.OPEN:
+            return 0
+        return max(0, self.opened_at + self.reset_timeout - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """Return true if a request may be sent."""
+
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.OPEN and self.retry_in == 0:
+            # Let a single trial request through
+            self.state = self.HALF_OPEN
+            return True
+        return False
+
+    def allow_retry(self, trial: bool) -> bool:
+        """Return true if a request let through may be retried.
+
+        Retries stop once the circuit opened, but a trial keeps its own.
+        """
+
+        return self.state == (self.HALF_OPEN if trial else self.CLOSED)
+
+    def record_success(self) -> None:
+        """Record a successful request."""
+
+        if self.state != self.CLOSED:
+            LOGGER.info("Flexit API recovered, closing circuit")
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+
+    def record_aborted(self) -> None:
+        """Record a trial request that ended without an answer.
+
+        The trial is let through again after the reset timeout.
+        """
+
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                LOGGER.warning(
+                    "Flexit API failed %s times, pausing requests for %s seconds",
+                    self.failures,
+                    self.reset_timeout,
+                )
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
@@ -0,0 +1,164 @@
+"""Weekly calendar schedule of Flexit units, learned from the modes polled."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import attr
+
+from homeassistant.util import dt as dt_util
+
+from .models import FlexitSensorsResponse
+
+WEEK = 7 * 24 * 3600
+
+# Switches known within this many seconds are polled just after, every week
+PRECISION = 15
+# Seconds after a switch before the unit is polled for it
+POLL_DELAY = 15
+# Polls this many seconds past a switch still tell if it happened
+MISS_WINDOW = 300
+# Switches not seen this many weeks in a row are forgotten
+MAX_MISSES = 2
+
+
+def second_of_week(moment: datetime) -> int:
+    """Return second of the local week moment is at, from Monday midnight."""
+
+    local = dt_util.as_local(moment)
+    return (
+        local.weekday() * 86400 + local.hour * 3600 + local.minute * 60 + local.second
+    )
+
+
+@attr.s(auto_attribs=True)
+class CalendarTransition:
+    """Class representing a switch of the calendar to a mode, once a week.
+
+    The switch is known to happen within length seconds from start, seconds
+    of the week. Polls inside the window narrow it down.
+    """
+
+    mode: str
+    start: int
+    length: int
+    misses: int = 0
+
+    def offset(self, second: int) -> int:
+        """Return seconds second is after start of the window."""
+        return (second - self.start) % WEEK
+
+    def overlaps(self, start: int, length: int) -> bool:
+        """Return true if window of length seconds from start overlaps this one."""
+        return self.offset(start) < self.length or (self.start - start) % WEEK < length
+
+    def observe(self, second: int, mode: str, recent_second: Optional[int]) -> bool:
+        """Narrow the window by mode polled at second, returning true if changed.
+
+        The first poll just after the window tells if the switch happened.
+        """
+
+        offset = self.offset(second)
+        if offset < self.length:
+            if mode == self.mode:
+                self.length = offset
+            else:
+                self.start = second
+                self.length -= offset
+            return True
+
+        if not self._just_after(offset):
+            return False
+        if mode == self.mode:
+            changed = self.misses != 0
+            self.misses = 0
+            return changed
+        if recent_second is not None and self._just_after(self.offset(recent_second)):
+            # Counted on the poll before
+            return False
+        self.misses += 1
+        return True
+
+    def _just_after(self, offset: int) -> bool:
+        """Return true if offset is just after the window."""
+        return self.length <= offset < self.length + MISS_WINDOW
+
+    @property
+    def probe(self) -> int:
+        """Return second of the week to poll at, narrowing or catching the switch."""
+
+        if self.length <= PRECISION:
+            return (self.start + self.length + POLL_DELAY) % WEEK
+        return (self.start + self.length // 2) % WEEK
+
+
+class CalendarSchedule:
+    """Calendar switches of each plant, learned from the modes polled.
+
+    A calendar mode differing from the one polled before is a switch within
+    the time between the polls. Polls in the middle of that window halve it,
+    until it is known to within seconds and is polled just after every week.
+    """
+
+    def __init__(
+        self, transitions: Optional[Dict[str, List[CalendarTransition]]] = None
+    ) -> None:
+        """Initialize."""
+
+        self.transitions: Dict[str, List[CalendarTransition]] = transitions or {}
+
+        # Time and calendar mode of the last poll of each plant
+        self._last: Dict[str, Tuple[datetime, Optional[str]]] = {}
+
+    def observe(
+        self, plant_id: str, data: FlexitSensorsResponse, now: datetime
+    ) -> bool:
+        """Learn from the mode of plant at now, returning true if switches changed."""
+
+        mode = data.ventilation_mode if data.calendar_active else None
+        last = self._last.get(plant_id)
+        self._last[plant_id] = (now, mode)
+        if mode is None:
+            return False
+
+        second = second_of_week(now)
+        recent_second = (
+            second_of_week(last[0])
+            if last is not None and (now - last[0]).total_seconds() < MISS_WINDOW
+            else None
+        )
+        transitions = self.transitions.setdefault(plant_id, [])
+        changed = False
+        for transition in list(transitions):
+            changed |= transition.observe(second, mode, recent_second)
+            if transition.misses >= MAX_MISSES:
+                transitions.remove(transition)
+
+        if last is None or last[1] in (None, mode):
+            return changed
+        length = int((now - last[0]).total_seconds())
+        if length >= WEEK:
+            return changed
+
+        start = second_of_week(last[0])
+        if not any(
+            transition.mode == mode and transition.overlaps(start, length)
+            for transition in transitions
+        ):
+            transitions.append(CalendarTransition(mode, start, length))
+            changed = True
+        return changed
+
+    def next_poll(self, now: datetime) -> Optional[datetime]:
+        """Return when to poll next for a switch of any plant, if one is known."""
+
+        second = second_of_week(now)
+        offsets = [
+            (transition.probe - second) % WEEK or WEEK
+            for transitions in self.transitions.values()
+            for transition in transitions
+        ]
+        if not offsets:
+            return None
+        return now + timedelta(seconds=min(offsets))
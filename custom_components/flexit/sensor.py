@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-from typing import Any, cast
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, cast
 
 from homeassistant.components.sensor import (
     SensorEntity,
@@ -11,19 +13,23 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import PERCENTAGE, UnitOfTemperature
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import PERCENTAGE, UnitOfTemperature, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN as FLEXIT_DOMAIN
+from .const import DOMAIN as FLEXIT_DOMAIN, MODE_FIREPLACE, MODE_FORCED_VENTILATION
 from .coordinator import FlexitDataUpdateCoordinator
+from .entity import FlexitEntity
+from .metrics import POLL_LATENCY
 from .models import Entity
 
 TEMPERATURE_ICON = "mdi:thermometer"
 FAN_ICON = "mdi:fan"
 HEATING_ICON = "mdi:radiator"
+HEALTH_ICON = "mdi:cloud-check-outline"
+TIMER_ICON = "mdi:timer-outline"
 
 SENSORS: tuple[SensorEntityDescription, ...] = (
     SensorEntityDescription(
@@ -105,6 +111,70 @@ SENSORS: tuple[SensorEntityDescription, ...] = (
 )
 
 
+@dataclass(frozen=True)
+class FlexitHealthSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor of the health of the connection to the Flexit API."""
+
+    value_fn: Callable[[FlexitDataUpdateCoordinator], StateType] = lambda _: None
+
+
+HEALTH_SENSORS: tuple[FlexitHealthSensorEntityDescription, ...] = (
+    FlexitHealthSensorEntityDescription(
+        name="Last Poll Latency",
+        key="last_poll_latency",
+        icon=HEALTH_ICON,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=2,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda coordinator: coordinator.metrics.last(POLL_LATENCY),
+    ),
+    FlexitHealthSensorEntityDescription(
+        name="Poll Success Rate",
+        key="poll_success_rate",
+        icon=HEALTH_ICON,
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda coordinator: coordinator.poll_success_rate,
+    ),
+    FlexitHealthSensorEntityDescription(
+        name="Data Updated",
+        key="data_updated",
+        icon=HEALTH_ICON,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda coordinator: coordinator.last_success_time,
+    ),
+)
+
+
+@dataclass(frozen=True)
+class FlexitTimerSensorEntityDescription(SensorEntityDescription):
+    """Describes a sensor of when a timed mode of a Flexit unit ends."""
+
+    mode: str = MODE_FIREPLACE
+
+
+TIMER_SENSORS: tuple[FlexitTimerSensorEntityDescription, ...] = (
+    FlexitTimerSensorEntityDescription(
+        name="Fireplace Ends",
+        key="fireplace_ends",
+        icon=TIMER_ICON,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        mode=MODE_FIREPLACE,
+    ),
+    FlexitTimerSensorEntityDescription(
+        name="Boost Temporary Ends",
+        key="boost_temporary_ends",
+        icon=TIMER_ICON,
+        device_class=SensorDeviceClass.TIMESTAMP,
+        mode=MODE_FORCED_VENTILATION,
+    ),
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -113,29 +183,37 @@ async def async_setup_entry(
     """Set up the Flexit sensor."""
     coordinator: FlexitDataUpdateCoordinator = hass.data[FLEXIT_DOMAIN][entry.entry_id]
     async_add_entities(
-        FlexitSensor(coordinator, description) for description in SENSORS
+        FlexitSensor(coordinator, description, plant_id)
+        for plant_id in coordinator.plant_ids
+        for description in SENSORS
+    )
+    # The connection is shared by every plant of the entry, so its health is
+    # shown once, on the device of the first plant
+    async_add_entities(
+        FlexitHealthSensor(coordinator, description, coordinator.plant_ids[0])
+        for description in HEALTH_SENSORS
+    )
+    async_add_entities(
+        FlexitTimerSensor(coordinator, description, plant_id)
+        for plant_id in coordinator.plant_ids
+        for description in TIMER_SENSORS
     )
 
 
-class FlexitSensor(CoordinatorEntity, SensorEntity):
+class FlexitSensor(FlexitEntity, SensorEntity):
     """Representation of a Flexit sensor."""
 
-    coordinator: FlexitDataUpdateCoordinator
     sensor_data: Any
 
     def __init__(
         self,
         coordinator: FlexitDataUpdateCoordinator,
         description: SensorEntityDescription,
+        plant_id: str,
     ) -> None:
         """Initialize a Flexit sensor."""
 
-        super().__init__(coordinator)
-        self.coordinator = coordinator
-        self.entity_description = description
-        self._attr_unique_id = f"{description.key}"
-        self._attr_device_info = coordinator._attr_device_info
-        self.update_from_data()
+        super().__init__(coordinator, description, plant_id)
 
     @property
     def native_value(self) -> StateType:
@@ -145,13 +223,53 @@ class FlexitSensor(CoordinatorEntity, SensorEntity):
 
     def update_from_data(self) -> None:
         """Update attributes based on new data."""
-        self.sensor_data = self.coordinator.data.__getattribute__(
+        self.sensor_data = self.data.__getattribute__(
             self.entity_description.key
         )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
 
-        self.update_from_data()
-        super()._handle_coordinator_update()
+class FlexitHealthSensor(FlexitEntity, SensorEntity):
+    """Representation of a sensor of the connection to the Flexit API.
+
+    The connection serves every plant of the entry.
+    """
+
+    entity_description: FlexitHealthSensorEntityDescription
+    data_fields = frozenset()
+    always_update = True
+
+    @property
+    def available(self) -> bool:
+        """Return true, health is known also when polls fail."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state."""
+        return self.entity_description.value_fn(self.coordinator)
+
+
+class FlexitTimerSensor(FlexitEntity, SensorEntity):
+    """Representation of a sensor of when a timed mode ends.
+
+    The end is read once when the mode starts, so the frontend counts down to
+    it without the unit being polled for the time left.
+    """
+
+    entity_description: FlexitTimerSensorEntityDescription
+    data_fields = frozenset()
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for the timers of the plant."""
+
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.timers.async_add_listener(
+                self.plant_id, self.async_write_ha_state
+            )
+        )
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the state."""
+        return self.coordinator.timers.end(self.plant_id, self.entity_description.mode)
@@ -0,0 +1,147 @@
+"""Persistent storage for Flexit."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import attr
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN as FLEXIT_DOMAIN, LOGGER
+from .models import FlexitDeviceInfo, FlexitSensorsResponse
+from .schedule import CalendarTransition
+
+STORAGE_VERSION = 2
+STORAGE_SAVE_DELAY = 60
+
+KEY_CALENDAR = "calendar"
+KEY_DEVICE_INFO = "device_info"
+KEY_SENSOR_DATA = "sensor_data"
+KEY_TOKEN = "token"
+
+
+class _FlexitStorage(Store[Dict[str, Any]]):
+    """Storage of an entry, migrating data saved by older versions."""
+
+    async def _async_migrate_func(
+        self, old_major_version: int, old_minor_version: int, old_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Migrate data to the current version."""
+
+        if old_major_version == 1:
+            # Snapshots were saved for a single plant or with older fields, so
+            # they are read again from the API. The token is still good.
+            return {KEY_TOKEN: old_data.get(KEY_TOKEN)}
+        return old_data
+
+
+class FlexitStore:
+    """Store the last known device info, sensor snapshot and calendar of each plant."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize."""
+
+        self._store = _FlexitStorage(
+            hass, STORAGE_VERSION, f"{FLEXIT_DOMAIN}.{entry_id}"
+        )
+
+        self.device_info: Dict[str, FlexitDeviceInfo] = {}
+        self.sensor_data: Dict[str, FlexitSensorsResponse] = {}
+        self.token: Optional[Dict[str, Any]] = None
+        self.calendar: Dict[str, List[CalendarTransition]] = {}
+
+    async def async_load(self) -> None:
+        """Load stored data."""
+
+        stored = await self._store.async_load() or {}
+
+        self.device_info = self._restore(
+            FlexitDeviceInfo, stored.get(KEY_DEVICE_INFO) or {}
+        )
+        self.sensor_data = self._restore(
+            FlexitSensorsResponse, stored.get(KEY_SENSOR_DATA) or {}
+        )
+        self.token = stored.get(KEY_TOKEN)
+        self.calendar = self._restore_calendar(stored.get(KEY_CALENDAR) or {})
+
+    async def async_remove(self) -> None:
+        """Remove stored data."""
+        await self._store.async_remove()
+
+    @callback
+    def async_save_device_info(self, device_info: Dict[str, FlexitDeviceInfo]) -> None:
+        """Schedule saving device info."""
+
+        self.device_info = device_info
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def async_save_sensor_data(
+        self, sensor_data: Dict[str, FlexitSensorsResponse]
+    ) -> None:
+        """Schedule saving the latest sensor snapshot."""
+
+        self.sensor_data = sensor_data
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def async_save_token(self, token: Dict[str, Any]) -> None:
+        """Schedule saving the access token."""
+
+        self.token = token
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def async_save_calendar(
+        self, calendar: Dict[str, List[CalendarTransition]]
+    ) -> None:
+        """Schedule saving the calendar switches learned."""
+
+        self.calendar = calendar
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return data to save."""
+
+        return {
+            KEY_DEVICE_INFO: self._serialize(self.device_info),
+            KEY_SENSOR_DATA: self._serialize(self.sensor_data),
+            KEY_TOKEN: self.token,
+            KEY_CALENDAR: {
+                plant_id: [attr.asdict(transition) for transition in transitions]
+                for plant_id, transitions in self.calendar.items()
+            },
+        }
+
+    @staticmethod
+    def _serialize(models: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Serialize attrs models per plant."""
+        return {plant_id: attr.asdict(model) for plant_id, model in models.items()}
+
+    @staticmethod
+    def _restore(model: Any, data: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Restore attrs models per plant, ignoring data not fitting them."""
+
+        try:
+            return {plant_id: model(**fields) for plant_id, fields in data.items()}
+        except TypeError as error:
+            LOGGER.debug("Discarding stored %s: %s", model.__name__, error)
+            return {}
+
+    @staticmethod
+    def _restore_calendar(
+        data: Dict[str, List[Dict[str, Any]]]
+    ) -> Dict[str, List[CalendarTransition]]:
+        """Restore calendar switches per plant, ignoring data not fitting them."""
+
+        try:
+            return {
+                plant_id: [CalendarTransition(**fields) for fields in transitions]
+                for plant_id, transitions in data.items()
+            }
+        except TypeError as error:
+            LOGGER.debug("Discarding stored calendar: %s", error)
+            return {}
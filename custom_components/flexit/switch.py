@@ -1,7 +1,6 @@
 """Switch platform for Flexit."""
 
 from __future__ import annotations
-import time
 
 from typing import Any, Tuple
 
@@ -10,13 +9,13 @@ from homeassistant.components.switch import (
     SwitchEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN as FLEXIT_DOMAIN
 from .coordinator import FlexitDataUpdateCoordinator
+from .entity import FlexitEntity
 from .models import Entity
 
 SWITCHES: Tuple[SwitchEntityDescription, ...] = (
@@ -38,29 +37,27 @@ async def async_setup_entry(
 
     coordinator: FlexitDataUpdateCoordinator = hass.data[FLEXIT_DOMAIN][entry.entry_id]
 
-    for description in SWITCHES:
-        async_add_entities([FlexitSwitch(coordinator, description)])
+    async_add_entities(
+        FlexitSwitch(coordinator, description, plant_id)
+        for plant_id in coordinator.plant_ids
+        for description in SWITCHES
+    )
 
 
-class FlexitSwitch(CoordinatorEntity, SwitchEntity):
+class FlexitSwitch(FlexitEntity, SwitchEntity):
     """Representation of a Flexit switch."""
 
     sensor_data: Any
-    coordinator: FlexitDataUpdateCoordinator
 
     def __init__(
         self,
         coordinator: FlexitDataUpdateCoordinator,
         description: SwitchEntityDescription,
+        plant_id: str,
     ) -> None:
         """Initialize a Flexit switch."""
 
-        super().__init__(coordinator)
-        self.coordinator = coordinator
-        self.entity_description = description
-        self._attr_unique_id = f"{description.key}"
-        self._attr_device_info = coordinator._attr_device_info
-        self.update_from_data()
+        super().__init__(coordinator, description, plant_id)
 
     @property
     def is_on(self) -> bool:
@@ -69,26 +66,20 @@ class FlexitSwitch(CoordinatorEntity, SwitchEntity):
 
     def update_from_data(self) -> None:
         """Update attributes based on new data."""
-        self.sensor_data = self.coordinator.data.__getattribute__(
+        self.sensor_data = self.data.__getattribute__(
             self.entity_description.key
         )
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle data update."""
-        self.update_from_data()
-        super()._handle_coordinator_update()
-
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""
-        if await self.coordinator.api.set_calendar_temporary_override(1):
-            self.sensor_data = True
-        time.sleep(1)
-        await self.coordinator.async_request_refresh()
+        if await self.api.set_calendar_temporary_override(1):
+            self.async_show_written(calendar_temporary_override=True)
+            self.sensor_data = self.data.calendar_temporary_override
+            self.async_write_ha_state()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the entity off."""
-        if await self.coordinator.api.set_calendar_temporary_override(0):
-            self.sensor_data = False
-        time.sleep(1)
-        await self.coordinator.async_request_refresh()
+        if await self.api.set_calendar_temporary_override(0):
+            self.async_show_written(calendar_temporary_override=False)
+            self.sensor_data = self.data.calendar_temporary_override
+            self.async_write_ha_state()
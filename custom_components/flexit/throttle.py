@@ -0,0 +1,171 @@
+"""Request pacing for the Flexit API."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import time
+from typing import Deque, Optional
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    API_CALLS_PER_WEEK,
+    DOMAIN as FLEXIT_DOMAIN,
+    LOGGER,
+    REQUEST_BUDGET_RESERVE,
+    REQUEST_BURST,
+    REQUEST_RATE,
+)
+
+DATA_THROTTLE = "throttle"
+
+# Rate is multiplied by this when throttled, and grows back by RATE_RECOVERY
+RATE_DECREASE = 0.75
+RATE_RECOVERY = 0.05
+MIN_RATE = 0.05
+
+WEEK = 7 * 24 * 3600
+
+
+class RequestBudget:
+    """Count requests sent over a rolling week, against the weekly quota."""
+
+    def __init__(
+        self,
+        limit: int = API_CALLS_PER_WEEK,
+        reserve: int = REQUEST_BUDGET_RESERVE,
+        window: float = WEEK,
+    ) -> None:
+        """Initialize."""
+
+        self.limit = limit
+        self.reserve = reserve
+        self.window = window
+        self._sent: Deque[float] = deque()
+        self._was_low = False
+
+    def record(self) -> None:
+        """Record a request sent."""
+
+        self._sent.append(time.monotonic())
+        if self.low and not self._was_low:
+            LOGGER.warning(
+                "%d of %d weekly Flexit API calls used, polling no faster than "
+                "the update interval",
+                self.used,
+                self.limit,
+            )
+        self._was_low = self.low
+
+    @property
+    def used(self) -> int:
+        """Return requests sent within the window."""
+
+        cutoff = time.monotonic() - self.window
+        while self._sent and self._sent[0] <= cutoff:
+            self._sent.popleft()
+        return len(self._sent)
+
+    @property
+    def remaining(self) -> int:
+        """Return requests left of the quota."""
+        return max(0, self.limit - self.used)
+
+    @property
+    def low(self) -> bool:
+        """Return true if no more than the reserve is left."""
+        return self.remaining <= self.reserve
+
+
+class RequestThrottle:
+    """Token bucket pacing requests that share one subscription key.
+
+    The rate backs off when the API throttles us and slowly recovers towards
+    the configured rate, so we settle just below the quota.
+    """
+
+    def __init__(self, rate: float = REQUEST_RATE, burst: int = REQUEST_BURST) -> None:
+        """Initialize."""
+
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens: float = burst
+        self._updated: float = time.monotonic()
+        self._paused_until: float = 0.0
+        self._lock = asyncio.Lock()
+
+        self.throttled_count: int = 0
+        self.budget = RequestBudget()
+
+    @property
+    def paused_for(self) -> float:
+        """Return seconds left of a pause requested by the API."""
+        return max(0.0, self._paused_until - time.monotonic())
+
+    async def async_acquire(self) -> None:
+        """Wait until a request may be sent."""
+
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self.paused_for
+                if wait == 0 and self._tokens >= 1:
+                    self._tokens -= 1
+                    self.budget.record()
+                    return
+                await asyncio.sleep(max(wait, (1 - self._tokens) / self.rate))
+
+    def pause(self, seconds: float) -> None:
+        """Pause all requests, as asked by a Retry-After header."""
+
+        self.throttled_count += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._tokens = 0
+        self.rate = max(MIN_RATE, self.rate * RATE_DECREASE)
+        LOGGER.debug(
+            "Throttled by Flexit API, pausing %.1f seconds. Rate %.2f/s",
+            seconds,
+            self.rate,
+        )
+
+    def record_success(self) -> None:
+        """Recover rate after a request was accepted."""
+        self.rate = min(self.max_rate, self.rate + RATE_RECOVERY)
+
+    def _refill(self) -> None:
+        """Add tokens for the time passed."""
+
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse Retry-After header given as seconds or HTTP date."""
+
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_in = parsedate_to_datetime(value) - datetime.now(timezone.utc)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_in.total_seconds())
+
+
+@callback
+def async_get_throttle(hass: HomeAssistant) -> RequestThrottle:
+    """Return the throttle shared by every Flexit client of this instance."""
+
+    domain_data = hass.data.setdefault(FLEXIT_DOMAIN, {})
+    if DATA_THROTTLE not in domain_data:
+        domain_data[DATA_THROTTLE] = RequestThrottle()
+    return domain_data[DATA_THROTTLE]
@@ -0,0 +1,82 @@
+"""Datapoint tiers fetched at different rates for Flexit."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+from typing import Any, Dict, List, Tuple
+
+import attr
+
+from .const import (
+    CONFIGURATION_MAX_AGE,
+    CONFIGURATION_PATH_LIST,
+    STATE_MAX_AGE,
+    STATE_PATH_LIST,
+    TELEMETRY_PATH_LIST,
+)
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class DatapointTier:
+    """Class representing datapoints fetched together at the same rate."""
+
+    name: str
+    paths: Tuple[str, ...]
+    max_age: timedelta
+
+
+TIERS: Tuple[DatapointTier, ...] = (
+    DatapointTier("telemetry", tuple(TELEMETRY_PATH_LIST), timedelta(0)),
+    DatapointTier("state", tuple(STATE_PATH_LIST), timedelta(minutes=STATE_MAX_AGE)),
+    DatapointTier(
+        "configuration",
+        tuple(CONFIGURATION_PATH_LIST),
+        timedelta(hours=CONFIGURATION_MAX_AGE),
+    ),
+)
+
+
+class TieredValues:
+    """Raw datapoint values of every plant, refreshed a tier at a time.
+
+    Each poll fetches only the tiers older than their max age, in one request,
+    and merges them into the values of the other tiers so the decoded
+    response is always complete.
+    """
+
+    def __init__(self, tiers: Tuple[DatapointTier, ...] = TIERS) -> None:
+        """Initialize."""
+
+        self.tiers = tiers
+        self.values: Dict[str, Any] = {}
+
+        self._fetched_at: Dict[str, float] = {}
+
+    def due(self) -> List[DatapointTier]:
+        """Return tiers that should be fetched now."""
+
+        now = time.monotonic()
+        return [
+            tier
+            for tier in self.tiers
+            if tier.name not in self._fetched_at
+            or now - self._fetched_at[tier.name] >= tier.max_age.total_seconds()
+        ]
+
+    def update(self, tiers: List[DatapointTier], values: Dict[str, Any]) -> None:
+        """Merge values fetched for tiers."""
+
+        now = time.monotonic()
+        self.values.update(values)
+        for tier in tiers:
+            self._fetched_at[tier.name] = now
+
+    def invalidate(self) -> None:
+        """Fetch every tier on the next poll, after a value was written."""
+        self._fetched_at.clear()
+
+    @staticmethod
+    def paths(tiers: List[DatapointTier]) -> List[str]:
+        """Return paths of tiers."""
+        return [path for tier in tiers for path in tier.paths]
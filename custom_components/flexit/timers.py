@@ -0,0 +1,174 @@
+"""Local countdown of the timed ventilation modes of Flexit units."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+import functools
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.util import dt as dt_util
+
+from .api import ApiClientException, FlexitApiClient
+from .const import (
+    CURRENT_BOOST_DURATION_PATH,
+    CURRENT_FIREPLACE_DURATION_PATH,
+    DOMAIN as FLEXIT_DOMAIN,
+    LOGGER,
+    MODE_FIREPLACE,
+    MODE_FORCED_VENTILATION,
+)
+from .models import VALUE, VALUES, FlexitSensorsResponse
+
+# Datapoint counting down the minutes left of each timed mode
+MINUTES_LEFT_PATHS: Dict[str, str] = {
+    MODE_FIREPLACE: CURRENT_FIREPLACE_DURATION_PATH,
+    MODE_FORCED_VENTILATION: CURRENT_BOOST_DURATION_PATH,
+}
+
+
+class ModeTimers:
+    """End time of the timed mode running on each plant, counted down locally.
+
+    The minutes left are read once when a timed mode is seen starting. The
+    unit is not asked again until the mode is expected to end, when reconcile
+    reads the mode back. A mode seen ending on a poll stops its timer at once.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        api: FlexitApiClient,
+        reconcile: Callable[[str], Awaitable[None]],
+    ) -> None:
+        """Initialize."""
+
+        self.hass = hass
+        self.api = api
+        self._reconcile = reconcile
+
+        # Timed mode running on each plant and its end, None until read
+        self._timers: Dict[str, Tuple[str, Optional[datetime]]] = {}
+        self._reads: Dict[str, asyncio.Task] = {}
+        self._cancel_end: Dict[str, CALLBACK_TYPE] = {}
+        self._listeners: Dict[str, List[CALLBACK_TYPE]] = {}
+
+        self.read_count: int = 0
+        self.reconcile_count: int = 0
+
+    def end(self, plant_id: str, mode: str) -> Optional[datetime]:
+        """Return when mode running on plant ends, if known."""
+
+        timer = self._timers.get(plant_id)
+        if timer is None or timer[0] != mode:
+            return None
+        return timer[1]
+
+    def counting_down(self, plant_id: str) -> bool:
+        """Return true if the end of the timed mode of plant is known or being read."""
+
+        timer = self._timers.get(plant_id)
+        return timer is not None and (timer[1] is not None or plant_id in self._reads)
+
+    @callback
+    def async_add_listener(
+        self, plant_id: str, update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for timers of plant starting or stopping."""
+
+        listeners = self._listeners.setdefault(plant_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove listener."""
+            listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update(self, data: Dict[str, FlexitSensorsResponse]) -> None:
+        """Follow the modes reported, starting timers of modes entered."""
+
+        for plant_id, plant_data in data.items():
+            mode = plant_data.ventilation_mode
+            timer = self._timers.get(plant_id)
+            if timer is not None and timer[0] == mode:
+                continue
+            if timer is None and mode not in MINUTES_LEFT_PATHS:
+                continue
+
+            self._async_stop(plant_id)
+            if mode in MINUTES_LEFT_PATHS:
+                self._timers[plant_id] = (mode, None)
+                self._reads[plant_id] = self.hass.async_create_background_task(
+                    self._async_start(plant_id, mode),
+                    f"{FLEXIT_DOMAIN} read {mode} of {plant_id}",
+                )
+            self._async_notify(plant_id)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Stop every timer, without updating listeners."""
+
+        for plant_id in list(self._timers):
+            self._async_stop(plant_id)
+
+    async def _async_start(self, plant_id: str, mode: str) -> None:
+        """Read minutes left of mode and count down to its end."""
+
+        path = MINUTES_LEFT_PATHS[mode]
+        self.read_count += 1
+        try:
+            values = await self.api.values([plant_id], [path])
+            minutes = int(float(values[VALUES][f"{plant_id}{path}"][VALUE][VALUE]))
+        except (ApiClientException, KeyError, ValueError) as error:
+            LOGGER.debug("Could not read %s left of %s: %s", mode, plant_id, error)
+            self._reads.pop(plant_id, None)
+            return
+        self._reads.pop(plant_id, None)
+
+        if minutes <= 0:
+            # Ending right now, the next poll shows the mode it returns to
+            return
+
+        end = dt_util.utcnow() + timedelta(minutes=minutes)
+        self._timers[plant_id] = (mode, end)
+        self._cancel_end[plant_id] = async_track_point_in_utc_time(
+            self.hass, functools.partial(self._async_ended, plant_id), end
+        )
+        self._async_notify(plant_id)
+
+    @callback
+    def _async_ended(self, plant_id: str, now: datetime) -> None:
+        """Read mode back when the timer of plant runs out."""
+
+        self._cancel_end.pop(plant_id, None)
+        # Forget the timer, so a mode still running is read again
+        self._timers.pop(plant_id, None)
+        self._async_notify(plant_id)
+
+        self.reconcile_count += 1
+        self.hass.async_create_background_task(
+            self._reconcile(plant_id),
+            f"{FLEXIT_DOMAIN} reconcile timer of {plant_id}",
+        )
+
+    @callback
+    def _async_stop(self, plant_id: str) -> None:
+        """Stop timer of plant."""
+
+        self._timers.pop(plant_id, None)
+        if (read := self._reads.pop(plant_id, None)) is not None:
+            read.cancel()
+        if (cancel_end := self._cancel_end.pop(plant_id, None)) is not None:
+            cancel_end()
+
+    @callback
+    def _async_notify(self, plant_id: str) -> None:
+        """Update listeners of plant."""
+
+        for update_callback in list(self._listeners.get(plant_id, ())):
+            update_callback()
@@ -0,0 +1,104 @@
+"""Coalesced datapoint writes for Flexit."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import attr
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import WRITE_DEBOUNCE
+
+# Writes value of field to path of plant
+WriteFunction = Callable[[str, str, str, Any], Awaitable[None]]
+
+
+@attr.s(auto_attribs=True)
+class PendingWrite:
+    """Class representing the latest value of a burst of writes to a datapoint."""
+
+    field: str
+    value: Any
+    original: Any
+    cancel: Optional[CALLBACK_TYPE] = None
+
+
+class WriteCoalescer:
+    """Write only the last of a burst of values to a datapoint, once it settles.
+
+    Callers show the value at once. It is written when no new value came for
+    the debounce delay, and not at all if the datapoint already had it.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, write: WriteFunction, delay: float = WRITE_DEBOUNCE
+    ) -> None:
+        """Initialize."""
+
+        self.hass = hass
+        self.delay = delay
+        self._write = write
+        self._pending: Dict[Tuple[str, str], PendingWrite] = {}
+
+        self.sent_count: int = 0
+        self.coalesced_count: int = 0
+        self.skipped_count: int = 0
+
+    @callback
+    def async_write(
+        self, plant_id: str, path: str, field: str, value: Any, current: Any
+    ) -> None:
+        """Write value to path once it settles, current being the value it has."""
+
+        key = (plant_id, path)
+        pending = self._pending.get(key)
+        if pending is None:
+            if value == current:
+                self.skipped_count += 1
+                return
+            pending = self._pending[key] = PendingWrite(field, value, current)
+        else:
+            self.coalesced_count += 1
+            pending.value = value
+            pending.cancel()
+
+        pending.cancel = async_call_later(
+            self.hass, self.delay, functools.partial(self._async_send, key)
+        )
+
+    def pending_changes(self, plant_id: str) -> Dict[str, Any]:
+        """Return fields of plant with values not written yet."""
+
+        return {
+            pending.field: pending.value
+            for (pending_plant_id, _), pending in self._pending.items()
+            if pending_plant_id == plant_id
+        }
+
+    async def async_flush(self) -> None:
+        """Write every pending value now."""
+
+        for pending in self._pending.values():
+            pending.cancel()
+        await asyncio.gather(*(self._async_send(key) for key in list(self._pending)))
+
+    async def _async_send(
+        self, key: Tuple[str, str], _now: Optional[datetime] = None
+    ) -> None:
+        """Write the settled value, unless the burst ended where it started."""
+
+        pending = self._pending.pop(key, None)
+        if pending is None:
+            return
+        if pending.value == pending.original:
+            self.skipped_count += 1
+            return
+
+        self.sent_count += 1
+        plant_id, path = key
+        await self._write(plant_id, path, pending.field, pending.value)
@@ -0,0 +1,189 @@
+"""Compare the field by field decoding of sensor data with the decoder table.
+
+Run with: python -m tests.benchmarks.bench_decoder
+"""
+
+import json
+from pathlib import Path
+import timeit
+from typing import Any, Dict
+
+from custom_components.flexit.const import (
+    ADDITIONAL_HEATER_PATH,
+    ALARM_CODE_A_PATH,
+    ALARM_CODE_B_PATH,
+    AWAY_AIR_TEMPERATURE_PATH,
+    AWAY_DELAY_PATH,
+    BOOST_DURATION_PATH,
+    CALENDAR_TEMPORARY_OVERRIDE_PATH,
+    EXHAUST_AIR_TEMPERATURE_PATH,
+    EXTRACT_AIR_TEMPERATURE_PATH,
+    EXTRACT_FAN_CONTROL_SIGNAL_PATH,
+    EXTRACT_FAN_SPEED_PATH,
+    FILTER_OPERATING_TIME_PATH,
+    FILTER_TIME_FOR_EXCHANGE_PATH,
+    FIREPLACE_DURATION_PATH,
+    HEAT_EXCHANGER_SPEED_PATH,
+    HEATER_PATH,
+    HOME_AIR_TEMPERATURE_PATH,
+    MODE_AWAY,
+    MODE_CAL_AWAY,
+    MODE_CAL_BOOST,
+    MODE_CAL_HOME,
+    MODE_COOKER_HOOD,
+    MODE_FIREPLACE,
+    MODE_FORCED_VENTILATION,
+    MODE_HIGH,
+    MODE_HOME,
+    MODE_HOME_HIGH_CAL_PUT_PATH,
+    MODE_NULL,
+    MODE_OFF,
+    OUTSIDE_AIR_TEMPERATURE_PATH,
+    ROOM_TEMPERATURE_PATH,
+    SUPPLY_AIR_TEMPERATURE_PATH,
+    SUPPLY_FAN_CONTROL_SIGNAL_PATH,
+    SUPPLY_FAN_SPEED_PATH,
+)
+from custom_components.flexit.models import (
+    PRESENT_PRIORITY,
+    VALUE,
+    VALUES,
+    FlexitSensorsResponse,
+    compile_sensor_decoder,
+)
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "sensors.json"
+PLANT_ID = "PLANT_ID"
+NUMBER = 20000
+
+
+class BaselineUtil:
+    """Sensor decoding of the UtilClass the decoder table replaced."""
+
+    def __init__(self, data: Dict[str, Any], plant: str) -> None:
+        """Initialize."""
+        self.data = data
+        self.plant = plant
+
+    def _str_sensor(self, path: str) -> str:
+        """Get string from path."""
+        return self.data[VALUES][f"{self.plant}{path}"][VALUE][VALUE]
+
+    def present_priority(self, path: str) -> str:
+        """Get present priority."""
+        return self.data[VALUES][f"{self.plant}{path}"][VALUE][PRESENT_PRIORITY]
+
+    def calendar_active(self, path: str) -> bool:
+        """Get state of calendar."""
+        return {15: True}.get(self.present_priority(path), False)
+
+    def int_sensor(self, path: str) -> int:
+        """Get int from path."""
+        return int(self._str_sensor(path))
+
+    def bool_sensor(self, path: str) -> bool:
+        """Get bool from path."""
+        return bool(self._str_sensor(path))
+
+    def float_sensor(self, path: str) -> float:
+        """Get float from path."""
+        return round(float(self._str_sensor(path)), 2)
+
+    def dirty_filter(self, operating_time: int, change_interval: int) -> bool:
+        """Get filter status based on hours operated."""
+        return True if operating_time >= change_interval else False
+
+    def is_heating(self, heater_int: int) -> bool:
+        """Get electric heater status from integer."""
+        return True if heater_int == 1 else False
+
+    def ventilation_mode(self, ventilation_int: int, calendar_active: bool) -> str:
+        """Get ventilation mode from integer."""
+
+        if calendar_active:
+            mode = {
+                2: MODE_CAL_AWAY,
+                3: MODE_CAL_HOME,
+                4: MODE_CAL_BOOST,
+            }
+        else:
+            # Null*Off*Away*Home*High*Cocker hood*Fire place*Forced ventilation
+            mode = {
+                0: MODE_NULL,
+                1: MODE_OFF,
+                2: MODE_AWAY,
+                3: MODE_HOME,
+                4: MODE_HIGH,
+                5: MODE_COOKER_HOOD,
+                6: MODE_FIREPLACE,
+                7: MODE_FORCED_VENTILATION,
+            }
+
+        return mode.get(
+            ventilation_int,
+            f"Unknown mode: {str(ventilation_int)} Calendar: {str(calendar_active)}",
+        )
+
+
+def per_field(plant: str, data: Dict[str, Any]) -> FlexitSensorsResponse:
+    """Decode sensor data field by field, as before the decoder table."""
+
+    util = BaselineUtil(data=data, plant=plant)
+
+    return FlexitSensorsResponse(
+        home_air_temperature=util.float_sensor(HOME_AIR_TEMPERATURE_PATH),
+        away_air_temperature=util.float_sensor(AWAY_AIR_TEMPERATURE_PATH),
+        outside_air_temperature=util.float_sensor(OUTSIDE_AIR_TEMPERATURE_PATH),
+        supply_air_temperature=util.float_sensor(SUPPLY_AIR_TEMPERATURE_PATH),
+        exhaust_air_temperature=util.float_sensor(EXHAUST_AIR_TEMPERATURE_PATH),
+        extract_air_temperature=util.float_sensor(EXTRACT_AIR_TEMPERATURE_PATH),
+        room_temperature=util.float_sensor(ROOM_TEMPERATURE_PATH),
+        electric_heater=util.is_heating(util.int_sensor(HEATER_PATH)),
+        ventilation_mode=util.ventilation_mode(
+            util.int_sensor(MODE_HOME_HIGH_CAL_PUT_PATH),
+            util.calendar_active(MODE_HOME_HIGH_CAL_PUT_PATH),
+        ),
+        filter_operating_time=util.int_sensor(FILTER_OPERATING_TIME_PATH),
+        filter_time_for_exchange=util.int_sensor(FILTER_TIME_FOR_EXCHANGE_PATH),
+        dirty_filter=util.dirty_filter(
+            util.int_sensor(FILTER_OPERATING_TIME_PATH),
+            util.int_sensor(FILTER_TIME_FOR_EXCHANGE_PATH),
+        ),
+        heat_exchanger_speed=util.int_sensor(HEAT_EXCHANGER_SPEED_PATH),
+        supply_fan_speed=util.int_sensor(SUPPLY_FAN_SPEED_PATH),
+        supply_fan_control_signal=util.int_sensor(SUPPLY_FAN_CONTROL_SIGNAL_PATH),
+        extract_fan_speed=util.int_sensor(EXTRACT_FAN_SPEED_PATH),
+        extract_fan_control_signal=util.int_sensor(EXTRACT_FAN_CONTROL_SIGNAL_PATH),
+        additional_heater=util.int_sensor(ADDITIONAL_HEATER_PATH),
+        alarm_code_a=util.int_sensor(ALARM_CODE_A_PATH),
+        alarm_code_b=util.int_sensor(ALARM_CODE_B_PATH),
+        fireplace_duration=util.int_sensor(FIREPLACE_DURATION_PATH),
+        boost_duration=util.int_sensor(BOOST_DURATION_PATH),
+        away_delay=util.int_sensor(AWAY_DELAY_PATH),
+        calendar_temporary_override=util.bool_sensor(CALENDAR_TEMPORARY_OVERRIDE_PATH),
+        calendar_active=util.calendar_active(MODE_HOME_HIGH_CAL_PUT_PATH),
+    )
+
+
+def main() -> None:
+    """Run benchmark."""
+
+    data = json.loads(FIXTURE.read_text())
+
+    assert per_field(PLANT_ID, data) == FlexitSensorsResponse.from_dict(
+        PLANT_ID, data
+    )
+
+    field_by_field = timeit.timeit(lambda: per_field(PLANT_ID, data), number=NUMBER)
+    decoder = compile_sensor_decoder(PLANT_ID)
+    table = timeit.timeit(
+        lambda: FlexitSensorsResponse.from_dict(PLANT_ID, data, decoder), number=NUMBER
+    )
+
+    print(f"field by field: {field_by_field / NUMBER * 1e6:8.2f} us/decode")
+    print(f"decoder table:  {table / NUMBER * 1e6:8.2f} us/decode")
+    print(f"saving:         {(field_by_field - table) / NUMBER * 1e6:8.2f} us/decode")
+
+
+if __name__ == "__main__":
+    main()
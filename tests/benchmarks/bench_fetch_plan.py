@@ -0,0 +1,41 @@
+"""Compare rebuilding the sensor data url every poll with a compiled fetch plan.
+
+Run with: python -m tests.benchmarks.bench_fetch_plan
+"""
+
+import timeit
+
+from custom_components.flexit.api import FlexitApiClient
+from custom_components.flexit.const import SENSOR_DATA_PATH_LIST
+
+PLANT_ID = "PLANT_ID"
+NUMBER = 20000
+
+
+def main() -> None:
+    """Run benchmark."""
+
+    api = FlexitApiClient(session=None, username="", password="", plant_id=PLANT_ID)
+
+    assert api.fetch_plan(SENSOR_DATA_PATH_LIST).url == api.escaped_filter_url(
+        api.create_url_from_paths(SENSOR_DATA_PATH_LIST)
+    )
+
+    rebuild = timeit.timeit(
+        lambda: api.escaped_filter_url(
+            api.create_url_from_paths(SENSOR_DATA_PATH_LIST)
+        ),
+        number=NUMBER,
+    )
+    planned = timeit.timeit(
+        lambda: api.fetch_plan(SENSOR_DATA_PATH_LIST).url,
+        number=NUMBER,
+    )
+
+    print(f"rebuild url:  {rebuild / NUMBER * 1e6:8.2f} us/poll")
+    print(f"fetch plan:   {planned / NUMBER * 1e6:8.2f} us/poll")
+    print(f"saving:       {(rebuild - planned) / NUMBER * 1e6:8.2f} us/poll")
+
+
+if __name__ == "__main__":
+    main()
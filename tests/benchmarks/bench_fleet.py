@@ -0,0 +1,263 @@
+"""Load test polling a fleet of plants against the local Climatix stand-in.
+
+For every fleet size, plants are polled back to back for a while, either by
+one client per plant, as with one config entry per unit, or by one client
+fetching every plant in combined requests. Reports polls per second, poll
+latency, event loop lag and memory per plant.
+
+Run with: python -m tests.benchmarks.bench_fleet --plants 1,10,100,1000
+"""
+
+import argparse
+import asyncio
+import statistics
+import threading
+import time
+import tracemalloc
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import aiohttp
+import attr
+
+from custom_components.flexit.api import ApiClientException, FlexitApiClient
+from custom_components.flexit.retry import RetryPolicy
+from custom_components.flexit.throttle import RequestThrottle
+
+from ..climatix import ClimatixStandIn, StandInConfig
+
+CLIENTS = "clients"
+MULTI = "multi"
+MODES = (CLIENTS, MULTI)
+
+# Event loop lag is measured by how late a sleep of this many seconds wakes up
+LAG_PROBE_INTERVAL = 0.01
+
+
+@attr.s(auto_attribs=True, frozen=True)
+class FleetResult:
+    """Class representing the outcome of polling a fleet."""
+
+    plants: int
+    mode: str
+    polls_per_second: float
+    failures: int
+    latencies: List[float]
+    lags: List[float]
+    bytes_per_plant: float
+
+    def row(self) -> str:
+        """Return result as a table row."""
+
+        p50, p95, p99 = percentiles(self.latencies)
+        lag99 = percentiles(self.lags)[2]
+        return (
+            f"{self.plants:>6} {self.mode:>8} {self.polls_per_second:>9.1f}"
+            f" {p50 * 1000:>8.1f} {p95 * 1000:>8.1f} {p99 * 1000:>8.1f}"
+            f" {lag99 * 1000:>8.1f} {max(self.lags, default=0) * 1000:>8.1f}"
+            f" {self.failures:>6} {self.bytes_per_plant / 1024:>9.1f}"
+        )
+
+
+HEADER = (
+    f"{'plants':>6} {'mode':>8} {'polls/s':>9} {'p50 ms':>8} {'p95 ms':>8}"
+    f" {'p99 ms':>8} {'lag99 ms':>8} {'lagmax':>8} {'failed':>6} {'KiB/plant':>9}"
+)
+
+
+def percentiles(values: Sequence[float]) -> List[float]:
+    """Return p50, p95 and p99 of values."""
+
+    if len(values) < 2:
+        return [values[0] if values else 0.0] * 3
+    cut_points = statistics.quantiles(values, n=100, method="inclusive")
+    return [cut_points[49], cut_points[94], cut_points[98]]
+
+
+class StandInThread:
+    """Stand-in served from its own thread, so it does not lag the clients."""
+
+    def __init__(self, plant_ids: Sequence[str], config: StandInConfig) -> None:
+        """Initialize."""
+
+        self.standin = ClimatixStandIn(plant_ids=plant_ids, config=config)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+
+    def __enter__(self) -> ClimatixStandIn:
+        """Start serving."""
+
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self.standin.start(), self._loop).result()
+        return self.standin
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop serving."""
+
+        asyncio.run_coroutine_threadsafe(self.standin.stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+class Fleet:
+    """Clients polling plants of the stand-in."""
+
+    def __init__(
+        self, session: aiohttp.ClientSession, url: str, plant_ids: List[str], mode: str
+    ) -> None:
+        """Initialize."""
+
+        self.plant_ids = plant_ids
+        self.mode = mode
+
+        # Clients share the throttle of the instance, paced far above the quota
+        throttle = RequestThrottle(rate=1e6, burst=len(plant_ids) + 10)
+        retry_policy = RetryPolicy(attempts=1)
+        count = len(plant_ids) if mode == CLIENTS else 1
+        self.clients = [
+            FlexitApiClient(
+                session,
+                "user",
+                "password",
+                plant_id=plant_ids[index] if mode == CLIENTS else None,
+                retry_policy=retry_policy,
+                throttle=throttle,
+                api_url=url,
+            )
+            for index in range(count)
+        ]
+        self.data: Dict[str, Any] = {}
+
+    def pollers(self) -> List[Callable[[], Awaitable[int]]]:
+        """Return a poll function of each client, returning plants polled."""
+
+        if self.mode == MULTI:
+            return [self._poll_many]
+        return [
+            lambda plant_id=plant_id, client=client: self._poll_one(plant_id, client)
+            for plant_id, client in zip(self.plant_ids, self.clients)
+        ]
+
+    async def _poll_one(self, plant_id: str, client: FlexitApiClient) -> int:
+        """Poll plant of client."""
+
+        self.data[plant_id] = await client.sensor_data()
+        return 1
+
+    async def _poll_many(self) -> int:
+        """Poll every plant with the single client."""
+
+        self.data.update(await self.clients[0].sensor_data_many(self.plant_ids))
+        return len(self.plant_ids)
+
+
+def session_without_limit() -> aiohttp.ClientSession:
+    """Return session not capping concurrent connections, to load the clients."""
+    return aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+
+
+async def measure_memory(url: str, plant_ids: List[str], mode: str) -> float:
+    """Return bytes kept per plant by clients, tokens and one poll of data."""
+
+    async with session_without_limit() as session:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        fleet = Fleet(session, url, plant_ids, mode)
+        await asyncio.gather(*(poll() for poll in fleet.pollers()))
+        allocated = tracemalloc.get_traced_memory()[0] - before
+        tracemalloc.stop()
+        return allocated / len(plant_ids)
+
+
+async def measure_load(
+    url: str, plant_ids: List[str], mode: str, duration: float
+) -> FleetResult:
+    """Poll plants back to back for duration and return the outcome."""
+
+    latencies: List[float] = []
+    lags: List[float] = []
+    polls = 0
+    failures = 0
+
+    async def probe_lag(stop: asyncio.Event) -> None:
+        """Record how late the loop wakes up."""
+
+        while not stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            lags.append(time.perf_counter() - started - LAG_PROBE_INTERVAL)
+
+    async def run(poll: Callable[[], Awaitable[int]], deadline: float) -> None:
+        """Poll until deadline."""
+
+        nonlocal polls, failures
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                polled = await poll()
+            except ApiClientException:
+                failures += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            polls += polled
+
+    async with session_without_limit() as session:
+        fleet = Fleet(session, url, plant_ids, mode)
+        # Fetch tokens before the clock starts
+        await asyncio.gather(*(client.auth() for client in fleet.clients))
+
+        stop = asyncio.Event()
+        prober = asyncio.create_task(probe_lag(stop))
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(*(run(poll, deadline) for poll in fleet.pollers()))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        await prober
+
+    return FleetResult(
+        plants=len(plant_ids),
+        mode=mode,
+        polls_per_second=polls / elapsed,
+        failures=failures,
+        latencies=latencies,
+        lags=lags,
+        bytes_per_plant=0.0,
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Run load test."""
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--plants",
+        default="1,10,100,1000",
+        help="comma separated fleet sizes",
+    )
+    parser.add_argument("--mode", choices=(*MODES, "both"), default="both")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds")
+    parser.add_argument("--latency", type=float, default=0.15, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.1, help="seconds")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.plants.split(",")]
+    modes = MODES if args.mode == "both" else (args.mode,)
+    config = StandInConfig(latency=args.latency, jitter=args.jitter, seed=1)
+
+    print(HEADER)
+    with StandInThread([f"PLANT_{i}" for i in range(max(sizes))], config) as standin:
+        for size in sizes:
+            plant_ids = standin.units.plant_ids[:size]
+            for mode in modes:
+                result = asyncio.run(
+                    measure_load(standin.url, plant_ids, mode, args.duration)
+                )
+                bytes_per_plant = asyncio.run(
+                    measure_memory(standin.url, plant_ids, mode)
+                )
+                print(attr.evolve(result, bytes_per_plant=bytes_per_plant).row())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare memory of plant snapshots as dict based and slotted models.
+
+Run with: python -m tests.benchmarks.bench_model_memory
+"""
+
+import json
+from pathlib import Path
+import tracemalloc
+from typing import Any, Callable, List
+
+import attr
+
+from custom_components.flexit.models import FlexitSensorsResponse
+
+FIXTURE = Path(__file__).parent.parent / "fixtures" / "sensors.json"
+PLANT_ID = "PLANT_ID"
+PLANTS = 500
+
+# The model as it was before it was slotted
+DictSensorsResponse = attr.make_class(
+    "DictSensorsResponse",
+    [field.name for field in attr.fields(FlexitSensorsResponse)],
+    slots=False,
+)
+
+
+def bytes_per_snapshot(create: Callable[[], Any]) -> float:
+    """Return bytes allocated per snapshot kept alive."""
+
+    snapshots: List[Any] = []
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _ in range(PLANTS):
+        snapshots.append(create())
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return allocated / len(snapshots)
+
+
+def main() -> None:
+    """Run benchmark."""
+
+    data = json.loads(FIXTURE.read_text())
+    fields = attr.asdict(FlexitSensorsResponse.from_dict(PLANT_ID, data))
+
+    dict_based = bytes_per_snapshot(lambda: DictSensorsResponse(**fields))
+    slotted = bytes_per_snapshot(lambda: FlexitSensorsResponse(**fields))
+
+    print(f"dict based: {dict_based:8.1f} bytes/plant")
+    print(f"slotted:    {slotted:8.1f} bytes/plant")
+    print(f"saving:     {dict_based - slotted:8.1f} bytes/plant")
+
+
+if __name__ == "__main__":
+    main()
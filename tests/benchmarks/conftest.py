@@ -0,0 +1,122 @@
+"""Fixtures running Home Assistant and the Climatix stand-in for benchmarks.
+
+pytest-benchmark times plain function calls, so these fixtures drive their
+own event loop and benchmarks run async code to completion on it each round.
+"""
+
+import asyncio
+import functools
+from typing import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant import config_entries, loader
+from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    floor_registry as fr,
+    label_registry as lr,
+    restore_state,
+    translation,
+)
+from homeassistant.setup import async_setup_component
+
+from custom_components.flexit.api import FlexitApiClient
+from custom_components.flexit.const import CONF_PLANTS, DOMAIN
+from custom_components.flexit.coordinator import FlexitDataUpdateCoordinator
+from custom_components.flexit.throttle import DATA_THROTTLE, RequestThrottle
+
+from ..climatix import ClimatixStandIn
+from ..simulator import SimulatedUnits
+
+PLANT_ID = "PLANT_A"
+
+
+@pytest.fixture
+def runner() -> Iterator[asyncio.Runner]:
+    """Return runner of the event loop shared by the fixtures."""
+
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture
+def standin(runner: asyncio.Runner) -> Iterator[ClimatixStandIn]:
+    """Run a stand-in serving a simulated unit."""
+
+    standin = ClimatixStandIn(units=SimulatedUnits([PLANT_ID], seed=1))
+    runner.run(standin.start())
+    yield standin
+    runner.run(standin.stop())
+
+
+@pytest.fixture
+def hass(runner: asyncio.Runner, tmp_path) -> Iterator[HomeAssistant]:
+    """Run Home Assistant with only the core integration set up."""
+
+    hass = runner.run(_async_start_hass(str(tmp_path)))
+    yield hass
+    runner.run(hass.async_stop(force=True))
+
+
+async def _async_start_hass(config_dir: str) -> HomeAssistant:
+    """Start Home Assistant."""
+
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    entity.async_setup(hass)
+    loader.async_setup(hass)
+    translation.async_setup(hass)
+    await asyncio.gather(
+        ar.async_load(hass),
+        dr.async_load(hass),
+        er.async_load(hass),
+        fr.async_load(hass),
+        lr.async_load(hass),
+    )
+    await restore_state.async_load(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await hass.config_entries.async_initialize()
+    assert await async_setup_component(hass, "homeassistant", {})
+    await hass.async_start()
+    return hass
+
+
+@pytest.fixture
+def coordinator(
+    runner: asyncio.Runner, hass: HomeAssistant, standin: ClimatixStandIn
+) -> FlexitDataUpdateCoordinator:
+    """Set up an entry of the simulated unit with every platform."""
+
+    # Requests are paced by the stand-in, not the API quota
+    hass.data.setdefault(DOMAIN, {})[DATA_THROTTLE] = RequestThrottle(
+        rate=1e6, burst=1000
+    )
+    entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="Flexit",
+        data={
+            CONF_NAME: "Flexit",
+            CONF_USERNAME: "user",
+            CONF_PASSWORD: "password",
+            CONF_PLANTS: [PLANT_ID],
+        },
+        source=config_entries.SOURCE_USER,
+        options={},
+    )
+
+    with patch(
+        "custom_components.flexit.FlexitApiClient",
+        functools.partial(FlexitApiClient, api_url=standin.url),
+    ):
+        runner.run(hass.config_entries.async_add(entry))
+        runner.run(hass.async_block_till_done())
+
+    return hass.data[DOMAIN][entry.entry_id]
@@ -0,0 +1,79 @@
+"""Benchmarks of coordinator polls and entity updates."""
+
+import asyncio
+
+import attr
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.flexit.coordinator import FlexitDataUpdateCoordinator
+from custom_components.flexit.models import FlexitSensorsResponse
+from custom_components.flexit.sensor import HEALTH_SENSORS
+
+from .conftest import PLANT_ID
+
+FIELDS = frozenset(field.name for field in attr.fields(FlexitSensorsResponse))
+
+
+def test_update_cycle(
+    benchmark, runner: asyncio.Runner, coordinator: FlexitDataUpdateCoordinator
+) -> None:
+    """Benchmark a poll of the telemetry tier, decoded and dispatched."""
+
+    benchmark(lambda: runner.run(coordinator.async_refresh()))
+
+    assert coordinator.last_update_success
+
+
+def test_full_update_cycle(
+    benchmark, runner: asyncio.Runner, coordinator: FlexitDataUpdateCoordinator
+) -> None:
+    """Benchmark a poll of every tier, as after a write."""
+
+    benchmark.pedantic(
+        lambda: runner.run(coordinator.async_refresh()),
+        setup=coordinator.tiers.invalidate,
+        rounds=50,
+    )
+
+    assert coordinator.last_update_success
+
+
+def test_fan_out(
+    benchmark,
+    runner: asyncio.Runner,
+    hass: HomeAssistant,
+    coordinator: FlexitDataUpdateCoordinator,
+) -> None:
+    """Benchmark updating the entities of every platform after every field changed."""
+
+    coordinator.changed_fields = {PLANT_ID: FIELDS}
+
+    benchmark(coordinator.async_update_listeners)
+    runner.run(hass.async_block_till_done())
+
+    assert dispatch(coordinator) > len(HEALTH_SENSORS)
+
+
+def test_fan_out_unchanged(
+    benchmark,
+    runner: asyncio.Runner,
+    hass: HomeAssistant,
+    coordinator: FlexitDataUpdateCoordinator,
+) -> None:
+    """Benchmark updating the entities of every platform after nothing changed."""
+
+    coordinator.changed_fields = {PLANT_ID: frozenset()}
+
+    benchmark(coordinator.async_update_listeners)
+    runner.run(hass.async_block_till_done())
+
+    assert dispatch(coordinator) == len(HEALTH_SENSORS)
+
+
+def dispatch(coordinator: FlexitDataUpdateCoordinator) -> int:
+    """Update listeners once and return the number of states written."""
+
+    writes = coordinator.state_writes
+    coordinator.async_update_listeners()
+    return coordinator.state_writes - writes
@@ -0,0 +1,78 @@
+"""Benchmarks of decoding responses and building requests."""
+
+from typing import Any, Dict
+
+import pytest
+
+from custom_components.flexit.api import FlexitApiClient
+from custom_components.flexit.const import SENSOR_DATA_PATH_LIST
+from custom_components.flexit.models import (
+    FlexitDeviceInfo,
+    FlexitSensorsResponse,
+    compile_sensor_decoder,
+)
+
+from ..climatix import FIXTURE_PLANT_ID, load_fixture
+
+
+@pytest.fixture
+def api() -> FlexitApiClient:
+    """Return a client holding a token, without a session."""
+
+    api = FlexitApiClient(
+        session=None, username="", password="", plant_id=FIXTURE_PLANT_ID
+    )
+    api.token_manager.restore(
+        {"access_token": load_fixture("token.json")["access_token"], "expires_at": 0}
+    )
+    return api
+
+
+@pytest.fixture
+def sensors() -> Dict[str, Any]:
+    """Return sensor data response."""
+    return load_fixture("sensors.json")
+
+
+@pytest.fixture
+def device_info() -> Dict[str, Any]:
+    """Return device info response."""
+    return load_fixture("device_info.json")
+
+
+def test_sensors_from_dict(benchmark, sensors: Dict[str, Any]) -> None:
+    """Benchmark decoding sensor data."""
+
+    decoder = compile_sensor_decoder(FIXTURE_PLANT_ID)
+
+    data = benchmark(
+        FlexitSensorsResponse.from_dict, FIXTURE_PLANT_ID, sensors, decoder
+    )
+
+    assert data.room_temperature == 26.5
+
+
+def test_device_info_from_dict(benchmark, device_info: Dict[str, Any]) -> None:
+    """Benchmark decoding device info."""
+
+    data = benchmark(FlexitDeviceInfo.from_dict, FIXTURE_PLANT_ID, device_info)
+
+    assert data.modelName == "SOC19A"
+
+
+def test_filter_url(benchmark, api: FlexitApiClient) -> None:
+    """Benchmark building the sensor data url from paths."""
+
+    url = benchmark(
+        lambda: api.escaped_filter_url(api.create_url_from_paths(SENSOR_DATA_PATH_LIST))
+    )
+
+    assert url == api.fetch_plan(SENSOR_DATA_PATH_LIST).url
+
+
+def test_headers_with_token(benchmark, api: FlexitApiClient) -> None:
+    """Benchmark building authorized request headers."""
+
+    headers = benchmark(api.headers_with_token)
+
+    assert headers["Authorization"].startswith("Bearer ")
@@ -0,0 +1,243 @@
+"""Local stand-in for the Climatix cloud API behind Flexit units.
+
+Serves /Token, /Plants, /DataPoints/Values and PUT /DataPoints/{id} from the
+JSON fixtures, with configurable latency, errors, 429 responses and timeouts.
+
+    async with ClimatixStandIn(plant_ids=["PLANT_A", "PLANT_B"]) as standin:
+        client = FlexitApiClient(session, "user", "password", api_url=standin.url)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import copy
+import json
+from pathlib import Path
+import random
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from aiohttp import web
+import attr
+
+FIXTURES = Path(__file__).parent / "fixtures"
+FIXTURE_PLANT_ID = "PLANT_ID"
+
+
+def load_fixture(name: str) -> Dict[str, Any]:
+    """Load JSON fixture."""
+    return json.loads((FIXTURES / name).read_text())
+
+
+@attr.s(auto_attribs=True)
+class StandInConfig:
+    """Class representing how the stand-in misbehaves."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 500
+    rate_limit_rate: float = 0.0
+    retry_after: float = 1.0
+    timeout_rate: float = 0.0
+    timeout: float = 60.0
+    seed: Optional[int] = None
+
+
+class FixtureUnits:
+    """Datapoints of every plant, each starting from the fixture values."""
+
+    def __init__(self, plant_ids: Sequence[str]) -> None:
+        """Initialize."""
+
+        self.plant_ids = list(plant_ids)
+
+        fixture_values = {
+            **load_fixture("sensors.json")["values"],
+            **load_fixture("device_info.json")["values"],
+        }
+        paths = {
+            key[len(FIXTURE_PLANT_ID) :]: datapoint
+            for key, datapoint in fixture_values.items()
+        }
+        self.datapoints: Dict[str, Dict[str, Any]] = {
+            f"{plant_id}{path}": copy.deepcopy(datapoint)
+            for plant_id in self.plant_ids
+            for path, datapoint in paths.items()
+        }
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return datapoint, or None if the unit does not have it."""
+        return self.datapoints.get(key)
+
+    def write(self, key: str, value: Optional[str]) -> bool:
+        """Write value to datapoint, returning false if it does not exist."""
+
+        datapoint = self.datapoints.get(key)
+        if datapoint is None or not isinstance(datapoint["value"], dict):
+            return False
+        datapoint["value"]["value"] = None if value is None else float(value)
+        return True
+
+
+class ClimatixStandIn:
+    """aiohttp server answering like api.climatixic.com."""
+
+    def __init__(
+        self,
+        plant_ids: Sequence[str] = (FIXTURE_PLANT_ID,),
+        units: Optional[FixtureUnits] = None,
+        config: Optional[StandInConfig] = None,
+    ) -> None:
+        """Initialize."""
+
+        self.units = units or FixtureUnits(plant_ids)
+        self.config = config or StandInConfig()
+        self.requests: Counter = Counter()
+        self.writes: List[Dict[str, Any]] = []
+        self.url = ""
+
+        self._random = random.Random(self.config.seed)
+        self._tokens: List[str] = []
+        self._runner: Optional[web.AppRunner] = None
+        # Requests held until they time out, ended when the server stops
+        self._stalled: Set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "ClimatixStandIn":
+        """Start server."""
+        await self.start()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Stop server."""
+        await self.stop()
+
+    async def start(self) -> str:
+        """Start serving on a free local port and return the base url."""
+
+        app = web.Application(middlewares=[self._misbehave])
+        app.router.add_post("/Token", self._token)
+        app.router.add_get("/Plants", self._plants)
+        app.router.add_get("/DataPoints/Values", self._values)
+        app.router.add_put("/DataPoints/{datapoint}", self._put)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+
+        port = self._runner.addresses[0][1]
+        self.url = f"http://127.0.0.1:{port}"
+        return self.url
+
+    async def stop(self) -> None:
+        """Stop serving."""
+
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+        for task in self._stalled:
+            task.cancel()
+        if self._stalled:
+            await asyncio.wait(self._stalled)
+
+    def revoke_tokens(self) -> None:
+        """Reject every token issued so far."""
+        self._tokens.clear()
+
+    @web.middleware
+    async def _misbehave(self, request: web.Request, handler: Any) -> web.Response:
+        """Add latency, errors, rate limiting and timeouts as configured."""
+
+        self.requests[request.path.split("/")[1]] += 1
+        config = self.config
+
+        if config.latency or config.jitter:
+            await asyncio.sleep(config.latency + self._random.uniform(0, config.jitter))
+
+        roll = self._random.random()
+        if roll < config.timeout_rate:
+            task = asyncio.current_task()
+            self._stalled.add(task)
+            try:
+                await asyncio.sleep(config.timeout)
+            finally:
+                self._stalled.discard(task)
+        roll -= config.timeout_rate
+        if roll < config.rate_limit_rate:
+            return web.json_response(
+                {"message": "Rate limit is exceeded"},
+                status=429,
+                headers={"Retry-After": str(config.retry_after)},
+            )
+        roll -= config.rate_limit_rate
+        if roll < config.error_rate:
+            return web.json_response(
+                {"message": "Internal error"}, status=config.error_status
+            )
+
+        if request.path != "/Token" and (
+            request.headers.get("Authorization", "")[len("Bearer ") :]
+            not in self._tokens
+        ):
+            return web.json_response({"message": "Unauthorized"}, status=401)
+
+        return await handler(request)
+
+    async def _token(self, request: web.Request) -> web.Response:
+        """Issue a token."""
+
+        form = await request.post()
+        token = f"access_token_{len(self._tokens)}"
+        self._tokens.append(token)
+        return web.json_response(
+            {
+                **load_fixture("token.json"),
+                "access_token": token,
+                "userName": form.get("username"),
+            }
+        )
+
+    async def _plants(self, request: web.Request) -> web.Response:
+        """List plants."""
+
+        item = load_fixture("plants.json")["items"][0]
+        return web.json_response(
+            {
+                "totalCount": len(self.units.plant_ids),
+                "items": [
+                    {**item, "id": plant_id} for plant_id in self.units.plant_ids
+                ],
+            }
+        )
+
+    async def _values(self, request: web.Request) -> web.Response:
+        """Return values of the datapoints in the filter."""
+
+        try:
+            keys = [
+                datapoint["DataPoints"]
+                for datapoint in json.loads(request.query["filterId"])
+            ]
+        except (KeyError, TypeError, ValueError):
+            return web.json_response({"message": "Invalid filter"}, status=400)
+
+        values = {
+            key: datapoint
+            for key in keys
+            if (datapoint := self.units.read(key)) is not None
+        }
+        return web.json_response({"totalCount": len(values), "values": values})
+
+    async def _put(self, request: web.Request) -> web.Response:
+        """Write value to a datapoint."""
+
+        key = request.match_info["datapoint"]
+        value = (await request.json())["Value"]
+        self.writes.append({"datapoint": key, "value": value})
+
+        if not self.units.write(key, value):
+            return web.json_response(
+                {"error": {"stateTexts": {key: "Failure"}}, "errorClass": 1}
+            )
+        return web.json_response({"stateTexts": {key: "Success"}})
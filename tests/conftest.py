@@ -0,0 +1,92 @@
+"""Fixtures setting up an entry of the Climatix stand-in in Home Assistant."""
+
+import functools
+from typing import AsyncIterator, List
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from custom_components.flexit.api import FlexitApiClient
+from custom_components.flexit.const import CONF_PLANTS, DOMAIN
+from custom_components.flexit.coordinator import FlexitDataUpdateCoordinator
+from custom_components.flexit.throttle import DATA_THROTTLE, RequestThrottle
+
+from .climatix import ClimatixStandIn
+from .simulator import SimulatedUnits
+
+PLANT_ID = "PLANT_A"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_socket(socket_enabled: None) -> None:
+    """Let tests serve and call the stand-in on localhost."""
+
+
+@pytest.fixture
+def plant_ids() -> List[str]:
+    """Return plants of the entry, overridden by tests of several plants."""
+    return [PLANT_ID]
+
+
+@pytest.fixture
+async def standin(plant_ids: List[str]) -> AsyncIterator[ClimatixStandIn]:
+    """Run a stand-in serving a simulated unit for each plant."""
+
+    async with ClimatixStandIn(units=SimulatedUnits(plant_ids, seed=1)) as standin:
+        yield standin
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, standin: ClimatixStandIn, entry: MockConfigEntry
+) -> bool:
+    """Set entry up against the stand-in."""
+
+    # Requests are paced by the stand-in, not the API quota
+    hass.data.setdefault(DOMAIN, {})[DATA_THROTTLE] = RequestThrottle(
+        rate=1e6, burst=1000
+    )
+    entry.add_to_hass(hass)
+
+    with patch(
+        "custom_components.flexit.FlexitApiClient",
+        functools.partial(FlexitApiClient, api_url=standin.url),
+    ):
+        setup = await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    return setup
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant,
+    enable_custom_integrations: None,
+    standin: ClimatixStandIn,
+    plant_ids: List[str],
+) -> AsyncIterator[FlexitDataUpdateCoordinator]:
+    """Set up an entry of the simulated units with every platform."""
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        title="Flexit",
+        data={
+            CONF_NAME: "Flexit",
+            CONF_USERNAME: "user",
+            CONF_PASSWORD: "password",
+            CONF_PLANTS: plant_ids,
+        },
+        unique_id="user",
+    )
+    assert await async_setup_entry(hass, standin, entry)
+
+    yield hass.data[DOMAIN][entry.entry_id]
+
+    # Unload while the stand-in still answers the writes flushed on unload
+    if entry.state is ConfigEntryState.LOADED:
+        assert await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
@@ -0,0 +1,351 @@
+"""Stateful simulation of Flexit units for the local Climatix stand-in.
+
+Each unit keeps its datapoints, applies mode writes with the toggle
+semantics of the real units, counts down fireplace and boost durations,
+drifts temperatures and raises a filter alarm as operating hours grow.
+Time only moves when advance() is called, so runs are deterministic.
+
+    units = SimulatedUnits(["PLANT_A"], seed=1)
+    async with ClimatixStandIn(units=units) as standin:
+        ...
+        units.advance(600)
+"""
+
+from __future__ import annotations
+
+import math
+import random
+from typing import Any, Dict, Optional, Sequence, Set, Tuple
+
+from custom_components.flexit.const import (
+    ACKNOWLEDGE_FILTER_ALARM_CODE_PATH,
+    ADDITIONAL_HEATER_PATH,
+    ALARM_CODE_A_PATH,
+    AWAY_AIR_TEMPERATURE_PATH,
+    AWAY_DELAY_PATH,
+    BOOST_DURATION_PATH,
+    CALENDAR_TEMPORARY_OVERRIDE_PATH,
+    CURRENT_BOOST_DURATION_PATH,
+    CURRENT_FIREPLACE_DURATION_PATH,
+    EXHAUST_AIR_TEMPERATURE_PATH,
+    EXTRACT_AIR_TEMPERATURE_PATH,
+    EXTRACT_FAN_CONTROL_SIGNAL_PATH,
+    EXTRACT_FAN_SPEED_PATH,
+    FILTER_OPERATING_TIME_PATH,
+    FILTER_TIME_FOR_EXCHANGE_PATH,
+    FIREPLACE_DURATION_PATH,
+    HEAT_EXCHANGER_SPEED_PATH,
+    HEATER_PATH,
+    HOME_AIR_TEMPERATURE_PATH,
+    MODE_AWAY_PUT_PATH,
+    MODE_FIREPLACE_PUT_PATH,
+    MODE_HIGH_TEMP_PUT_PATH,
+    MODE_HOME_HIGH_CAL_PUT_PATH,
+    MODE_PATH,
+    OUTSIDE_AIR_TEMPERATURE_PATH,
+    ROOM_TEMPERATURE_PATH,
+    SUPPLY_AIR_TEMPERATURE_PATH,
+    SUPPLY_FAN_CONTROL_SIGNAL_PATH,
+    SUPPLY_FAN_SPEED_PATH,
+)
+
+from .climatix import FIXTURE_PLANT_ID, load_fixture
+
+# Ventilation mode values, see MODE_PATH
+AWAY = 2
+HOME = 3
+HIGH = 4
+FIREPLACE = 6
+FORCED_VENTILATION = 7
+
+MANUAL_PRIORITY = 13
+CALENDAR_PRIORITY = 15
+
+# Value written to toggle a timed mode, and to acknowledge an alarm
+TOGGLE = 2
+ACKNOWLEDGE = 2
+
+# Alarm code raised when the filter has run its exchange interval
+FILTER_ALARM_CODE = 1
+
+# Supply and extract fan control signal in percent per mode
+FAN_SIGNALS: Dict[int, Tuple[int, int]] = {
+    AWAY: (30, 30),
+    HOME: (55, 52),
+    HIGH: (80, 78),
+    FIREPLACE: (80, 50),
+    FORCED_VENTILATION: (100, 100),
+}
+FAN_RPM_PER_PERCENT = 30
+
+# Fraction of the distance to the target temperature covered per hour
+ROOM_RESPONSE = 0.5
+DAY = 24 * 3600
+
+WRITABLE_PATHS = (
+    FIREPLACE_DURATION_PATH,
+    BOOST_DURATION_PATH,
+    AWAY_DELAY_PATH,
+    HOME_AIR_TEMPERATURE_PATH,
+    AWAY_AIR_TEMPERATURE_PATH,
+    HEATER_PATH,
+    CALENDAR_TEMPORARY_OVERRIDE_PATH,
+    FILTER_OPERATING_TIME_PATH,
+)
+
+
+class SimulatedUnit:
+    """A Flexit unit whose datapoints react to writes and time."""
+
+    def __init__(self, plant_id: str, seed: Optional[int] = None) -> None:
+        """Initialize from the fixture values."""
+
+        self.plant_id = plant_id
+        self.now: float = 0.0
+
+        self._random = random.Random(seed)
+        self._datapoints: Dict[str, Dict[str, Any]] = {
+            key[len(FIXTURE_PLANT_ID) :]: datapoint
+            for key, datapoint in {
+                **load_fixture("sensors.json")["values"],
+                **load_fixture("device_info.json")["values"],
+            }.items()
+        }
+
+        self.base_mode: int = HOME
+        self.calendar_active = False
+        self.calendar_mode: int = HOME
+        self.away = False
+        self.away_at: Optional[float] = None
+        self.timed_mode: Optional[int] = None
+        self.timed_until: float = 0.0
+        self.toggles: int = 0
+        # Paths whose writes fail, to test recovery from failed writes
+        self.rejected_paths: Set[str] = set()
+
+    # Datapoint access
+
+    def value(self, path: str) -> Any:
+        """Return raw value of a datapoint."""
+        return self._datapoints[path]["value"]["value"]
+
+    def set_value(self, path: str, value: Any) -> None:
+        """Set raw value of a datapoint."""
+        self._datapoints[path]["value"]["value"] = value
+
+    def read(self, path: str) -> Optional[Dict[str, Any]]:
+        """Return datapoint as sent by the API, or None if the unit lacks it."""
+
+        if path in (MODE_HOME_HIGH_CAL_PUT_PATH, MODE_PATH):
+            return {"value": self._mode_value()}
+        if path == CURRENT_FIREPLACE_DURATION_PATH:
+            return {"value": {"value": self._minutes_left(FIREPLACE)}}
+        if path == CURRENT_BOOST_DURATION_PATH:
+            return {"value": {"value": self._minutes_left(FORCED_VENTILATION)}}
+        return self._datapoints.get(path)
+
+    def write(self, path: str, value: Optional[str]) -> bool:
+        """Apply a write, returning false if the datapoint is not writable."""
+
+        if path in self.rejected_paths:
+            return False
+        number = None if value is None else float(value)
+
+        if path == MODE_HOME_HIGH_CAL_PUT_PATH:
+            # Writing null hands the mode back to the calendar
+            self.calendar_active = number is None
+            if number is not None:
+                self.base_mode = int(number)
+        elif path == MODE_AWAY_PUT_PATH:
+            self._write_away(number)
+        elif path in (MODE_FIREPLACE_PUT_PATH, MODE_HIGH_TEMP_PUT_PATH):
+            if number != TOGGLE:
+                return False
+            self._toggle(
+                FIREPLACE if path == MODE_FIREPLACE_PUT_PATH else FORCED_VENTILATION
+            )
+        elif path == ACKNOWLEDGE_FILTER_ALARM_CODE_PATH:
+            if number != ACKNOWLEDGE:
+                return False
+            if not self._filter_dirty:
+                self.set_value(ALARM_CODE_A_PATH, 0)
+        elif path in WRITABLE_PATHS and number is not None:
+            self.set_value(path, number)
+        else:
+            return False
+        return True
+
+    # Mode state
+
+    @property
+    def ventilation_mode(self) -> int:
+        """Return the mode the unit runs in."""
+
+        if self.timed_mode is not None:
+            return self.timed_mode
+        if self.away:
+            return AWAY
+        return self.calendar_mode if self.calendar_active else self.base_mode
+
+    def _mode_value(self) -> Dict[str, Any]:
+        """Return value of the mode datapoint."""
+
+        return {
+            "value": self.ventilation_mode,
+            "statusFlags": 0,
+            "reliability": 0,
+            "presentPriority": CALENDAR_PRIORITY
+            if self._calendar_running
+            else MANUAL_PRIORITY,
+            "eventState": 0,
+        }
+
+    @property
+    def _calendar_running(self) -> bool:
+        """Return true if the calendar sets the mode the unit runs in."""
+        return self.calendar_active and self.timed_mode is None and not self.away
+
+    def _write_away(self, number: Optional[float]) -> None:
+        """Enter away, after the away delay if set, or leave it."""
+
+        if number == 0:
+            delay = self.value(AWAY_DELAY_PATH) * 60
+            if delay:
+                self.away_at = self.now + delay
+            else:
+                self.away = True
+        else:
+            self.away = False
+            self.away_at = None
+
+    def _toggle(self, mode: int) -> None:
+        """Start timed mode, or stop it if it is running."""
+
+        self.toggles += 1
+        if self.timed_mode == mode:
+            self.timed_mode = None
+            return
+
+        duration_path = (
+            FIREPLACE_DURATION_PATH if mode == FIREPLACE else BOOST_DURATION_PATH
+        )
+        self.timed_mode = mode
+        self.timed_until = self.now + self.value(duration_path) * 60
+
+    def _minutes_left(self, mode: int) -> int:
+        """Return minutes left of timed mode."""
+
+        if self.timed_mode != mode:
+            return 0
+        return math.ceil((self.timed_until - self.now) / 60)
+
+    @property
+    def _filter_dirty(self) -> bool:
+        """Return true if the filter has run its exchange interval."""
+
+        return self.value(FILTER_OPERATING_TIME_PATH) >= self.value(
+            FILTER_TIME_FOR_EXCHANGE_PATH
+        )
+
+    # Time
+
+    def advance(self, seconds: float) -> None:
+        """Let seconds pass on the unit."""
+
+        self.now += seconds
+
+        if self.timed_mode is not None and self.now >= self.timed_until:
+            self.timed_mode = None
+        if self.away_at is not None and self.now >= self.away_at:
+            self.away = True
+            self.away_at = None
+
+        self.set_value(
+            FILTER_OPERATING_TIME_PATH,
+            self.value(FILTER_OPERATING_TIME_PATH) + seconds / 3600,
+        )
+        if self._filter_dirty:
+            self.set_value(ALARM_CODE_A_PATH, FILTER_ALARM_CODE)
+
+        self._drift(seconds)
+
+    def _drift(self, seconds: float) -> None:
+        """Move temperatures and fans towards what the mode and weather ask for."""
+
+        mode = self.ventilation_mode
+        heater = self.value(HEATER_PATH) == 1
+        target = self.value(
+            AWAY_AIR_TEMPERATURE_PATH if mode == AWAY else HOME_AIR_TEMPERATURE_PATH
+        )
+
+        outside = 5 + 5 * math.sin(2 * math.pi * self.now / DAY)
+        room = self.value(ROOM_TEMPERATURE_PATH)
+        room_target = target if heater else (target + outside) / 2
+        if mode == FIREPLACE:
+            room_target += 3
+        room += (room_target - room) * min(1, ROOM_RESPONSE * seconds / 3600)
+
+        supply = room_target if heater else outside + 0.8 * (room - outside)
+        supply_signal, extract_signal = FAN_SIGNALS.get(mode, FAN_SIGNALS[HOME])
+
+        for path, value in (
+            (OUTSIDE_AIR_TEMPERATURE_PATH, outside),
+            (ROOM_TEMPERATURE_PATH, room),
+            (EXTRACT_AIR_TEMPERATURE_PATH, room),
+            (SUPPLY_AIR_TEMPERATURE_PATH, supply),
+            (EXHAUST_AIR_TEMPERATURE_PATH, outside + 0.2 * (room - outside)),
+        ):
+            self.set_value(path, round(value + self._random.uniform(-0.1, 0.1), 2))
+
+        self.set_value(SUPPLY_FAN_CONTROL_SIGNAL_PATH, supply_signal)
+        self.set_value(EXTRACT_FAN_CONTROL_SIGNAL_PATH, extract_signal)
+        self.set_value(SUPPLY_FAN_SPEED_PATH, supply_signal * FAN_RPM_PER_PERCENT)
+        self.set_value(EXTRACT_FAN_SPEED_PATH, extract_signal * FAN_RPM_PER_PERCENT)
+        self.set_value(HEAT_EXCHANGER_SPEED_PATH, 100 if outside < room else 0)
+        self.set_value(
+            ADDITIONAL_HEATER_PATH, 100 if heater and supply < target - 1 else 0
+        )
+
+
+class SimulatedUnits:
+    """Simulated units of every plant, served by the Climatix stand-in."""
+
+    def __init__(self, plant_ids: Sequence[str], seed: Optional[int] = None) -> None:
+        """Initialize."""
+
+        self.plant_ids = list(plant_ids)
+        self.units: Dict[str, SimulatedUnit] = {
+            plant_id: SimulatedUnit(plant_id, None if seed is None else seed + index)
+            for index, plant_id in enumerate(self.plant_ids)
+        }
+
+    def __getitem__(self, plant_id: str) -> SimulatedUnit:
+        """Return unit of plant."""
+        return self.units[plant_id]
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return datapoint of key, made of plant id and path."""
+
+        plant_id, path = self._split(key)
+        unit = self.units.get(plant_id)
+        return unit.read(path) if unit else None
+
+    def write(self, key: str, value: Optional[str]) -> bool:
+        """Write value to datapoint of key."""
+
+        plant_id, path = self._split(key)
+        unit = self.units.get(plant_id)
+        return unit.write(path, value) if unit else False
+
+    def advance(self, seconds: float) -> None:
+        """Let seconds pass on every unit."""
+
+        for unit in self.units.values():
+            unit.advance(seconds)
+
+    @staticmethod
+    def _split(key: str) -> Tuple[str, str]:
+        """Split key into plant id and path."""
+
+        plant_id, _, path = key.partition(";")
+        return plant_id, f";{path}"
@@ -0,0 +1,219 @@
+"""Tests for the Flexit API client against the local Climatix stand-in."""
+
+import asyncio
+import time
+from typing import AsyncIterator
+
+import aiohttp
+import pytest
+
+from custom_components.flexit.api import (
+    ApiRateLimitedException,
+    ApiTransientException,
+    FlexitApiClient,
+)
+from custom_components.flexit.const import (
+    BOOST_DURATION_PATH,
+    FIREPLACE_DURATION_PATH,
+)
+from custom_components.flexit.retry import CircuitBreaker, RetryPolicy
+from custom_components.flexit.throttle import RequestThrottle
+
+from .climatix import ClimatixStandIn, StandInConfig
+
+PLANT_IDS = ["PLANT_A", "PLANT_B"]
+FAST_RETRIES = RetryPolicy(attempts=3, base_delay=0.01, timeout=0.5, jitter=False)
+
+
+@pytest.fixture
+async def standin() -> AsyncIterator[ClimatixStandIn]:
+    """Run a stand-in serving two plants."""
+
+    async with ClimatixStandIn(plant_ids=PLANT_IDS) as standin:
+        yield standin
+
+
+@pytest.fixture
+async def client(standin: ClimatixStandIn) -> AsyncIterator[FlexitApiClient]:
+    """Return a client of the stand-in."""
+
+    async with aiohttp.ClientSession() as session:
+        yield FlexitApiClient(
+            session,
+            "user",
+            "password",
+            retry_policy=FAST_RETRIES,
+            throttle=RequestThrottle(rate=1000, burst=1000),
+            api_url=standin.url,
+        )
+
+
+async def test_find_plants(client: FlexitApiClient) -> None:
+    """Test plants are listed."""
+    assert [plant.id for plant in await client.find_plants()] == PLANT_IDS
+
+
+async def test_sensor_data_many(
+    client: FlexitApiClient, standin: ClimatixStandIn
+) -> None:
+    """Test data of every plant is fetched in one request."""
+
+    data = await client.sensor_data_many(PLANT_IDS)
+
+    assert set(data) == set(PLANT_IDS)
+    assert data["PLANT_A"].room_temperature == 26.5
+    assert data["PLANT_B"].ventilation_mode == "Home"
+    assert standin.requests == {"Token": 1, "DataPoints": 1}
+
+
+async def test_device_info_many(client: FlexitApiClient) -> None:
+    """Test device info is fetched."""
+
+    device_info = await client.device_info_many(PLANT_IDS)
+
+    assert device_info["PLANT_A"].modelName == "SOC19A"
+
+
+async def test_update(client: FlexitApiClient, standin: ClimatixStandIn) -> None:
+    """Test a written value is read back."""
+
+    plant = client.for_plant("PLANT_A")
+
+    assert await plant.set_fireplace_duration(25)
+    assert standin.writes == [
+        {"datapoint": f"PLANT_A{FIREPLACE_DURATION_PATH}", "value": "25"}
+    ]
+    assert (await plant.sensor_data()).fireplace_duration == 25
+
+
+async def test_update_many_unknown_order(
+    client: FlexitApiClient, standin: ClimatixStandIn
+) -> None:
+    """Test an order naming a path not written is refused before writing."""
+
+    plant = client.for_plant("PLANT_A")
+
+    with pytest.raises(ValueError):
+        await plant.update_many(
+            {FIREPLACE_DURATION_PATH: 25},
+            [(BOOST_DURATION_PATH, FIREPLACE_DURATION_PATH)],
+        )
+    assert standin.writes == []
+
+
+async def test_reauthenticates_revoked_token(
+    client: FlexitApiClient, standin: ClimatixStandIn
+) -> None:
+    """Test a rejected token is replaced and the request replayed."""
+
+    await client.find_plants()
+    standin.revoke_tokens()
+
+    assert await client.find_plants()
+    assert standin.requests["Token"] == 2
+
+
+async def test_retries_server_errors(
+    client: FlexitApiClient, standin: ClimatixStandIn
+) -> None:
+    """Test server errors are retried and then raised."""
+
+    await client.auth()
+    standin.config.error_rate = 1.0
+
+    with pytest.raises(ApiTransientException):
+        await client.sensor_data_many(PLANT_IDS)
+    assert standin.requests["DataPoints"] == FAST_RETRIES.attempts
+
+
+async def test_unavailable(client: FlexitApiClient, standin: ClimatixStandIn) -> None:
+    """Test a 503 without Retry-After counts as a failure, not rate limiting."""
+
+    await client.auth()
+    client.circuit_breaker = CircuitBreaker(failure_threshold=1)
+    standin.config = StandInConfig(error_rate=1.0, error_status=503)
+
+    with pytest.raises(ApiTransientException) as error:
+        await client.find_plants()
+    assert not isinstance(error.value, ApiRateLimitedException)
+    assert client.throttle.paused_for == 0
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+
+async def test_rate_limited(client: FlexitApiClient, standin: ClimatixStandIn) -> None:
+    """Test a Retry-After beyond the retry policy is raised instead of waited."""
+
+    await client.auth()
+    standin.config = StandInConfig(rate_limit_rate=1.0, retry_after=600)
+
+    with pytest.raises(ApiRateLimitedException):
+        await client.find_plants()
+    assert client.throttle.paused_for > FAST_RETRIES.max_delay
+
+
+async def test_timeout(client: FlexitApiClient, standin: ClimatixStandIn) -> None:
+    """Test requests time out."""
+
+    await client.auth()
+    standin.config = StandInConfig(timeout_rate=1.0, timeout=5)
+
+    with pytest.raises(ApiTransientException):
+        await client.find_plants()
+
+
+def open_circuit(client: FlexitApiClient) -> None:
+    """Open the circuit of client, due to let a trial request through."""
+
+    breaker = client.circuit_breaker
+    breaker.state = CircuitBreaker.OPEN
+    breaker.opened_at = time.monotonic() - breaker.reset_timeout
+
+
+async def test_circuit_trial_retried(
+    client: FlexitApiClient, standin: ClimatixStandIn
+) -> None:
+    """Test a trial gets its retries before opening the circuit again."""
+
+    await client.auth()
+    open_circuit(client)
+    standin.config.error_rate = 1.0
+
+    with pytest.raises(ApiTransientException):
+        await client.sensor_data_many(PLANT_IDS)
+    assert standin.requests["DataPoints"] == FAST_RETRIES.attempts
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+
+
+async def test_circuit_trial_auth_error(
+    client: FlexitApiClient, standin: ClimatixStandIn
+) -> None:
+    """Test a trial rejected for its token closes the circuit, as the API is up."""
+
+    await client.auth()
+    open_circuit(client)
+    standin.revoke_tokens()
+
+    assert await client.find_plants()
+    assert standin.requests["Token"] == 2
+    assert client.circuit_breaker.state == CircuitBreaker.CLOSED
+
+
+async def test_circuit_trial_cancelled(
+    client: FlexitApiClient, standin: ClimatixStandIn
+) -> None:
+    """Test a cancelled trial opens the circuit again."""
+
+    await client.auth()
+    open_circuit(client)
+    standin.config = StandInConfig(timeout_rate=1.0, timeout=5)
+
+    # Writes are not shared with other callers, so cancelling one ends it
+    plant = client.for_plant("PLANT_A")
+    trial = asyncio.create_task(plant.set_fireplace_duration(25))
+    await asyncio.sleep(0.1)
+    trial.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await trial
+
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+    assert client.circuit_breaker.retry_in > 0
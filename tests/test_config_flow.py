@@ -0,0 +1,64 @@
+"""Tests for the Flexit config flow."""
+
+import functools
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant import config_entries, data_entry_flow
+from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from custom_components.flexit.api import FlexitApiClient
+from custom_components.flexit.const import CONF_PLANTS, DOMAIN
+
+from .climatix import ClimatixStandIn
+from .conftest import PLANT_ID
+
+USER_INPUT = {CONF_NAME: "flexit", CONF_USERNAME: "User", CONF_PASSWORD: "password"}
+
+
+async def configure(hass: HomeAssistant, standin: ClimatixStandIn) -> dict:
+    """Run the user step against the stand-in."""
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    with patch(
+        "custom_components.flexit.config_flow.FlexitApiClient",
+        functools.partial(FlexitApiClient, api_url=standin.url),
+    ), patch("custom_components.flexit.async_setup_entry", return_value=True):
+        return await hass.config_entries.flow.async_configure(
+            result["flow_id"], USER_INPUT
+        )
+
+
+async def test_account_entry(
+    hass: HomeAssistant, enable_custom_integrations: None, standin: ClimatixStandIn
+) -> None:
+    """Test an entry holds every plant of the account."""
+
+    result = await configure(hass, standin)
+
+    assert result["type"] == data_entry_flow.FlowResultType.CREATE_ENTRY
+    assert result["title"] == "Flexit"
+    assert result["data"] == {**USER_INPUT, CONF_PLANTS: [PLANT_ID]}
+    assert result["result"].unique_id == "user"
+
+
+async def test_plant_configured(
+    hass: HomeAssistant, enable_custom_integrations: None, standin: ClimatixStandIn
+) -> None:
+    """Test an account is not added again for a plant an entry manages."""
+
+    MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**USER_INPUT, CONF_PLANTS: [PLANT_ID]},
+        unique_id=PLANT_ID,
+    ).add_to_hass(hass)
+
+    result = await configure(hass, standin)
+
+    assert result["type"] == data_entry_flow.FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
@@ -0,0 +1,117 @@
+"""Tests for reading written values back until the unit reports them."""
+
+import asyncio
+from typing import Any, Callable, Iterator
+from unittest.mock import patch
+
+import attr
+import pytest
+
+from custom_components.flexit.const import (
+    AWAY_DELAY_PATH,
+    MODE_AWAY,
+    MODE_DATAPOINTS,
+    MODE_HOME,
+)
+from custom_components.flexit.coordinator import FlexitDataUpdateCoordinator
+from custom_components.flexit.metrics import UNVERIFIED_WRITES, VERIFIED_WRITES
+
+from .climatix import ClimatixStandIn
+from .conftest import PLANT_ID
+
+VERIFY_TIMEOUT = 0.3
+
+
+@pytest.fixture(autouse=True)
+def fast_verify() -> Iterator[None]:
+    """Read back every few milliseconds, giving up within a second."""
+
+    with patch("custom_components.flexit.coordinator.VERIFY_DELAY", 0.01), patch(
+        "custom_components.flexit.coordinator.VERIFY_MAX_DELAY", 0.04
+    ), patch("custom_components.flexit.coordinator.VERIFY_TIMEOUT", VERIFY_TIMEOUT):
+        yield
+
+
+def show_written(coordinator: FlexitDataUpdateCoordinator, **changes: Any) -> None:
+    """Show values as written, as entities do, and verify them."""
+
+    coordinator.data[PLANT_ID] = attr.evolve(coordinator.data[PLANT_ID], **changes)
+    coordinator.async_verify(PLANT_ID, changes)
+
+
+async def wait_for(condition: Callable[[], bool]) -> None:
+    """Wait until condition holds."""
+
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    pytest.fail("Condition not met in time")
+
+
+async def test_converges(
+    standin: ClimatixStandIn, coordinator: FlexitDataUpdateCoordinator
+) -> None:
+    """Test a value the unit applies late is read back until it shows."""
+
+    unit = standin.units[PLANT_ID]
+    unit.set_value(AWAY_DELAY_PATH, 1)
+    unit.write(*MODE_DATAPOINTS[MODE_AWAY])
+    requests = standin.requests["DataPoints"]
+
+    show_written(coordinator, ventilation_mode=MODE_AWAY)
+    await wait_for(lambda: standin.requests["DataPoints"] - requests >= 2)
+    assert coordinator.metrics.counter(VERIFIED_WRITES) == 0
+
+    unit.advance(60)
+    await wait_for(lambda: coordinator.metrics.counter(VERIFIED_WRITES) == 1)
+
+    assert coordinator.data[PLANT_ID].ventilation_mode == MODE_AWAY
+    assert coordinator.metrics.counter(UNVERIFIED_WRITES) == 0
+
+
+async def test_timeout_refreshes(
+    standin: ClimatixStandIn, coordinator: FlexitDataUpdateCoordinator
+) -> None:
+    """Test a value never reported is replaced by a poll once time runs out."""
+
+    show_written(coordinator, ventilation_mode=MODE_AWAY)
+    await wait_for(lambda: coordinator.metrics.counter(UNVERIFIED_WRITES) == 1)
+    await wait_for(lambda: coordinator.data[PLANT_ID].ventilation_mode == MODE_HOME)
+
+    assert coordinator.metrics.counter(VERIFIED_WRITES) == 0
+
+
+async def test_superseded(
+    standin: ClimatixStandIn, coordinator: FlexitDataUpdateCoordinator
+) -> None:
+    """Test a newer write of the same field ends the check of the older one."""
+
+    show_written(coordinator, ventilation_mode=MODE_AWAY)
+    show_written(coordinator, ventilation_mode=MODE_HOME)
+    await wait_for(lambda: coordinator.metrics.counter(VERIFIED_WRITES) == 1)
+    await asyncio.sleep(2 * VERIFY_TIMEOUT)
+
+    assert coordinator.metrics.counter(UNVERIFIED_WRITES) == 0
+    assert coordinator.data[PLANT_ID].ventilation_mode == MODE_HOME
+
+
+async def test_keeps_other_writes(
+    standin: ClimatixStandIn, coordinator: FlexitDataUpdateCoordinator
+) -> None:
+    """Test reading back one write keeps the values shown for other writes."""
+
+    unit = standin.units[PLANT_ID]
+    unit.set_value(AWAY_DELAY_PATH, 0)
+    unit.write(*MODE_DATAPOINTS[MODE_AWAY])
+    heater = not coordinator.data[PLANT_ID].electric_heater
+
+    # The heater is shown as written, its own check still running
+    coordinator.data[PLANT_ID] = attr.evolve(
+        coordinator.data[PLANT_ID], electric_heater=heater
+    )
+    show_written(coordinator, ventilation_mode=MODE_AWAY)
+    await wait_for(lambda: coordinator.metrics.counter(VERIFIED_WRITES) == 1)
+
+    assert coordinator.data[PLANT_ID].ventilation_mode == MODE_AWAY
+    assert coordinator.data[PLANT_ID].electric_heater == heater
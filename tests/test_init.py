@@ -0,0 +1,97 @@
+"""Tests for setting up and migrating Flexit entries."""
+
+from typing import Any, Dict
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import CONF_NAME, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.flexit.const import CONF_PLANT, CONF_PLANTS, DOMAIN
+from custom_components.flexit.store import KEY_DEVICE_INFO, KEY_TOKEN, FlexitStore
+
+from .climatix import ClimatixStandIn
+from .conftest import PLANT_ID, async_setup_entry
+
+LEGACY_DATA = {
+    CONF_NAME: "Flexit",
+    CONF_USERNAME: "User",
+    CONF_PASSWORD: "password",
+    CONF_PLANT: PLANT_ID,
+}
+
+
+async def test_migrate_legacy_entry(
+    hass: HomeAssistant, enable_custom_integrations: None, standin: ClimatixStandIn
+) -> None:
+    """Test an entry of a single plant becomes an entry of the account."""
+
+    entry = MockConfigEntry(
+        domain=DOMAIN, version=1, data=LEGACY_DATA, unique_id=PLANT_ID
+    )
+    entry.add_to_hass(hass)
+    device_registry = dr.async_get(hass)
+    entity_registry = er.async_get(hass)
+    device = device_registry.async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={(DOMAIN, "Flexit")}
+    )
+    entity = entity_registry.async_get_or_create(
+        "sensor", DOMAIN, "room_temperature", config_entry=entry, device_id=device.id
+    )
+
+    assert await async_setup_entry(hass, standin, entry)
+
+    assert entry.version == 2
+    assert entry.unique_id == "user"
+    assert entry.data[CONF_PLANTS] == [PLANT_ID]
+    assert CONF_PLANT not in entry.data
+    assert device_registry.async_get(device.id).identifiers == {(DOMAIN, PLANT_ID)}
+    assert (
+        entity_registry.async_get(entity.entity_id).unique_id
+        == f"{PLANT_ID}_room_temperature"
+    )
+    # The entity keeps its id and is set up again
+    assert hass.states.get(entity.entity_id).state != "unavailable"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_migrate_plant_managed_twice(
+    hass: HomeAssistant, enable_custom_integrations: None, standin: ClimatixStandIn
+) -> None:
+    """Test an entry of a plant an account entry manages too is left as is."""
+
+    MockConfigEntry(
+        domain=DOMAIN,
+        version=2,
+        data={**LEGACY_DATA, CONF_PLANTS: [PLANT_ID]},
+        unique_id="user",
+    ).add_to_hass(hass)
+    entry = MockConfigEntry(
+        domain=DOMAIN, version=1, data=LEGACY_DATA, unique_id=PLANT_ID
+    )
+
+    assert not await async_setup_entry(hass, standin, entry)
+    assert entry.version == 1
+
+
+async def test_store_migration(
+    hass: HomeAssistant, hass_storage: Dict[str, Any]
+) -> None:
+    """Test snapshots of the first storage version are dropped, but not the token."""
+
+    token = {"access_token": "token", "expires_at": 0}
+    hass_storage[f"{DOMAIN}.entry"] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.entry",
+        "data": {KEY_DEVICE_INFO: {"fw": "1.0"}, KEY_TOKEN: token},
+    }
+
+    store = FlexitStore(hass, "entry")
+    await store.async_load()
+
+    assert store.device_info == {}
+    assert store.sensor_data == {}
+    assert store.token == token
@@ -0,0 +1,159 @@
+"""Tests for preset transitions against the simulated unit."""
+
+from typing import AsyncIterator, List, Tuple
+
+import aiohttp
+from homeassistant.components.climate.const import PRESET_BOOST, PRESET_HOME
+import pytest
+
+from custom_components.flexit.api import FlexitApiClient
+from custom_components.flexit.const import (
+    AWAY_DELAY_PATH,
+    MODE_AWAY,
+    MODE_CAL_AWAY,
+    MODE_CAL_HOME,
+    MODE_DATAPOINTS,
+    MODE_FIREPLACE,
+    MODE_FORCED_VENTILATION,
+    MODE_HIGH,
+    MODE_HIGH_TEMP_PUT_PATH,
+    MODE_HOME,
+    MODE_HOME_HIGH_CAL_PUT_PATH,
+    PRESET_BOOST_TEMP,
+    PRESETS,
+)
+from custom_components.flexit.presets import PRESET_MODES, plan_transition
+from custom_components.flexit.retry import RetryPolicy
+from custom_components.flexit.throttle import RequestThrottle
+
+from .climatix import ClimatixStandIn
+from .simulator import AWAY, SimulatedUnit, SimulatedUnits
+
+PLANT_ID = "PLANT_A"
+
+START_MODES = [
+    MODE_HOME,
+    MODE_HIGH,
+    MODE_AWAY,
+    MODE_FIREPLACE,
+    MODE_FORCED_VENTILATION,
+    MODE_CAL_HOME,
+    MODE_CAL_AWAY,
+]
+# Writes needed to leave a mode before another is entered
+LEAVE_WRITES = {MODE_AWAY: 1, MODE_FIREPLACE: 1, MODE_FORCED_VENTILATION: 1}
+
+TRANSITIONS: List[Tuple[str, str, int]] = [
+    (
+        start,
+        preset,
+        0 if start == PRESET_MODES[preset] else LEAVE_WRITES.get(start, 0) + 1,
+    )
+    for start in START_MODES
+    for preset in PRESETS
+]
+
+
+@pytest.fixture
+def standin_units() -> SimulatedUnits:
+    """Return a simulated unit entering away without delay."""
+
+    units = SimulatedUnits([PLANT_ID], seed=1)
+    units[PLANT_ID].set_value(AWAY_DELAY_PATH, 0)
+    return units
+
+
+@pytest.fixture
+def unit(standin_units: SimulatedUnits) -> SimulatedUnit:
+    """Return the simulated unit."""
+    return standin_units[PLANT_ID]
+
+
+@pytest.fixture
+async def standin(standin_units: SimulatedUnits) -> AsyncIterator[ClimatixStandIn]:
+    """Run a stand-in serving the simulated unit."""
+
+    async with ClimatixStandIn(units=standin_units) as standin:
+        yield standin
+
+
+@pytest.fixture
+async def client(standin: ClimatixStandIn) -> AsyncIterator[FlexitApiClient]:
+    """Return a client of the simulated unit."""
+
+    async with aiohttp.ClientSession() as session:
+        yield FlexitApiClient(
+            session,
+            "user",
+            "password",
+            plant_id=PLANT_ID,
+            retry_policy=RetryPolicy(base_delay=0.01, jitter=False),
+            throttle=RequestThrottle(rate=1000, burst=1000),
+            api_url=standin.url,
+        )
+
+
+def start_in(unit: SimulatedUnit, mode: str) -> None:
+    """Put unit in mode."""
+
+    if mode in (MODE_CAL_HOME, MODE_CAL_AWAY):
+        if mode == MODE_CAL_AWAY:
+            unit.calendar_mode = AWAY
+        unit.write(MODE_HOME_HIGH_CAL_PUT_PATH, None)
+    else:
+        unit.write(*MODE_DATAPOINTS[mode])
+
+
+async def set_preset(client: FlexitApiClient, preset: str) -> bool:
+    """Plan and apply transition to preset from the mode the unit reports."""
+
+    data = await client.sensor_data()
+    transition = plan_transition(
+        data.ventilation_mode, data.calendar_active, PRESET_MODES[preset]
+    )
+    return await transition.async_apply(client)
+
+
+@pytest.mark.parametrize("start, preset, writes", TRANSITIONS)
+async def test_transition(
+    client: FlexitApiClient,
+    standin: ClimatixStandIn,
+    unit: SimulatedUnit,
+    start: str,
+    preset: str,
+    writes: int,
+) -> None:
+    """Test every preset is reached from every mode with the fewest writes."""
+
+    start_in(unit, start)
+    assert (await client.sensor_data()).ventilation_mode == start
+
+    assert await set_preset(client, preset)
+
+    assert (await client.sensor_data()).ventilation_mode == PRESET_MODES[preset]
+    assert len(standin.writes) == writes
+
+
+@pytest.mark.parametrize(
+    "start, preset, rejected_path",
+    [
+        (MODE_FIREPLACE, PRESET_BOOST_TEMP, MODE_HIGH_TEMP_PUT_PATH),
+        (MODE_AWAY, PRESET_HOME, MODE_HOME_HIGH_CAL_PUT_PATH),
+        (MODE_HOME, PRESET_BOOST, MODE_HOME_HIGH_CAL_PUT_PATH),
+    ],
+)
+async def test_rollback(
+    client: FlexitApiClient,
+    unit: SimulatedUnit,
+    start: str,
+    preset: str,
+    rejected_path: str,
+) -> None:
+    """Test the unit is left in its mode when a write of the transition fails."""
+
+    start_in(unit, start)
+    unit.rejected_paths.add(rejected_path)
+
+    assert not await set_preset(client, preset)
+
+    assert (await client.sensor_data()).ventilation_mode == start
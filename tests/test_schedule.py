@@ -0,0 +1,125 @@
+"""Tests for learning the calendar schedule from the modes polled."""
+
+from datetime import datetime, timedelta, timezone
+
+import attr
+
+from custom_components.flexit.const import MODE_CAL_AWAY, MODE_CAL_HOME, MODE_HOME
+from custom_components.flexit.models import FlexitSensorsResponse
+from custom_components.flexit.schedule import (
+    MAX_MISSES,
+    POLL_DELAY,
+    PRECISION,
+    CalendarSchedule,
+    CalendarTransition,
+    second_of_week,
+)
+
+PLANT_ID = "PLANT_A"
+# Regular polls are not aligned with the calendar
+START = datetime(2024, 1, 1, 0, 13, tzinfo=timezone.utc)
+POLL_INTERVAL = timedelta(minutes=30)
+WEEK = timedelta(weeks=1)
+
+DATA = FlexitSensorsResponse(
+    **{
+        field.name: False if field.type is bool else 0
+        for field in attr.fields(FlexitSensorsResponse)
+    }
+)
+
+
+def calendar_mode(moment: datetime) -> str:
+    """Return mode of a calendar switching to home at 7:00 and away at 22:00."""
+    return MODE_CAL_HOME if 7 <= moment.hour < 22 else MODE_CAL_AWAY
+
+
+def observe(
+    schedule: CalendarSchedule,
+    moment: datetime,
+    mode: str,
+    calendar_active: bool = True,
+) -> None:
+    """Poll mode at moment."""
+
+    schedule.observe(
+        PLANT_ID,
+        attr.evolve(DATA, ventilation_mode=mode, calendar_active=calendar_active),
+        moment,
+    )
+
+
+def run(schedule: CalendarSchedule, start: datetime, end: datetime) -> int:
+    """Poll like the coordinator until end, returning the polls for switches."""
+
+    extra = 0
+    moment = start
+    while moment < end:
+        observe(schedule, moment, calendar_mode(moment))
+        next_moment = moment + POLL_INTERVAL
+        poll_at = schedule.next_poll(moment)
+        if poll_at is not None and poll_at <= next_moment:
+            extra += 1
+            next_moment = poll_at
+        moment = next_moment
+    return extra
+
+
+def test_learns_switches() -> None:
+    """Test every switch is learned to the minute within weeks."""
+
+    schedule = CalendarSchedule()
+    run(schedule, START, START + 8 * WEEK)
+
+    transitions = schedule.transitions[PLANT_ID]
+    assert len(transitions) == 14
+    for transition in transitions:
+        assert transition.length <= PRECISION
+        # The switch on the hour is within the window
+        assert -transition.start % 3600 <= transition.length
+
+    # A week later, every switch is polled just after it and nothing else
+    assert run(schedule, START + 8 * WEEK, START + 9 * WEEK) == 14
+
+
+def test_polls_just_after_switch() -> None:
+    """Test the poll for a switch learned comes seconds after it."""
+
+    schedule = CalendarSchedule()
+    run(schedule, START, START + 8 * WEEK)
+
+    before = START + 9 * WEEK + timedelta(hours=6, minutes=40)
+    switch = before.replace(hour=7, minute=0)
+    assert switch < schedule.next_poll(before) <= switch + timedelta(
+        seconds=PRECISION + POLL_DELAY
+    )
+
+
+def test_forgets_removed_switch() -> None:
+    """Test a switch not seen on its time for weeks is forgotten."""
+
+    switch = START.replace(hour=7, minute=0)
+    schedule = CalendarSchedule(
+        {PLANT_ID: [CalendarTransition(MODE_CAL_HOME, second_of_week(switch), 0)]}
+    )
+
+    for week in range(MAX_MISSES):
+        after = switch + week * WEEK + timedelta(seconds=POLL_DELAY)
+        observe(schedule, after, MODE_CAL_AWAY)
+        # Later polls of the same week are not counted again
+        observe(schedule, after + timedelta(seconds=30), MODE_CAL_AWAY)
+        assert len(schedule.transitions[PLANT_ID]) == (week < MAX_MISSES - 1)
+
+    assert schedule.next_poll(switch) is None
+
+
+def test_ignores_overrides() -> None:
+    """Test modes set outside the calendar are not taken for switches."""
+
+    schedule = CalendarSchedule()
+    observe(schedule, START, MODE_CAL_AWAY)
+    observe(schedule, START + POLL_INTERVAL, MODE_HOME, calendar_active=False)
+    observe(schedule, START + 2 * POLL_INTERVAL, MODE_CAL_AWAY)
+
+    assert not schedule.transitions[PLANT_ID]
+    assert schedule.next_poll(START) is None
@@ -0,0 +1,41 @@
+"""Tests for the Flexit sensors."""
+
+from typing import List
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.flexit.coordinator import FlexitDataUpdateCoordinator
+from custom_components.flexit.sensor import HEALTH_SENSORS, SENSORS
+
+from .conftest import PLANT_ID
+
+PLANT_IDS = [PLANT_ID, "PLANT_B"]
+
+
+@pytest.fixture
+def plant_ids() -> List[str]:
+    """Return plants of the entry."""
+    return PLANT_IDS
+
+
+async def test_health_sensors_once(
+    hass: HomeAssistant, coordinator: FlexitDataUpdateCoordinator
+) -> None:
+    """Test the health of the shared connection is shown once per entry."""
+
+    entity_registry = er.async_get(hass)
+    unique_ids = {
+        entry.unique_id
+        for entry in er.async_entries_for_config_entry(
+            entity_registry, coordinator.config_entry.entry_id
+        )
+    }
+
+    for description in HEALTH_SENSORS:
+        assert f"{PLANT_ID}_{description.key}" in unique_ids
+        assert f"PLANT_B_{description.key}" not in unique_ids
+    for description in SENSORS:
+        assert {f"{plant_id}_{description.key}" for plant_id in PLANT_IDS} <= unique_ids
@@ -0,0 +1,144 @@
+"""Tests for the simulated Flexit unit behind the Climatix stand-in."""
+
+from typing import AsyncIterator
+
+import aiohttp
+import pytest
+
+from custom_components.flexit.api import FlexitApiClient
+from custom_components.flexit.const import (
+    MODE_AWAY,
+    MODE_CAL_HOME,
+    MODE_FIREPLACE,
+    MODE_FORCED_VENTILATION,
+    MODE_HIGH,
+    MODE_HOME,
+    ROOM_TEMPERATURE_PATH,
+)
+from custom_components.flexit.retry import RetryPolicy
+from custom_components.flexit.throttle import RequestThrottle
+
+from .climatix import ClimatixStandIn
+from .simulator import SimulatedUnits
+
+PLANT_ID = "PLANT_A"
+
+
+@pytest.fixture
+def units() -> SimulatedUnits:
+    """Return a simulated unit."""
+    return SimulatedUnits([PLANT_ID], seed=1)
+
+
+@pytest.fixture
+async def client(units: SimulatedUnits) -> AsyncIterator[FlexitApiClient]:
+    """Return a client of the unit served by the stand-in."""
+
+    async with ClimatixStandIn(units=units) as standin:
+        async with aiohttp.ClientSession() as session:
+            yield FlexitApiClient(
+                session,
+                "user",
+                "password",
+                plant_id=PLANT_ID,
+                retry_policy=RetryPolicy(base_delay=0.01, jitter=False),
+                throttle=RequestThrottle(rate=1000, burst=1000),
+                api_url=standin.url,
+            )
+
+
+async def mode(client: FlexitApiClient) -> str:
+    """Return ventilation mode read from the unit."""
+    return (await client.sensor_data()).ventilation_mode
+
+
+async def test_toggle_runs_for_duration(
+    client: FlexitApiClient, units: SimulatedUnits
+) -> None:
+    """Test fireplace runs for its duration and ends by itself."""
+
+    await client.set_fireplace_duration(10)
+    await client.set_mode(MODE_FIREPLACE)
+    assert await mode(client) == MODE_FIREPLACE
+
+    units.advance(9 * 60)
+    assert await mode(client) == MODE_FIREPLACE
+
+    units.advance(60)
+    assert await mode(client) == MODE_HOME
+
+
+async def test_toggle_twice_stops(client: FlexitApiClient) -> None:
+    """Test writing a toggle again stops the timed mode."""
+
+    await client.set_mode(MODE_FORCED_VENTILATION)
+    assert await mode(client) == MODE_FORCED_VENTILATION
+
+    await client.set_mode(MODE_FORCED_VENTILATION)
+    assert await mode(client) == MODE_HOME
+
+
+async def test_timed_mode_overrides_base_mode(client: FlexitApiClient) -> None:
+    """Test the base mode written during a timed mode applies after it."""
+
+    await client.set_mode(MODE_FIREPLACE)
+    await client.set_mode(MODE_HIGH)
+    assert await mode(client) == MODE_FIREPLACE
+
+    await client.set_mode(MODE_FIREPLACE)
+    assert await mode(client) == MODE_HIGH
+
+
+async def test_away_delay(client: FlexitApiClient, units: SimulatedUnits) -> None:
+    """Test away starts after the away delay."""
+
+    await client.set_away_delay(5)
+    await client.set_mode(MODE_AWAY)
+    assert await mode(client) == MODE_HOME
+
+    units.advance(5 * 60)
+    assert await mode(client) == MODE_AWAY
+
+
+async def test_calendar(client: FlexitApiClient) -> None:
+    """Test the calendar takes over until a mode is written."""
+
+    await client.set_calendar_active()
+    data = await client.sensor_data()
+    assert data.calendar_active
+    assert data.ventilation_mode == MODE_CAL_HOME
+
+    await client.set_mode(MODE_HIGH)
+    assert not (await client.sensor_data()).calendar_active
+
+
+async def test_filter_alarm(client: FlexitApiClient, units: SimulatedUnits) -> None:
+    """Test the filter alarm is raised by operating hours and cleared by a reset."""
+
+    data = await client.sensor_data()
+    units.advance(
+        (data.filter_time_for_exchange - data.filter_operating_time + 1) * 3600
+    )
+
+    data = await client.sensor_data()
+    assert data.dirty_filter
+    assert data.alarm_code_a > 0
+
+    assert await client.reset_dirty_filter(1)
+    data = await client.sensor_data()
+    assert not data.dirty_filter
+    assert data.alarm_code_a == 0
+
+
+async def test_temperatures_drift(
+    client: FlexitApiClient, units: SimulatedUnits
+) -> None:
+    """Test the room warms towards the set point with the heater on."""
+
+    await client.set_heater_state(True)
+    await client.set_home_temp(22)
+    units[PLANT_ID].set_value(ROOM_TEMPERATURE_PATH, 18.0)
+
+    units.advance(3 * 3600)
+
+    assert 20 < (await client.sensor_data()).room_temperature <= 22.1
@@ -0,0 +1,95 @@
+"""Tests for pacing requests below the API quota."""
+
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from custom_components.flexit import throttle
+from custom_components.flexit.const import (
+    API_CALLS_PER_MINUTE,
+    REQUEST_BURST,
+    REQUEST_RATE,
+)
+from custom_components.flexit.polling import AdaptivePollInterval
+from custom_components.flexit.throttle import RequestBudget, RequestThrottle
+
+
+def test_quota() -> None:
+    """Test a full burst and a minute at the rate stay within the quota."""
+    assert REQUEST_BURST + 60 * REQUEST_RATE <= API_CALLS_PER_MINUTE
+
+
+async def test_requests_in_first_minute(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test requests sent back to back in the first minute stay within the quota."""
+
+    now = 0.0
+
+    async def sleep(seconds: float) -> None:
+        """Advance the clock instead of sleeping, by at least a tick."""
+        nonlocal now
+        now += max(seconds, 0.001)
+
+    # Only the clock of the throttle is faked, not that of the event loop
+    monkeypatch.setattr(throttle, "time", SimpleNamespace(monotonic=lambda: now))
+    monkeypatch.setattr(
+        throttle, "asyncio", SimpleNamespace(Lock=asyncio.Lock, sleep=sleep)
+    )
+
+    request_throttle = RequestThrottle()
+    sent = 0
+    while True:
+        await request_throttle.async_acquire()
+        if now > 60:
+            break
+        sent += 1
+
+    assert sent <= API_CALLS_PER_MINUTE
+
+
+def test_budget_rolls(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test requests count against the budget for a week after they are sent."""
+
+    now = 0.0
+    monkeypatch.setattr(throttle, "time", SimpleNamespace(monotonic=lambda: now))
+
+    budget = RequestBudget(limit=10, reserve=3)
+    for _ in range(7):
+        budget.record()
+        now += 3600
+    assert budget.remaining == 3
+    assert budget.low
+
+    # The first request leaves the window a week after it was sent
+    now = throttle.WEEK + 1
+    assert budget.used == 6
+    assert not budget.low
+
+
+async def test_throttle_records_requests() -> None:
+    """Test every request let through counts against the budget."""
+
+    request_throttle = RequestThrottle()
+    for _ in range(3):
+        await request_throttle.async_acquire()
+    assert request_throttle.budget.used == 3
+
+
+def test_low_budget_polls_at_base() -> None:
+    """Test polls are not sped up while the budget runs low."""
+
+    budget = RequestBudget(limit=10, reserve=3)
+    poll_interval = AdaptivePollInterval(
+        base=timedelta(minutes=30),
+        minimum=timedelta(minutes=5),
+        maximum=timedelta(minutes=120),
+        budget=budget,
+    )
+    poll_interval.note_write()
+    assert poll_interval.next_interval(None, {}) == timedelta(minutes=5)
+
+    for _ in range(7):
+        budget.record()
+    assert poll_interval.fastest == timedelta(minutes=30)
+    assert poll_interval.next_interval(None, {}) == timedelta(minutes=30)
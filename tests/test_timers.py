@@ -0,0 +1,80 @@
+"""Tests for counting timed modes down locally."""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterator
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.flexit.const import MODE_DATAPOINTS, MODE_FIREPLACE, MODE_HOME
+from custom_components.flexit.coordinator import FlexitDataUpdateCoordinator
+
+from .climatix import ClimatixStandIn
+from .conftest import PLANT_ID
+
+
+@pytest.fixture
+def timer_ends() -> Iterator[Dict[datetime, Callable]]:
+    """Catch the actions scheduled at the end of timers, to run them at will."""
+
+    ends: Dict[datetime, Callable] = {}
+
+    def track(hass: HomeAssistant, action: Callable, point_in_time: datetime):
+        """Record action."""
+        ends[point_in_time] = action
+        return lambda: ends.pop(point_in_time, None)
+
+    with patch("custom_components.flexit.timers.async_track_point_in_utc_time", track):
+        yield ends
+
+
+async def poll(hass: HomeAssistant, coordinator: FlexitDataUpdateCoordinator) -> None:
+    """Poll and let the reads it started finish."""
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    # Timer reads run as background tasks
+    await asyncio.sleep(0.1)
+
+
+async def test_activation_requests(
+    hass: HomeAssistant,
+    standin: ClimatixStandIn,
+    timer_ends: Dict[datetime, Callable],
+    coordinator: FlexitDataUpdateCoordinator,
+) -> None:
+    """Test a fireplace run costs one read when seen and one read back at its end."""
+
+    unit = standin.units[PLANT_ID]
+    unit.write(*MODE_DATAPOINTS[MODE_FIREPLACE])
+    polls = 4
+    requests = standin.requests["DataPoints"]
+
+    # The poll seeing the mode change polls again soon, as for any change
+    await poll(hass, coordinator)
+    for _ in range(polls - 1):
+        await poll(hass, coordinator)
+        # The countdown stands in for fast polls while the mode runs
+        assert coordinator.update_interval > coordinator.poll_interval.minimum
+
+    (end,) = timer_ends
+    duration = timedelta(minutes=coordinator.data[PLANT_ID].fireplace_duration)
+    assert abs(end - dt_util.utcnow() - duration) < timedelta(seconds=5)
+    assert coordinator.timers.end(PLANT_ID, MODE_FIREPLACE) == end
+    assert dt_util.parse_datetime(
+        hass.states.get("sensor.fireplace_ends").state
+    ) == end.replace(microsecond=0)
+
+    unit.advance(duration.total_seconds())
+    timer_ends.pop(end)(end)
+    await hass.async_block_till_done()
+    await asyncio.sleep(0.1)
+
+    assert coordinator.data[PLANT_ID].ventilation_mode == MODE_HOME
+    assert hass.states.get("sensor.fireplace_ends").state == "unknown"
+    assert not timer_ends
+    assert standin.requests["DataPoints"] - requests == polls + 2
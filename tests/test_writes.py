@@ -0,0 +1,139 @@
+"""Tests for coalescing bursts of writes to a datapoint."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.flexit.const import DOMAIN, FIREPLACE_DURATION_PATH
+from custom_components.flexit.coordinator import FlexitDataUpdateCoordinator
+
+from .climatix import ClimatixStandIn
+from .conftest import PLANT_ID
+
+KEY = "fireplace_duration"
+
+
+@pytest.fixture
+def entity_id(hass: HomeAssistant, coordinator: FlexitDataUpdateCoordinator) -> str:
+    """Return id of the fireplace duration number."""
+    return er.async_get(hass).async_get_entity_id(
+        "number", DOMAIN, f"{PLANT_ID}_{KEY}"
+    )
+
+
+async def set_value(hass: HomeAssistant, entity_id: str, value: int) -> None:
+    """Move the number to value, as a slider does."""
+
+    await hass.services.async_call(
+        "number",
+        "set_value",
+        {"entity_id": entity_id, "value": value},
+        blocking=True,
+    )
+
+
+async def settle(hass: HomeAssistant) -> None:
+    """Let the debounce delay pass and the writes it sends finish."""
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    await hass.async_block_till_done()
+    # Writes verify themselves in background tasks
+    await asyncio.sleep(0.1)
+
+
+async def test_burst(
+    hass: HomeAssistant,
+    standin: ClimatixStandIn,
+    coordinator: FlexitDataUpdateCoordinator,
+    entity_id: str,
+) -> None:
+    """Test a slider burst is shown at once and only its last value written."""
+
+    for value in (11, 12, 13, 14):
+        await set_value(hass, entity_id, value)
+    assert float(hass.states.get(entity_id).state) == 14
+    assert not standin.writes
+
+    await settle(hass)
+
+    assert [write["value"] for write in standin.writes] == ["14"]
+    assert standin.units[PLANT_ID].value(FIREPLACE_DURATION_PATH) == 14
+    assert coordinator.writes.coalesced_count == 3
+
+
+async def test_burst_back_to_start(
+    hass: HomeAssistant,
+    standin: ClimatixStandIn,
+    coordinator: FlexitDataUpdateCoordinator,
+    entity_id: str,
+) -> None:
+    """Test a burst ending on the value it started from is not written."""
+
+    original = coordinator.data[PLANT_ID].fireplace_duration
+    await set_value(hass, entity_id, original + 5)
+    await set_value(hass, entity_id, original)
+    await settle(hass)
+
+    assert not standin.writes
+    assert coordinator.writes.skipped_count == 1
+    assert float(hass.states.get(entity_id).state) == original
+
+
+async def test_poll_keeps_pending(
+    hass: HomeAssistant,
+    standin: ClimatixStandIn,
+    coordinator: FlexitDataUpdateCoordinator,
+    entity_id: str,
+) -> None:
+    """Test a poll during the debounce delay keeps showing the value to write."""
+
+    await set_value(hass, entity_id, 20)
+    await coordinator.async_refresh()
+
+    assert coordinator.data[PLANT_ID].fireplace_duration == 20
+    assert float(hass.states.get(entity_id).state) == 20
+    assert not standin.writes
+
+    await settle(hass)
+    assert [write["value"] for write in standin.writes] == ["20"]
+
+
+async def test_flush_on_unload(
+    hass: HomeAssistant,
+    standin: ClimatixStandIn,
+    coordinator: FlexitDataUpdateCoordinator,
+    entity_id: str,
+) -> None:
+    """Test values waiting for the debounce delay are written on unload."""
+
+    await set_value(hass, entity_id, 25)
+    assert await hass.config_entries.async_unload(coordinator.config_entry.entry_id)
+
+    assert [write["value"] for write in standin.writes] == ["25"]
+    assert standin.units[PLANT_ID].value(FIREPLACE_DURATION_PATH) == 25
+
+
+async def test_failed_write_refreshes(
+    hass: HomeAssistant,
+    standin: ClimatixStandIn,
+    coordinator: FlexitDataUpdateCoordinator,
+    entity_id: str,
+) -> None:
+    """Test a failed write is replaced by the value the unit has."""
+
+    unit = standin.units[PLANT_ID]
+    unit.rejected_paths.add(FIREPLACE_DURATION_PATH)
+    original = unit.value(FIREPLACE_DURATION_PATH)
+
+    await set_value(hass, entity_id, original + 5)
+    await settle(hass)
+
+    assert len(standin.writes) == 1
+    assert coordinator.data[PLANT_ID].fireplace_duration == original
+    assert float(hass.states.get(entity_id).state) == original